@@ -0,0 +1,41 @@
+from typing import List
+
+from benchmarks.utils import measure_seconds
+from business_logic.caching_task_getter import Cache, CacheUtils, TaskCache
+from business_logic.ttl_cache import LRUTTLCache, MonotonicTTLCache
+
+NUMBER_OF_KEYS = 10_000
+NUMBER_OF_LOOKUPS = 100_000
+
+
+def _look_up(cache: Cache[str, str], keys: List[str]) -> None:
+    for index in range(NUMBER_OF_LOOKUPS):
+        cache.get(keys[index % len(keys)])
+
+
+def _measure_nanoseconds_per_hit(cache: Cache[str, str], keys: List[str]) -> float:
+    for key in keys:
+        cache.add(key, key)
+    return measure_seconds(lambda: _look_up(cache, keys)) / NUMBER_OF_LOOKUPS * 1e9
+
+
+if __name__ == "__main__":
+    keys = [str(index) for index in range(NUMBER_OF_KEYS)]
+    task_cache_nanoseconds = _measure_nanoseconds_per_hit(
+        TaskCache(cache_utils=CacheUtils(), cache_life_time_in_seconds=60), keys
+    )
+    monotonic_nanoseconds = _measure_nanoseconds_per_hit(
+        MonotonicTTLCache(cache_life_time_in_seconds=60), keys
+    )
+    lru_nanoseconds = _measure_nanoseconds_per_hit(
+        LRUTTLCache(
+            cache_life_time_in_seconds=60,
+            max_entries=NUMBER_OF_KEYS,
+            max_size_in_bytes=64 * 1024 * 1024,
+        ),
+        keys,
+    )
+    print(f"Looking up {NUMBER_OF_LOOKUPS} cached values of {NUMBER_OF_KEYS} keys")
+    print(f"TaskCache (parsed date strings) | {task_cache_nanoseconds:10.0f} ns per hit")
+    print(f"MonotonicTTLCache               | {monotonic_nanoseconds:10.0f} ns per hit")
+    print(f"LRUTTLCache                     | {lru_nanoseconds:10.0f} ns per hit")
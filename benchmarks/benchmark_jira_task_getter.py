@@ -0,0 +1,87 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.utils import measure_seconds
+from business_logic.jira_task_getter import JiraTaskGetter
+
+NUMBER_OF_ISSUES = 5000
+MAX_RESULTS_PER_PAGE = 100
+SECONDS_OF_LATENCY_PER_PAGE = 0.05
+CONCURRENCY_LIMITS = [1, 2, 4, 8]
+
+
+def _make_issues() -> List[Dict[str, Any]]:
+    return [
+        {
+            "key": f"AK-{index}",
+            "fields": {
+                "summary": f"Issue {index}",
+                "description": "",
+                "assignee": {"displayName": "Dave"},
+                "created": "2020-05-17T10:20:30.000+0100",
+                "resolutiondate": None,
+                "parent": None,
+                "subtasks": [],
+                "customfield_10016": 3,
+            },
+        }
+        for index in range(NUMBER_OF_ISSUES)
+    ]
+
+
+class _JiraStubRequestHandler(BaseHTTPRequestHandler):
+    """
+    Answers jira search requests with a fixed latency, like a remote jira would
+    """
+
+    protocol_version = "HTTP/1.1"
+    issues = _make_issues()
+
+    def do_GET(self) -> None:
+        query = parse_qs(urlsplit(self.path).query)
+        start_at = int(query["startAt"][0])
+        max_results = min(int(query["maxResults"][0]), MAX_RESULTS_PER_PAGE)
+        time.sleep(SECONDS_OF_LATENCY_PER_PAGE)
+        body = json.dumps(
+            {
+                "startAt": start_at,
+                "maxResults": max_results,
+                "total": len(self.issues),
+                "issues": self.issues[start_at:start_at + max_results],
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JiraStubRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(
+        f"Reading {NUMBER_OF_ISSUES} jira issues in pages of {MAX_RESULTS_PER_PAGE}, "
+        f"with {SECONDS_OF_LATENCY_PER_PAGE * 1000:.0f} ms latency per page"
+    )
+    for max_concurrent_requests in CONCURRENCY_LIMITS:
+        task_getter = JiraTaskGetter(
+            url=f"http://127.0.0.1:{server.server_port}",
+            email="dave@example.com",
+            api_token="token",
+            jql="project = AK",
+            page_size=MAX_RESULTS_PER_PAGE,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        seconds = measure_seconds(task_getter.get_tasks)
+        print(
+            f"{max_concurrent_requests} concurrent requests | "
+            f"{NUMBER_OF_ISSUES / seconds:.0f} issues per second"
+        )
+    server.shutdown()
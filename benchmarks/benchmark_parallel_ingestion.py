@@ -0,0 +1,31 @@
+import functools
+import os
+import tempfile
+from pathlib import Path
+
+from benchmarks.utils import measure_seconds, write_random_dummy_data_files
+from business_logic.dummy_data_task_getter import DummyDataFileTaskGetter
+
+NUMBER_OF_FILES = 200
+MAX_NUMBER_OF_WORKERS = os.cpu_count() or 1
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as path_to_dummy_data:
+        write_random_dummy_data_files(Path(path_to_dummy_data), NUMBER_OF_FILES)
+        print(f"Ingesting {NUMBER_OF_FILES} dummy data files")
+        print("workers | seconds | speed up")
+        single_worker_seconds = None
+        for number_of_workers in range(1, MAX_NUMBER_OF_WORKERS + 1):
+            seconds = measure_seconds(
+                functools.partial(
+                    DummyDataFileTaskGetter,
+                    path_to_dummy_data=path_to_dummy_data,
+                    number_of_ingestion_workers=number_of_workers,
+                )
+            )
+            if single_worker_seconds is None:
+                single_worker_seconds = seconds
+            print(
+                f"{number_of_workers:>7} | {seconds:>7.3f} | "
+                f"{single_worker_seconds / seconds:>7.2f}x"
+            )
@@ -0,0 +1,41 @@
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from benchmarks.utils import measure_seconds, write_random_dummy_data_files
+from business_logic.dummy_data_task_getter import DummyDataFileTaskGetter
+
+NUMBER_OF_FILES = 200
+
+
+def _ingest_all_files(
+        path_to_dummy_data: str, path_to_trusted_fingerprints: Optional[str]
+) -> None:
+    DummyDataFileTaskGetter(
+        path_to_dummy_data=path_to_dummy_data,
+        path_to_trusted_fingerprints=path_to_trusted_fingerprints,
+    )
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        path_to_dummy_data = Path(temporary_directory) / "dummy_data"
+        path_to_dummy_data.mkdir()
+        write_random_dummy_data_files(path_to_dummy_data, NUMBER_OF_FILES)
+        path_to_trusted_fingerprints = str(
+            Path(temporary_directory) / "trusted_fingerprints.txt"
+        )
+        # the first ingestion validates every file and trusts it from then on
+        _ingest_all_files(str(path_to_dummy_data), path_to_trusted_fingerprints)
+        validated_seconds = measure_seconds(
+            lambda: _ingest_all_files(str(path_to_dummy_data), None)
+        )
+        trusted_seconds = measure_seconds(
+            lambda: _ingest_all_files(
+                str(path_to_dummy_data), path_to_trusted_fingerprints
+            )
+        )
+        print(f"Ingesting {NUMBER_OF_FILES} dummy data files")
+        print(f"validated (pydantic) | {validated_seconds:.3f} seconds")
+        print(f"trusted (lean)       | {trusted_seconds:.3f} seconds")
+        print(f"speed up             | {validated_seconds / trusted_seconds:.2f}x")
@@ -0,0 +1,69 @@
+from typing import List
+
+from benchmarks.utils import measure_seconds
+from business_logic.models.date import Date
+from business_logic.models.task import Task
+from business_logic.velocity_trackable_task_getter_proxy import (
+    VelocityTrackableTaskFlattener,
+)
+
+NUMBER_OF_TASKS = 100_000
+
+
+def _make_tasks(number_of_tasks: int) -> List[Task]:
+    # epics with 4 finished sub-tasks each
+    return [
+        Task(
+            id=str(index),
+            name="Epic",
+            description="",
+            story_points=8,
+            assignees=["Dave"],
+            sub_tasks=[
+                Task(
+                    id=f"{index}.{sub_task_index}",
+                    name="Task",
+                    description="",
+                    story_points=2,
+                    assignees=["Dave"],
+                    sub_tasks=[],
+                    date_started=Date(2020, 5, 17),
+                    date_finished=Date(2020, 5, 20),
+                )
+                for sub_task_index in range(4)
+            ],
+            date_started=Date(2020, 5, 17),
+        )
+        for index in range(number_of_tasks // 5)
+    ]
+
+
+def _recursively_flattened_tasks(tasks: List[Task]) -> List[Task]:
+    """
+    The flattening the proxy used before, for comparison
+    """
+    flattened_tasks: List[Task] = []
+    for task in tasks:
+        flattened_tasks = [
+            *flattened_tasks,
+            *_recursively_flattened_tasks(task.sub_tasks),
+            task,
+        ]
+    return flattened_tasks
+
+
+if __name__ == "__main__":
+    tasks = _make_tasks(NUMBER_OF_TASKS)
+    recursive_seconds = measure_seconds(
+        lambda: _recursively_flattened_tasks(tasks), repetitions=1
+    )
+    iterative_seconds = measure_seconds(
+        lambda: VelocityTrackableTaskFlattener().flatten(tasks)
+    )
+    flattener = VelocityTrackableTaskFlattener()
+    flattener.flatten(tasks)
+    unchanged_seconds = measure_seconds(lambda: flattener.flatten(tasks))
+    print(f"Flattening {NUMBER_OF_TASKS} tasks into velocity trackable tasks")
+    print(f"recursive       | {recursive_seconds * 1000:10.1f} ms")
+    print(f"iterative       | {iterative_seconds * 1000:10.1f} ms")
+    print(f"unchanged tasks | {unchanged_seconds * 1000:10.1f} ms")
@@ -0,0 +1,56 @@
+import gc
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Tuple
+
+from benchmarks.utils import write_random_dummy_data_files
+from business_logic.dummy_data_task_getter import DummyDataFileTaskGetter
+from business_logic.velocity_trackable_task_getter_proxy import (
+    VelocityTrackableTaskGetterProxy,
+)
+
+NUMBER_OF_FILES = 100
+
+
+def _measure_memory(
+        path_to_dummy_data: str, intern_identifiers: bool
+) -> Tuple[int, int, int]:
+    """
+    Returns the bytes held by the task getter and the task models built from it,
+    the number of assignee names and the number of distinct assignee string objects
+    """
+    gc.collect()
+    tracemalloc.start()
+    task_getter = DummyDataFileTaskGetter(
+        path_to_dummy_data=path_to_dummy_data, intern_identifiers=intern_identifiers
+    )
+    tasks = task_getter.get_tasks()
+    velocity_trackable_tasks = VelocityTrackableTaskGetterProxy(task_getter).get_tasks()
+    gc.collect()
+    memory_in_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assignees = [
+        assignee for task in velocity_trackable_tasks for assignee in task.assignees
+    ]
+    del tasks
+    return memory_in_bytes, len(assignees), len({id(each) for each in assignees})
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as path_to_dummy_data:
+        write_random_dummy_data_files(Path(path_to_dummy_data), NUMBER_OF_FILES)
+        # the first run also allocates the import time caches of the parsers
+        _measure_memory(path_to_dummy_data, intern_identifiers=True)
+        interned = _measure_memory(path_to_dummy_data, intern_identifiers=True)
+        not_interned = _measure_memory(path_to_dummy_data, intern_identifiers=False)
+        print(f"Task models built from {NUMBER_OF_FILES} dummy data files")
+        print("identifiers  | memory in MiB | assignee names | distinct assignee strings")
+        for title, (memory_in_bytes, number_of_assignees, number_of_strings) in [
+            ("not interned", not_interned),
+            ("interned    ", interned),
+        ]:
+            print(
+                f"{title} | {memory_in_bytes / 2 ** 20:>13.2f} | "
+                f"{number_of_assignees:>14} | {number_of_strings:>25}"
+            )
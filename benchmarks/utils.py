@@ -0,0 +1,30 @@
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Callable
+
+from dummy_data.make_random_tasks import make_random_tasks
+
+
+def write_random_dummy_data_files(path: Path, number_of_files: int) -> None:
+    """
+    Names the files by the md5 of their content, as dummy_data/make_random_tasks.py does
+    """
+    for _ in range(number_of_files):
+        file_content = json.dumps(make_random_tasks(), indent=4, sort_keys=True)
+        file_name = hashlib.md5(file_content.encode("utf-8")).hexdigest()
+        with open(path / f"{file_name}.json", "w") as writer:
+            writer.write(file_content)
+
+
+def measure_seconds(run: Callable[[], object], repetitions: int = 3) -> float:
+    """
+    Returns the fastest of the given number of runs
+    """
+    fastest_run = float("inf")
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        run()
+        fastest_run = min(fastest_run, time.perf_counter() - start)
+    return fastest_run
@@ -1,5 +1,5 @@
 import statistics
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from business_logic.burn_down_forecastable_task_aggregator import (
     BurnDownForecastableTaskAggregator,
@@ -13,8 +13,8 @@ from business_logic.interfaces.date_skipper import (
 from business_logic.developer_velocity_business_logic import (
     DeveloperVelocityBusinessLogic,
 )
-from business_logic.dummy_data_task_getter import DummyDataFileTaskGetter
-from business_logic.interfaces.task_getter import TaskGetter
+from business_logic.incremental_metrics import IncrementalMetrics
+from business_logic.interfaces.async_task_getter import AsyncTaskGetter
 from business_logic.models.burn_down_forecast import BurnDownForecast
 from business_logic.models.burn_down_forecastable_task import BurnDownForecastableTask
 from business_logic.models.date import Date
@@ -29,38 +29,39 @@ class BurnDownBusinessLogic:
     def __init__(
         self,
         developer_velocity_business_logic: DeveloperVelocityBusinessLogic,
-        dummy_data_file_task_getter: DummyDataFileTaskGetter,
-        burn_down_forecastable_task_getter: TaskGetter[BurnDownForecastableTask],
+        open_task_getter: AsyncTaskGetter[Task],
+        burn_down_forecastable_task_getter: AsyncTaskGetter[BurnDownForecastableTask],
+        incremental_metrics: Optional[IncrementalMetrics] = None,
     ):
+        """
+        The incremental_metrics have to follow the projection of
+        the tasks behind the burn_down_forecastable_task_getter
+        """
         self._velocity_bs = developer_velocity_business_logic
-        self._dummy_data_task_getter = dummy_data_file_task_getter
+        self._open_task_getter = open_task_getter
         self._task_getter = burn_down_forecastable_task_getter
         self._burn_down_forecaster = BurnDownForecaster(
             date_skipper=NoDateSkipper(),
             # date_skipper=WeekendSkipper(),
             date_classifier=DateClassifier(today=Date.today()),
         )
-        self._task_aggregator = BurnDownForecastableTaskAggregator(id_maker=UUIDMaker())
+        self._id_maker = UUIDMaker()
+        self._task_aggregator = BurnDownForecastableTaskAggregator(id_maker=self._id_maker)
+        self._incremental_metrics = incremental_metrics
 
-    def get_all_burn_down_forecastable_tasks(self) -> List[Task]:
-        return [
-            task
-            for task in self._dummy_data_task_getter.get_tasks()
-            if task.date_finished is None
-        ]
+    async def get_all_burn_down_forecastable_tasks(self) -> List[Task]:
+        return await self._open_task_getter.get_open_tasks()
 
-    def get_total_task_burn_down_data(self) -> BurnDownForecast:
-        tasks = self._task_getter.get_tasks()
-        aggregated_task = self._task_aggregator.aggregate(tasks)
+    async def get_total_task_burn_down_data(self) -> BurnDownForecast:
         return self._burn_down_forecaster.forcast(
-            task=aggregated_task,
-            developer_velocity_as_story_points_per_day=self._get_average_developer_velocity(),
+            task=await self._aggregate_open_tasks(),
+            developer_velocity_as_story_points_per_day=await self._get_average_developer_velocity(),
         )
 
-    def get_task_burn_down_data(
+    async def get_task_burn_down_data(
         self, task_id: str, developer_velocity_as_story_points_per_day: float
     ) -> Optional[BurnDownForecast]:
-        task = self._task_getter.get_task_by_id(task_id)
+        task = await self._task_getter.get_task_by_id(task_id)
         if task is not None:
             return self._burn_down_forecaster.forcast(
                 task=task,
@@ -68,9 +69,32 @@ class BurnDownBusinessLogic:
             )
         return None
 
-    def _get_average_developer_velocity(self) -> StoryPoints:
+    async def get_tasks_burn_down_data(
+        self, task_ids: List[str], developer_velocity_as_story_points_per_day: float
+    ) -> Dict[str, BurnDownForecast]:
+        """
+        Returns the burn down forecast per task id of the found tasks. All tasks
+        are looked up at once, which is cheaper than a get_task_burn_down_data call per task.
+        """
+        return {
+            task_id: self._burn_down_forecaster.forcast(
+                task=task,
+                developer_velocity_as_story_points_per_day=developer_velocity_as_story_points_per_day,
+            )
+            for task_id, task in (await self._task_getter.get_tasks_by_ids(task_ids)).items()
+        }
+
+    async def _aggregate_open_tasks(self) -> BurnDownForecastableTask:
+        if self._incremental_metrics is not None:
+            await self._incremental_metrics.refresh()
+            return self._incremental_metrics.open_task_aggregator.aggregate(
+                id_maker=self._id_maker
+            )
+        return self._task_aggregator.aggregate(await self._task_getter.get_tasks())
+
+    async def _get_average_developer_velocity(self) -> StoryPoints:
         return self._get_median_developer_velocity(
-            developer_velocity=self._velocity_bs.get_average_developer_velocity(
+            developer_velocity=await self._velocity_bs.get_average_developer_velocity(
                 time_in_weeks=8
             )
         )
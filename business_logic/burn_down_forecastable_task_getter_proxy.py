@@ -1,7 +1,8 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from business_logic.interfaces.task_getter import TaskGetter
 from business_logic.models.burn_down_forecastable_task import BurnDownForecastableTask
+from business_logic.models.date import Date
 from business_logic.models.task import Task
 
 
@@ -16,12 +17,50 @@ class BurnDownForecastableTaskGetterProxy(TaskGetter[BurnDownForecastableTask]):
         return None
 
     def get_tasks(self) -> List[BurnDownForecastableTask]:
+        return self._to_burn_down_forecastable_tasks(self._task_getter.get_open_tasks())
+
+    def get_tasks_finished_since(self, date: Date) -> List[BurnDownForecastableTask]:
+        # only open tasks are burn down forecastable
+        return []
+
+    def get_open_tasks(self) -> List[BurnDownForecastableTask]:
+        return self.get_tasks()
+
+    def get_tasks_of_assignee(self, assignee: str) -> List[BurnDownForecastableTask]:
+        return self._to_burn_down_forecastable_tasks(
+            self._task_getter.get_tasks_of_assignee(assignee)
+        )
+
+    def get_tasks_by_ids(
+        self, task_ids: List[str]
+    ) -> Dict[str, BurnDownForecastableTask]:
+        return self._to_burn_down_forecastable_tasks_per_id(
+            self._task_getter.get_tasks_by_ids(task_ids)
+        )
+
+    def get_data_generation(self) -> Optional[int]:
+        return self._task_getter.get_data_generation()
+
+    @classmethod
+    def _to_burn_down_forecastable_tasks(
+        cls, tasks: List[Task]
+    ) -> List[BurnDownForecastableTask]:
         return [
-            self._to_burn_down_forecastable_task(task)
-            for task in self._task_getter.get_tasks()
+            cls._to_burn_down_forecastable_task(task)
+            for task in tasks
             if task.date_finished is None
         ]
 
+    @classmethod
+    def _to_burn_down_forecastable_tasks_per_id(
+        cls, tasks: Dict[str, Task]
+    ) -> Dict[str, BurnDownForecastableTask]:
+        return {
+            task_id: cls._to_burn_down_forecastable_task(task)
+            for task_id, task in tasks.items()
+            if task.date_finished is None
+        }
+
     @staticmethod
     def _to_burn_down_forecastable_task(task: Task) -> BurnDownForecastableTask:
         return BurnDownForecastableTask(
@@ -29,3 +68,4 @@ class BurnDownForecastableTaskGetterProxy(TaskGetter[BurnDownForecastableTask]):
             story_points=task.story_points,
             date_started=task.date_started,
         )
+
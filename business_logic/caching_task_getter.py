@@ -1,20 +1,38 @@
 import dataclasses
 import datetime
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Generic, TypeVar, Literal
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Dict, Generic, TypeVar, Literal, Tuple
 
 from dateutil.parser import parse
 
 from business_logic.interfaces.task_getter import TaskGetter, T
+from business_logic.models.date import Date
+from business_logic.single_flight import SingleFlight
 
 CacheEntryKey = str
 TaskID = str
 DateWithTime = str
+Query = str
 
 K = TypeVar("K")
 V = TypeVar("V")
 
 
+@dataclasses.dataclass
+class FetchedTasks(Generic[V]):
+    tasks: List[V]
+    fetched_at: float
+    """
+    The time on the clock of the caching task getter, the monotonic clock by default
+    """
+    data_generation: Optional[int] = None
+    """
+    The data generation of the task getter when the tasks were fetched
+    """
+
+
 @dataclasses.dataclass
 class CacheEntryValue(Generic[V]):
     value: V
@@ -35,6 +53,17 @@ class Cache(ABC, Generic[K, V]):
     def add(self, key: K, value: V) -> None:
         ...
 
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    def start_data_generation(self, data_generation: int) -> None:
+        """
+        Called when the task getter tells a new data generation. The values added
+        from now on belong to it, values of older generations must not be served.
+        """
+        self.clear()
+
 
 class CacheUtils(Generic[V]):
 
@@ -56,7 +85,7 @@ class CacheUtils(Generic[V]):
     @staticmethod
     def cache_value_is_expired(value: CacheEntryValue[V]) -> bool:
         now = datetime.datetime.now()
-        return now < parse(value.expiration_date_and_time)
+        return now >= parse(value.expiration_date_and_time)
 
 
 class TaskCache(Cache[TaskID, T]):
@@ -86,6 +115,9 @@ class TaskCache(Cache[TaskID, T]):
         cache_key = self._make_cache_key_for_task_id(key)
         self._cache[cache_key] = cache_entry
 
+    def clear(self) -> None:
+        self._cache = {}
+
     @staticmethod
     def _make_cache_key_for_task_id(task_id: str) -> CacheEntryKey:
         return f"GET_TASK_BY_ID::WITH_TASK_ID::{task_id}"
@@ -114,42 +146,226 @@ class TasksCache(Cache[Literal["GET_TASKS"], List[T]]):
             cache_life_time_in_seconds=self._cache_life_time_in_seconds
         )
 
+    def clear(self) -> None:
+        self._cached_tasks = None
+
 
 class CachingTaskGetter(TaskGetter[T]):
+    """
+    When the task getter tells its data generation, the caches start the new
+    generation as soon as it changes, so changed tasks are never served from the
+    cache. Tasks fetched while the generation changed are not cached. The generation
+    is asked for at most once per min_seconds_between_data_generation_checks, so
+    cache hits do not reach the task getter in between.
+    With a stale_while_revalidate_in_seconds above 0, the last fetched tasks are
+    still served while they are fetched again in the background, until that long
+    after they expired. They expire tasks_cache_life_time_in_seconds after they
+    were fetched, which should be the life time of the tasks cache.
+    Without a query cache, the queries are passed on to the task getter uncached.
+    Concurrent misses of the same tasks are coalesced into a single call of the
+    given task getter, the other callers wait for its result.
+    Stale tasks are revalidated on the given executor, by default on a background thread.
+    """
+
+    _cached_data_generation: Optional[int]
+    _last_fetched_tasks: Optional[FetchedTasks[T]]
+    _next_data_generation_check: Optional[float]
+    _revalidation: Optional["Future[List[T]]"]
 
     def __init__(
             self,
             task_getter: TaskGetter[T],
             task_cache: Cache[TaskID, T],
             tasks_cache: Cache[Literal["GET_TASKS"], List[T]],
+            stale_while_revalidate_in_seconds: float = 0,
+            min_seconds_between_data_generation_checks: float = 0,
+            tasks_cache_life_time_in_seconds: float = 0,
+            clock: Callable[[], float] = time.monotonic,
+            revalidation_executor: Optional[Executor] = None,
+            query_cache: Optional[Cache[Query, List[T]]] = None,
     ):
         self._task_getter = task_getter
         self._tasks_cache = tasks_cache
         self._task_cache = task_cache
+        self._query_cache = query_cache
+        self._cached_data_generation = None
+        self._stale_while_revalidate_in_seconds = stale_while_revalidate_in_seconds
+        self._tasks_cache_life_time_in_seconds = tasks_cache_life_time_in_seconds
+        self._last_fetched_tasks = None
+        self._min_seconds_between_data_generation_checks = (
+            min_seconds_between_data_generation_checks
+        )
+        self._next_data_generation_check = None
+        self._clock = clock
+        self._single_flight = SingleFlight()
+        self._revalidation_executor = (
+            revalidation_executor
+            if revalidation_executor is not None
+            else ThreadPoolExecutor(max_workers=1, thread_name_prefix="tasks-revalidation")
+        )
+        self._revalidation = None
 
     def get_task_by_id(self, task_id: str) -> Optional[T]:
+        self._check_data_generation()
         cached_task = self._get_task_for_id_from_cache(task_id)
         if cached_task is not None:
             return cached_task
-        new_task = self._task_getter.get_task_by_id(task_id)
-        if new_task is None:
-            return None
-        self._add_task_for_id_to_cache(task_id=task_id, task=new_task)
-        return new_task
+        return self._single_flight.do(
+            ("GET_TASK_BY_ID", task_id), lambda: self._get_and_cache_task_by_id(task_id)
+        )
 
     def get_tasks(self) -> List[T]:
+        self._check_data_generation()
         cached_tasks = self._get_tasks_from_cache()
         if cached_tasks is not None:
             return cached_tasks
-        new_tasks = self._task_getter.get_tasks()
-        self._add_tasks_to_cache(tasks=new_tasks)
-        return new_tasks
+        stale_tasks = self._get_stale_tasks()
+        if stale_tasks is not None:
+            self._revalidate_tasks()
+            return stale_tasks
+        return self._single_flight.do("GET_TASKS", self._get_and_cache_tasks)
+
+    def get_tasks_finished_since(self, date: Date) -> List[T]:
+        return self._get_query_result(
+            f"GET_TASKS_FINISHED_SINCE::{date.to_string()}",
+            lambda: self._task_getter.get_tasks_finished_since(date),
+        )
+
+    def get_open_tasks(self) -> List[T]:
+        return self._get_query_result("GET_OPEN_TASKS", self._task_getter.get_open_tasks)
 
-    def _add_tasks_to_cache(self, tasks: List[T]) -> None:
+    def get_tasks_of_assignee(self, assignee: str) -> List[T]:
+        return self._get_query_result(
+            f"GET_TASKS_OF_ASSIGNEE::{assignee}",
+            lambda: self._task_getter.get_tasks_of_assignee(assignee),
+        )
+
+    def get_tasks_by_ids(self, task_ids: List[str]) -> Dict[str, T]:
+        self._check_data_generation()
+        cached_tasks, uncached_task_ids = self._get_cached_tasks_by_ids(task_ids)
+        data_generation = self._cached_data_generation
+        new_tasks = (
+            self._task_getter.get_tasks_by_ids(uncached_task_ids)
+            if len(uncached_task_ids) > 0
+            else {}
+        )
+        if self._cached_data_generation != data_generation:
+            found_tasks = {**cached_tasks, **new_tasks}
+            return {
+                task_id: found_tasks[task_id]
+                for task_id in task_ids
+                if task_id in found_tasks
+            }
+        return self._add_tasks_by_ids_to_cache(task_ids, cached_tasks, new_tasks)
+
+    def get_data_generation(self) -> Optional[int]:
+        """
+        Returns the data generation of the served tasks. While stale tasks
+        are served, their revalidation is started, so the generation
+        catches up with the task getter once the new tasks were fetched.
+        """
+        self._check_data_generation()
+        data_generation = self._get_data_generation_of_served_tasks()
+        if data_generation != self._cached_data_generation:
+            self._revalidate_tasks()
+        return data_generation
+
+    def get_age_of_tasks_in_seconds(self) -> Optional[float]:
+        """
+        Returns how long ago the served tasks were fetched, None if they never were
+        """
+        last_fetched_tasks = self._last_fetched_tasks
+        if last_fetched_tasks is None:
+            return None
+        return self._clock() - last_fetched_tasks.fetched_at
+
+    def _data_generation_check_is_due(self) -> bool:
+        now = self._clock()
+        if (
+            self._next_data_generation_check is not None
+            and now < self._next_data_generation_check
+        ):
+            return False
+        self._next_data_generation_check = (
+            now + self._min_seconds_between_data_generation_checks
+        )
+        return True
+
+    def _start_data_generation_if_changed(self, data_generation: Optional[int]) -> None:
+        if data_generation is None or data_generation == self._cached_data_generation:
+            return
+        # the last fetched tasks are kept, they are served as stale tasks
+        # until the tasks of the new generation were fetched
+        self._tasks_cache.start_data_generation(data_generation)
+        self._task_cache.start_data_generation(data_generation)
+        if self._query_cache is not None:
+            self._query_cache.start_data_generation(data_generation)
+        self._cached_data_generation = data_generation
+
+    def _get_data_generation_of_served_tasks(self) -> Optional[int]:
+        """
+        Returns the data generation of the last fetched tasks while they are served
+        as stale tasks, which lags behind the data generation of the task getter
+        """
+        last_fetched_tasks = self._last_fetched_tasks
+        if (
+            last_fetched_tasks is None
+            or last_fetched_tasks.data_generation == self._cached_data_generation
+            or self._get_tasks_from_cache() is not None
+            or self._get_stale_tasks() is None
+        ):
+            return self._cached_data_generation
+        return last_fetched_tasks.data_generation
+
+    def _get_stale_tasks(self) -> Optional[List[T]]:
+        """
+        Returns the last fetched tasks while the grace period after
+        their expiration lasts, however long nobody asked for them
+        """
+        last_fetched_tasks = self._last_fetched_tasks
+        if last_fetched_tasks is None or self._stale_while_revalidate_in_seconds <= 0:
+            return None
+        expired_at = last_fetched_tasks.fetched_at + self._tasks_cache_life_time_in_seconds
+        if self._clock() - expired_at > self._stale_while_revalidate_in_seconds:
+            return None
+        return last_fetched_tasks.tasks
+
+    def _get_cached_tasks_by_ids(
+            self, task_ids: List[TaskID]
+    ) -> Tuple[Dict[TaskID, T], List[TaskID]]:
+        cached_tasks: Dict[TaskID, T] = {}
+        uncached_task_ids: List[TaskID] = []
+        for task_id in task_ids:
+            cached_task = self._get_task_for_id_from_cache(task_id)
+            if cached_task is not None:
+                cached_tasks[task_id] = cached_task
+            else:
+                uncached_task_ids.append(task_id)
+        return cached_tasks, uncached_task_ids
+
+    def _add_tasks_by_ids_to_cache(
+            self,
+            task_ids: List[TaskID],
+            cached_tasks: Dict[TaskID, T],
+            new_tasks: Dict[TaskID, T],
+    ) -> Dict[TaskID, T]:
+        for task_id, new_task in new_tasks.items():
+            self._add_task_for_id_to_cache(task_id=task_id, task=new_task)
+        found_tasks = {**cached_tasks, **new_tasks}
+        return {
+            task_id: found_tasks[task_id]
+            for task_id in task_ids
+            if task_id in found_tasks
+        }
+
+    def _add_tasks_to_cache(self, tasks: List[T], data_generation: Optional[int]) -> None:
         self._tasks_cache.add(
             key="GET_TASKS",
             value=tasks,
         )
+        self._last_fetched_tasks = FetchedTasks(
+            tasks=tasks, fetched_at=self._clock(), data_generation=data_generation
+        )
 
     def _get_tasks_from_cache(self) -> Optional[List[T]]:
         return self._tasks_cache.get("GET_TASKS")
@@ -162,3 +378,69 @@ class CachingTaskGetter(TaskGetter[T]):
 
     def _get_task_for_id_from_cache(self, task_id: str) -> Optional[T]:
         return self._task_cache.get(key=task_id)
+
+    def _check_data_generation(self) -> None:
+        if self._data_generation_check_is_due():
+            self._start_data_generation_if_changed(self._task_getter.get_data_generation())
+
+    def _get_query_result(self, query: Query, get_result: Callable[[], List[T]]) -> List[T]:
+        self._check_data_generation()
+        query_cache = self._query_cache
+        if query_cache is None:
+            return get_result()
+        cached_result = query_cache.get(query)
+        if cached_result is not None:
+            return cached_result
+        return self._single_flight.do(
+            ("QUERY", query),
+            lambda: self._get_and_cache_query_result(query_cache, query, get_result),
+        )
+
+    def _get_and_cache_query_result(
+            self,
+            query_cache: Cache[Query, List[T]],
+            query: Query,
+            get_result: Callable[[], List[T]],
+    ) -> List[T]:
+        cached_result = query_cache.get(query)
+        if cached_result is not None:
+            return cached_result
+        data_generation = self._cached_data_generation
+        result = get_result()
+        if self._cached_data_generation == data_generation:
+            query_cache.add(query, result)
+        return result
+
+    def _get_and_cache_task_by_id(self, task_id: str) -> Optional[T]:
+        # the flight before may have cached the task right after the lookup of the caller
+        cached_task = self._get_task_for_id_from_cache(task_id)
+        if cached_task is not None:
+            return cached_task
+        data_generation = self._cached_data_generation
+        new_task = self._task_getter.get_task_by_id(task_id)
+        if new_task is None:
+            return None
+        if self._cached_data_generation == data_generation:
+            self._add_task_for_id_to_cache(task_id=task_id, task=new_task)
+        return new_task
+
+    def _revalidate_tasks(self) -> None:
+        revalidation = self._revalidation
+        if revalidation is None or revalidation.done():
+            # a failed revalidation is retried by the next call, until the grace period is over
+            self._revalidation = self._revalidation_executor.submit(
+                self._single_flight.do, "GET_TASKS", self._get_and_cache_tasks
+            )
+
+    def _get_and_cache_tasks(self) -> List[T]:
+        cached_tasks = self._get_tasks_from_cache()
+        if cached_tasks is not None:
+            return cached_tasks
+        data_generation = self._cached_data_generation
+        new_tasks = self._task_getter.get_tasks()
+        # tasks fetched while the data generation changed may be of the older
+        # generation, so they are not cached under the new one
+        if self._cached_data_generation == data_generation:
+            self._add_tasks_to_cache(tasks=new_tasks, data_generation=data_generation)
+        return new_tasks
+
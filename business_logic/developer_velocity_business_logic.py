@@ -1,9 +1,10 @@
 import json
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from business_logic.developer_velocity_tracker import DeveloperVelocityTracker
-from business_logic.interfaces.task_getter import TaskGetter
+from business_logic.incremental_metrics import IncrementalMetrics
+from business_logic.interfaces.async_task_getter import AsyncTaskGetter
 from business_logic.models.date import Date
 from business_logic.models.developer_velocity import DeveloperVelocity
 from business_logic.models.velocity_trackable_task import VelocityTrackableTask
@@ -13,30 +14,54 @@ from server.constants import PATH_TO_STATIC_FILES
 
 
 class DeveloperVelocityBusinessLogic:
-    def __init__(self, task_getter: TaskGetter[VelocityTrackableTask]):
+    def __init__(
+        self,
+        task_getter: AsyncTaskGetter[VelocityTrackableTask],
+        incremental_metrics: Optional[IncrementalMetrics] = None,
+    ):
+        """
+        The incremental_metrics have to follow the projection
+        of the tasks behind the given task getter
+        """
         self._task_getter = task_getter
         self._velocity_tracker = DeveloperVelocityTracker()
+        self._incremental_metrics = incremental_metrics
 
-    def get_developer_velocity(
+    async def get_developer_velocity(
         self, account: Account, time_in_weeks: int
     ) -> DeveloperVelocity:
+        if self._incremental_metrics is not None:
+            await self._incremental_metrics.refresh()
+            return self._incremental_metrics.velocity_tracker.track_developer_velocity(
+                tracked_developer=account.name,
+                start_date=self._get_tracking_start_date(time_in_weeks),
+            )
         return self._velocity_tracker.track_developer_velocity(
-            tasks=self._get_tasks(time_in_weeks=time_in_weeks),
+            tasks=await self._get_tasks(time_in_weeks=time_in_weeks),
             tracked_developer=account.name,
         )
 
-    def get_average_developer_velocity(self, time_in_weeks: int) -> DeveloperVelocity:
+    async def get_average_developer_velocity(
+        self, time_in_weeks: int
+    ) -> DeveloperVelocity:
+        if self._incremental_metrics is not None:
+            await self._incremental_metrics.refresh()
+            return self._incremental_metrics.velocity_tracker.track_average_developer_velocity(
+                start_date=self._get_tracking_start_date(time_in_weeks)
+            )
         return self._velocity_tracker.track_average_developer_velocity(
-            tasks=self._get_tasks(time_in_weeks=time_in_weeks)
+            tasks=await self._get_tasks(time_in_weeks=time_in_weeks)
         )
 
-    def _get_tasks(self, time_in_weeks: int) -> List[VelocityTrackableTask]:
-        tracking_start_date = Date.today().go_back_weeks(weeks=time_in_weeks)
-        return self._filter_tasks_before_given_start_date(
-            tasks=self._task_getter.get_tasks(),
-            start_date=tracking_start_date,
+    async def _get_tasks(self, time_in_weeks: int) -> List[VelocityTrackableTask]:
+        return await self._task_getter.get_tasks_finished_since(
+            self._get_tracking_start_date(time_in_weeks)
         )
 
+    @staticmethod
+    def _get_tracking_start_date(time_in_weeks: int) -> Date:
+        return Date.today().go_back_weeks(weeks=time_in_weeks)
+
     def get_file_path_for_data(self, data: object, account_id: str) -> str:
         formatted_data = self._pretty_format_json(data)
         file_name = self._make_velocity_data_file_name_for_developer(
@@ -46,12 +71,6 @@ class DeveloperVelocityBusinessLogic:
             self._write_velocity_data_to_file(file_name, formatted_data)
         return file_name
 
-    @staticmethod
-    def _filter_tasks_before_given_start_date(
-        tasks: List[VelocityTrackableTask], start_date: Date
-    ) -> List[VelocityTrackableTask]:
-        return [task for task in tasks if task.date_finished >= start_date]
-
     @staticmethod
     def filter_velocity_before_given_start_date(
         velocity: DeveloperVelocity, start_date: Date
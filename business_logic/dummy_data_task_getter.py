@@ -1,114 +1,376 @@
-import dataclasses
-import glob
-import json
+import datetime
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Set
+from typing import Any, List, Optional, Dict, Iterator, Set, Tuple
 
 from business_logic.errors import DummyDataNotFoundError
-from business_logic.interfaces.task_getter import TaskGetter
+from business_logic.filtering_task_getter import FilteringTaskGetter
+from business_logic.interfaces.task_change_listener import TaskChangeListener
 from business_logic.models.date import Date
 from business_logic.models.task import Task
-from business_logic.serializer.dummy_data_file_de_serializer import (
-    DeserializedDummyTasksFile,
-)
+from business_logic.normalized_task_store import NormalizedTask, NormalizedTaskStore
+from business_logic.serializer.streaming_json_reader import StreamingJSONArrayReader
 from business_logic.serializer.task import DeserializedTask
+from business_logic.task_change_publisher import TaskChangePublisher
+from business_logic.task_store_snapshot import (
+    DirectorySnapshot,
+    FileFingerprint,
+    TaskStoreSnapshotFile,
+)
+from business_logic.trusted_fingerprints import TrustedFingerprints
 
 TaskID = str
 FileName = str
-DeveloperID = str
-StoryPoints = float
 
 
-@dataclasses.dataclass
-class NormalizedTask:
+class DummyDataFileTaskGetter(FilteringTaskGetter):
     """
-    This is an internal model of the DummyDataFileTaskGetter
+    Materialized tasks are shared between calls and must not be mutated.
+    They are only rebuilt when they, or one of their sub-tasks, changed.
+    Calls are serialized, so the task getter can be used from several threads.
+    Changes are applied once all changed files were read, so a file that can
+    not be read leaves the tasks as they were. The snapshot is written on a
+    background thread, changes arriving while it waits are written at once.
     """
 
-    id: TaskID
-    name: str
-    description: str
-    story_points: StoryPoints
-    assignees: List[DeveloperID]
-    sub_task_ids: List[TaskID]
-    date_started: Date
-    date_finished: Optional[Date] = None
-
-
-class DummyDataFileTaskGetter(TaskGetter[Task]):
-    _files_read: Set[FileName]
-    _normalized_parsed_tasks: Dict[TaskID, NormalizedTask]
+    _directory_snapshot: DirectorySnapshot
+    _materialized_tasks: Dict[TaskID, Task]
+    _pending_snapshot: Optional[
+        Tuple[DirectorySnapshot, Dict[FileName, List[NormalizedTask]]]
+    ]
 
     def __init__(
             self,
             path_to_dummy_data: str,
+            min_seconds_between_directory_scans: float = 0,
+            number_of_ingestion_workers: int = 1,
+            path_to_snapshot: Optional[str] = None,
+            path_to_trusted_fingerprints: Optional[str] = None,
+            intern_identifiers: bool = True,
     ):
         self._path_to_dummy_data = path_to_dummy_data
-        self._files_read = set()
-        self._normalized_parsed_tasks = {}
+        self._min_seconds_between_directory_scans = min_seconds_between_directory_scans
+        self._number_of_ingestion_workers = number_of_ingestion_workers
+        # started with the first ingestion of several files and reused by the later ones
+        self._ingestion_workers: Optional[ProcessPoolExecutor] = None
+        self._intern_identifiers_of_tasks = intern_identifiers
+        self._last_directory_scan: Optional[float] = None
+        self._directory_snapshot = {}
+        self._normalized_task_store = NormalizedTaskStore()
+        self._materialized_tasks = {}
+        self._data_generation = 0
+        self._task_change_publisher = TaskChangePublisher()
+        self._lock = threading.RLock()
+        self._snapshot_file = (
+            TaskStoreSnapshotFile(path_to_snapshot)
+            if path_to_snapshot is not None
+            else None
+        )
+        self._trusted_fingerprints = (
+            TrustedFingerprints(path_to_trusted_fingerprints)
+            if path_to_trusted_fingerprints is not None
+            else None
+        )
+        self._pending_snapshot = None
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="task-store-snapshot"
+        )
+        self._last_snapshot_save: Optional["Future[None]"] = None
+        self._load_snapshot()
         self._update_parsed_data()
 
     def get_task_by_id(self, task_id: str) -> Optional[Task]:
-        self._update_parsed_data()
-        normalized_task = self._normalized_parsed_tasks.get(task_id)
-        return self._to_task(normalized_task) if normalized_task is not None else None
+        with self._lock:
+            self._update_parsed_data()
+            normalized_task = self._normalized_task_store.get_task(task_id)
+            return self._to_task(normalized_task) if normalized_task is not None else None
 
     def get_tasks(self) -> List[Task]:
-        self._update_parsed_data()
-        sub_task_ids: Set[TaskID] = set()
-        for task in self._normalized_parsed_tasks.values():
-            for task_id in task.sub_task_ids:
-                sub_task_ids.add(task_id)
-        return [
-            self._to_task(task)
-            for task in self._normalized_parsed_tasks.values()
-            if task.id not in sub_task_ids
-        ]
+        with self._lock:
+            self._update_parsed_data()
+            return [
+                self._to_task(task)
+                for task in self._normalized_task_store.get_root_tasks()
+            ]
+
+    def get_tasks_by_ids(self, task_ids: List[str]) -> Dict[str, Task]:
+        with self._lock:
+            # a single data refresh for all the given ids
+            self._update_parsed_data()
+            return {task.id: task for task in self._get_tasks_for_ids(task_ids=task_ids)}
+
+    def get_data_generation(self) -> int:
+        with self._lock:
+            self._update_parsed_data()
+            return self._data_generation
+
+    def subscribe_to_task_changes(self, listener: TaskChangeListener) -> bool:
+        with self._lock:
+            self._task_change_publisher.subscribe(
+                listener, current_tasks=self._normalized_task_store.get_tasks()
+            )
+            return True
+
+    def wait_until_snapshot_is_saved(self) -> None:
+        with self._snapshot_lock:
+            last_snapshot_save = self._last_snapshot_save
+        if last_snapshot_save is not None:
+            last_snapshot_save.result()
 
     def _update_parsed_data(self) -> None:
-        all_file_names = self._get_all_dummy_data_file_names()
-        all_deserialized_dummy_data_files = self._read_all_dummy_data(
-            file_names=all_file_names
+        if not self._directory_scan_is_due():
+            return
+        directory_snapshot = self._make_directory_snapshot()
+        if directory_snapshot == self._directory_snapshot:
+            return
+        changed_file_names = [
+            file_name
+            for file_name, fingerprint in directory_snapshot.items()
+            if self._directory_snapshot.get(file_name) != fingerprint
+        ]
+        # the files are read before the store is changed, so a failed read changes nothing
+        normalized_tasks_of_changed_files = list(
+            self._read_normalized_tasks_of_files(changed_file_names)
+        )
+        for file_name in self._directory_snapshot.keys() - directory_snapshot.keys():
+            self._normalized_task_store.retract_tasks_of_file(file_name)
+        for file_name, normalized_tasks in zip(
+            changed_file_names, normalized_tasks_of_changed_files
+        ):
+            self._add_normalized_tasks_of_file(file_name, normalized_tasks)
+            if self._trusted_fingerprints is not None:
+                self._trusted_fingerprints.trust(file_name)
+        self._directory_snapshot = directory_snapshot
+        previous_tasks_of_changed_tasks = (
+            self._normalized_task_store.pop_previous_tasks_of_changed_tasks()
+        )
+        self._invalidate_materialized_tasks(
+            changed_task_ids=set(previous_tasks_of_changed_tasks)
         )
-        for deserialized_dummy_data_file in all_deserialized_dummy_data_files:
-            for deserialized_task in deserialized_dummy_data_file.tasks:
-                self._add_deserialized_task(deserialized_task)
+        self._task_change_publisher.publish(
+            previous_tasks_of_changed_tasks, get_task=self._normalized_task_store.get_task
+        )
+        self._update_data_generation()
+        self._save_snapshot_in_background()
+
+    def _load_snapshot(self) -> None:
+        if self._snapshot_file is None:
+            return
+        for file_name, (fingerprint, normalized_tasks) in self._snapshot_file.load().items():
+            self._add_normalized_tasks_of_file(file_name, normalized_tasks)
+            self._directory_snapshot[file_name] = fingerprint
+        self._update_data_generation()
+        self._normalized_task_store.pop_changed_task_ids()
+
+    def _save_snapshot_in_background(self) -> None:
+        if self._snapshot_file is None:
+            return
+        # the normalized tasks are never mutated once stored, copying the dicts is enough
+        snapshot = (
+            dict(self._directory_snapshot),
+            dict(self._normalized_task_store.get_tasks_per_file()),
+        )
+        with self._snapshot_lock:
+            save_is_scheduled = self._pending_snapshot is not None
+            self._pending_snapshot = snapshot
+            if not save_is_scheduled:
+                self._last_snapshot_save = self._snapshot_writer.submit(
+                    self._save_pending_snapshot
+                )
+
+    def _save_pending_snapshot(self) -> None:
+        with self._snapshot_lock:
+            snapshot, self._pending_snapshot = self._pending_snapshot, None
+        if snapshot is None or self._snapshot_file is None:
+            return
+        directory_snapshot, tasks_per_file = snapshot
+        self._snapshot_file.save(
+            directory_snapshot=directory_snapshot, tasks_per_file=tasks_per_file
+        )
+
+    def _add_normalized_tasks_of_file(
+            self, file_name: FileName, normalized_tasks: List[NormalizedTask]
+    ) -> None:
+        if self._intern_identifiers_of_tasks:
+            self._intern_identifiers(normalized_tasks)
+        self._normalized_task_store.add_tasks_of_file(file_name, normalized_tasks)
+
+    @staticmethod
+    def _intern_identifiers(normalized_tasks: List[NormalizedTask]) -> None:
+        """
+        Every file, worker process and snapshot decodes its own copy of the same
+        task ids and developer names. Interning them keeps a single string per
+        identifier, which is shared by every task model built from the normalized tasks.
+        """
+        for task in normalized_tasks:
+            task.id = sys.intern(task.id)
+            task.assignees = [sys.intern(assignee) for assignee in task.assignees]
+            task.sub_task_ids = [sys.intern(task_id) for task_id in task.sub_task_ids]
 
-    def _add_deserialized_task(self, deserialized_task: DeserializedTask) -> None:
+    def _update_data_generation(self) -> None:
+        # the generation only follows the modification times, so every process
+        # reading the same files tells the same generation, however it started
+        modification_times_in_ns = [
+            fingerprint.modification_time_in_ns
+            for fingerprint in self._directory_snapshot.values()
+        ]
+        try:
+            # deleting a file only changes the modification time of the directory
+            modification_times_in_ns.append(os.stat(self._path_to_dummy_data).st_mtime_ns)
+        except FileNotFoundError:
+            pass
+        self._data_generation = max(modification_times_in_ns, default=0)
+
+    def _invalidate_materialized_tasks(self, changed_task_ids: Set[TaskID]) -> None:
+        # parents hold their sub-tasks, so every ancestor of a changed task is outdated as well
+        for task_id in self._normalized_task_store.get_ancestor_task_ids(changed_task_ids):
+            self._materialized_tasks.pop(task_id, None)
+
+    def _directory_scan_is_due(self) -> bool:
+        now = time.monotonic()
+        if (
+            self._last_directory_scan is not None
+            and now - self._last_directory_scan < self._min_seconds_between_directory_scans
+        ):
+            return False
+        self._last_directory_scan = now
+        return True
+
+    def _make_directory_snapshot(self) -> DirectorySnapshot:
+        directory_snapshot: DirectorySnapshot = {}
+        try:
+            with os.scandir(self._path_to_dummy_data) as entries:
+                for entry in entries:
+                    if self._is_dummy_data_file(entry):
+                        stat = entry.stat()
+                        directory_snapshot[entry.path] = FileFingerprint(
+                            modification_time_in_ns=stat.st_mtime_ns,
+                            size_in_bytes=stat.st_size,
+                            inode=stat.st_ino,
+                        )
+        except FileNotFoundError:
+            pass
+        return directory_snapshot
+
+    @staticmethod
+    def _is_dummy_data_file(entry: "os.DirEntry[str]") -> bool:
+        return (
+            entry.name.endswith(".json")
+            and not entry.name.startswith(".")
+            and entry.is_file()
+        )
+
+    def _read_normalized_tasks_of_files(
+            self, file_names: List[FileName]
+    ) -> Iterator[List[NormalizedTask]]:
+        files_are_trusted = [self._file_is_trusted(file_name) for file_name in file_names]
+        if min(self._number_of_ingestion_workers, len(file_names)) <= 1:
+            yield from map(read_normalized_tasks_of_file, file_names, files_are_trusted)
+            return
+        if self._ingestion_workers is None:
+            self._ingestion_workers = ProcessPoolExecutor(
+                max_workers=self._number_of_ingestion_workers
+            )
+        yield from self._ingestion_workers.map(
+            read_normalized_tasks_of_file, file_names, files_are_trusted
+        )
+
+    def _file_is_trusted(self, file_name: FileName) -> bool:
+        return (
+            self._trusted_fingerprints is not None
+            and self._trusted_fingerprints.is_trusted(file_name)
+        )
+
+    @classmethod
+    def _read_normalized_tasks(
+            cls, file: Path, file_is_trusted: bool = False
+    ) -> List[NormalizedTask]:
+        normalized_tasks: List[NormalizedTask] = []
+        if file_is_trusted:
+            try:
+                for task in cls._read_dummy_data(file):
+                    cls._add_trusted_task(task, normalized_tasks)
+                return normalized_tasks
+            except (KeyError, TypeError, ValueError):
+                # the file does not look like it did when it was validated
+                normalized_tasks = []
+        for task in cls._read_dummy_data(file):
+            cls._add_deserialized_task(DeserializedTask(**task), normalized_tasks)
+        return normalized_tasks
+
+    @classmethod
+    def _add_trusted_task(
+            cls, task: Dict[str, Any], normalized_tasks: List[NormalizedTask]
+    ) -> None:
+        """
+        Normalizes a task straight from the decoded json, skipping the
+        validation of the DeserializedTask model
+        """
+        sub_tasks = task["sub_tasks"]
+        for each in sub_tasks:
+            cls._add_trusted_task(task=each, normalized_tasks=normalized_tasks)
+        date_finished = task.get("date_finished")
+        normalized_tasks.append(
+            NormalizedTask(
+                id=task["id"],
+                name=task["title"],
+                description=task["description"],
+                story_points=float(task["story_points"]),
+                assignees=list(task["assignees"]),
+                sub_task_ids=[sub_task["id"] for sub_task in sub_tasks],
+                date_started=cls._parse_trusted_date(task["date_started"]),
+                date_finished=(
+                    cls._parse_trusted_date(date_finished)
+                    if date_finished is not None
+                    else None
+                ),
+            )
+        )
+
+    @staticmethod
+    def _parse_trusted_date(date_as_string: str) -> Date:
+        try:
+            return Date.from_datetime_date(datetime.date.fromisoformat(date_as_string))
+        except ValueError:
+            return Date.from_string(date_as_string)
+
+    @classmethod
+    def _add_deserialized_task(
+            cls,
+            deserialized_task: DeserializedTask,
+            normalized_tasks: List[NormalizedTask],
+    ) -> None:
         for each in deserialized_task.sub_tasks:
-            self._add_deserialized_task(deserialized_task=each)
-        parsed_task = self._to_normalized_task(deserialized_task)
-        self._normalized_parsed_tasks[parsed_task.id] = parsed_task
+            cls._add_deserialized_task(
+                deserialized_task=each, normalized_tasks=normalized_tasks
+            )
+        normalized_tasks.append(cls._to_normalized_task(deserialized_task))
 
     def _get_tasks_for_ids(self, task_ids: List[TaskID]) -> List[Task]:
         result: List[Task] = []
         for task_id in task_ids:
-            normalized_task = self._normalized_parsed_tasks.get(task_id)
+            normalized_task = self._normalized_task_store.get_task(task_id)
             if normalized_task is not None:
-                self._to_task(normalized_task)
-        return result
-
-    def _read_all_dummy_data(
-            self, file_names: List[str]
-    ) -> List[DeserializedDummyTasksFile]:
-        result: List[DeserializedDummyTasksFile] = []
-        for file_name in file_names:
-            if file_name not in self._files_read:
-                result.append(self._read_dummy_data(Path(file_name)))
-                self._files_read.add(file_name)
+                result.append(self._to_task(normalized_task))
         return result
 
     @staticmethod
-    def _read_dummy_data(file: Path) -> DeserializedDummyTasksFile:
+    def _read_dummy_data(file: Path) -> Iterator[Dict[str, Any]]:
+        """
+        Streams the top level tasks of the given file one by one,
+        so the whole file is never held in memory at once.
+        """
         if file.exists() and file.is_file():
             with open(file, "r") as reader:
-                file_content = reader.read()
-                return DeserializedDummyTasksFile(**json.loads(file_content))
+                yield from StreamingJSONArrayReader(key="tasks").read_items(reader)
+            return
         raise DummyDataNotFoundError()
 
-    def _get_all_dummy_data_file_names(self) -> List[str]:
-        return glob.glob(self._path_to_dummy_data + "/*.json")
-
     @staticmethod
     def _to_normalized_task(deserialized_task: DeserializedTask) -> NormalizedTask:
         return NormalizedTask(
@@ -127,13 +389,29 @@ class DummyDataFileTaskGetter(TaskGetter[Task]):
         )
 
     def _to_task(self, normalized_task: NormalizedTask) -> Task:
-        return Task(
-            id=normalized_task.id,
-            name=normalized_task.name,
-            description=normalized_task.description,
-            story_points=normalized_task.story_points,
-            assignees=normalized_task.assignees,
-            sub_tasks=self._get_tasks_for_ids(task_ids=normalized_task.sub_task_ids),
-            date_started=normalized_task.date_started,
-            date_finished=normalized_task.date_finished,
-        )
+        task = self._materialized_tasks.get(normalized_task.id)
+        if task is None:
+            task = Task(
+                id=normalized_task.id,
+                name=normalized_task.name,
+                description=normalized_task.description,
+                story_points=normalized_task.story_points,
+                assignees=normalized_task.assignees,
+                sub_tasks=self._get_tasks_for_ids(task_ids=normalized_task.sub_task_ids),
+                date_started=normalized_task.date_started,
+                date_finished=normalized_task.date_finished,
+            )
+            self._materialized_tasks[normalized_task.id] = task
+        return task
+
+
+def read_normalized_tasks_of_file(
+        file_name: FileName, file_is_trusted: bool = False
+) -> List[NormalizedTask]:
+    """
+    This is a module level function, so it can be sent to the worker
+    processes of the parallel ingestion and used by other importers
+    """
+    return DummyDataFileTaskGetter._read_normalized_tasks(
+        Path(file_name), file_is_trusted=file_is_trusted
+    )
@@ -1,4 +1,5 @@
 from http.client import HTTPException
+from typing import Optional
 
 from business_logic.serializer.misc import Account
 
@@ -30,3 +31,16 @@ class InvalidCredentialsError(ValueError, ServerError):
 class DummyDataNotFoundError(FileNotFoundError, ServerError):
     def __init__(self) -> None:
         super().__init__("Velocity Dummy Data is not created.")
+
+
+class TaskSourceRequestError(ConnectionError, ServerError):
+    def __init__(self, url: str, status: int):
+        super().__init__(f'The task source responded with status {status} to "{url}".')
+
+
+class TaskSyncCursorNotAdvancedError(RuntimeError, ServerError):
+    def __init__(self, source_name: str, cursor: Optional[str]):
+        super().__init__(
+            f'The task source "{source_name}" has more changes, '
+            f'but did not advance its cursor "{cursor}".'
+        )
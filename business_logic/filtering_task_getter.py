@@ -0,0 +1,44 @@
+from abc import ABC
+from typing import Dict, List
+
+from business_logic.interfaces.task_getter import TaskGetter
+from business_logic.models.date import Date
+from business_logic.models.task import Task
+
+
+class FilteringTaskGetter(TaskGetter[Task], ABC):
+    """
+    Answers the queries by filtering the result of get_tasks.
+    Task getters that can answer them without loading every task should override them.
+    """
+
+    def get_tasks_finished_since(self, date: Date) -> List[Task]:
+        return [
+            task
+            for task in self._walk_tasks(self.get_tasks())
+            if task.date_finished is not None and task.date_finished >= date
+        ]
+
+    def get_open_tasks(self) -> List[Task]:
+        return [task for task in self.get_tasks() if task.date_finished is None]
+
+    def get_tasks_of_assignee(self, assignee: str) -> List[Task]:
+        return [
+            task
+            for task in self._walk_tasks(self.get_tasks())
+            if assignee in task.assignees
+        ]
+
+    @staticmethod
+    def _walk_tasks(tasks: List[Task]) -> List[Task]:
+        """
+        Returns the given tasks and all their sub-tasks, parents before their sub-tasks
+        """
+        walked_tasks: Dict[int, Task] = {}
+        unvisited_tasks = list(reversed(tasks))
+        while len(unvisited_tasks) > 0:
+            task = unvisited_tasks.pop()
+            if id(task) not in walked_tasks:
+                walked_tasks[id(task)] = task
+                unvisited_tasks.extend(reversed(task.sub_tasks))
+        return list(walked_tasks.values())
@@ -0,0 +1,105 @@
+import dataclasses
+import http.client
+import queue
+import threading
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+HTTPConnection = Union[http.client.HTTPConnection, http.client.HTTPSConnection]
+
+
+@dataclasses.dataclass
+class HTTPResponse:
+    status: int
+    headers: Dict[str, str]
+    """
+    The header names are lower case
+    """
+    body: bytes
+
+
+class HTTPConnectionPool:
+    """
+    Keeps up to max_connections keep-alive connections to the host of the given url
+    open, so consecutive requests skip the TCP (and TLS) handshake. Requests can be
+    sent from several threads, at most max_connections of them run at the same time.
+    """
+
+    def __init__(self, url: str, max_connections: int = 4, timeout_in_seconds: float = 30):
+        split_url = urlsplit(url)
+        if split_url.scheme not in ("http", "https") or split_url.hostname is None:
+            raise ValueError(f'Expected an http or https url, got: "{url}".')
+        self._scheme = split_url.scheme
+        self._host = split_url.hostname
+        self._port = split_url.port
+        self._base_path = split_url.path.rstrip("/")
+        self._timeout_in_seconds = timeout_in_seconds
+        self._idle_connections: "queue.LifoQueue[HTTPConnection]" = queue.LifoQueue()
+        self._available_connections = threading.BoundedSemaphore(max_connections)
+
+    def request(
+            self,
+            method: str,
+            path: str,
+            headers: Optional[Dict[str, str]] = None,
+    ) -> HTTPResponse:
+        with self._available_connections:
+            connection, is_reused = self._get_connection()
+            is_kept_open = False
+            try:
+                try:
+                    response = self._send(connection, method, path, headers)
+                except (http.client.HTTPException, ConnectionError):
+                    if not is_reused:
+                        raise
+                    # the server may have closed the idle keep-alive connection,
+                    # retry once on a new one
+                    connection.close()
+                    connection = self._make_connection()
+                    response = self._send(connection, method, path, headers)
+                if response.headers.get("connection", "").lower() != "close":
+                    self._idle_connections.put(connection)
+                    is_kept_open = True
+                return response
+            finally:
+                if not is_kept_open:
+                    connection.close()
+
+    def close(self) -> None:
+        while not self._idle_connections.empty():
+            self._idle_connections.get_nowait().close()
+
+    def _get_connection(self) -> Tuple[HTTPConnection, bool]:
+        """
+        Returns an idle connection, or a new one if none is idle, and whether it is reused
+        """
+        try:
+            return self._idle_connections.get_nowait(), True
+        except queue.Empty:
+            return self._make_connection(), False
+
+    def _make_connection(self) -> HTTPConnection:
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(
+                self._host, self._port, timeout=self._timeout_in_seconds
+            )
+        return http.client.HTTPConnection(
+            self._host, self._port, timeout=self._timeout_in_seconds
+        )
+
+    def _send(
+            self,
+            connection: HTTPConnection,
+            method: str,
+            path: str,
+            headers: Optional[Dict[str, str]],
+    ) -> HTTPResponse:
+        connection.request(method, self._base_path + path, headers=headers or {})
+        response = connection.getresponse()
+        # the body has to be read completely before the connection can be reused
+        body = response.read()
+        return HTTPResponse(
+            status=response.status,
+            headers={name.lower(): value for name, value in response.getheaders()},
+            body=body,
+        )
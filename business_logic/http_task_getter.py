@@ -0,0 +1,139 @@
+import gzip
+import json
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from business_logic.errors import TaskSourceRequestError
+from business_logic.filtering_task_getter import FilteringTaskGetter
+from business_logic.http_connection_pool import HTTPConnectionPool
+from business_logic.models.date import Date
+from business_logic.models.task import Task
+from business_logic.serializer.task import DeserializedTask
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPTaskGetter(FilteringTaskGetter):
+    """
+    Reads the tasks from a user provided endpoint, which responds with the
+    format of the dummy data files. The last response is revalidated with
+    If-None-Match and If-Modified-Since at most once per
+    min_seconds_between_revalidations, so unchanged data costs a small
+    304 response instead of a download and a parse. The data generation
+    only changes with the ETag of the response. A failed revalidation is logged
+    and the last fetched tasks are served until the next revalidation is due.
+    """
+
+    _tasks: List[Task]
+    _tasks_per_id: Dict[str, Task]
+
+    def __init__(
+            self,
+            url: str,
+            min_seconds_between_revalidations: float = 0,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        split_url = urlsplit(url)
+        self._url = url
+        self._path = urlunsplit(("", "", split_url.path or "/", split_url.query, ""))
+        self._connection_pool = HTTPConnectionPool(
+            urlunsplit((split_url.scheme, split_url.netloc, "", "", "")),
+            max_connections=1,
+        )
+        self._min_seconds_between_revalidations = min_seconds_between_revalidations
+        self._clock = clock
+        self._next_revalidation: Optional[float] = None
+        self._tasks = []
+        self._tasks_per_id = {}
+        self._tasks_were_fetched = False
+        self._entity_tag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._data_generation = 0
+        self._lock = threading.Lock()
+
+    def get_task_by_id(self, task_id: str) -> Optional[Task]:
+        with self._lock:
+            self._update_tasks_if_due()
+            return self._tasks_per_id.get(task_id)
+
+    def get_tasks(self) -> List[Task]:
+        with self._lock:
+            self._update_tasks_if_due()
+            return self._tasks
+
+    def get_tasks_by_ids(self, task_ids: List[str]) -> Dict[str, Task]:
+        with self._lock:
+            self._update_tasks_if_due()
+            return {
+                task_id: self._tasks_per_id[task_id]
+                for task_id in task_ids
+                if task_id in self._tasks_per_id
+            }
+
+    def get_data_generation(self) -> int:
+        with self._lock:
+            self._update_tasks_if_due()
+            return self._data_generation
+
+    def _update_tasks_if_due(self) -> None:
+        now = self._clock()
+        if self._next_revalidation is not None and now < self._next_revalidation:
+            return
+        try:
+            self._update_tasks()
+        except Exception:
+            if not self._tasks_were_fetched:
+                # there are no tasks to serve instead
+                raise
+            logger.exception(
+                "Revalidating %s failed, the last fetched tasks are served", self._url
+            )
+        self._next_revalidation = now + self._min_seconds_between_revalidations
+
+    def _update_tasks(self) -> None:
+        headers = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+        if self._entity_tag is not None:
+            headers["If-None-Match"] = self._entity_tag
+        if self._last_modified is not None:
+            headers["If-Modified-Since"] = self._last_modified
+        response = self._connection_pool.request("GET", self._path, headers=headers)
+        if response.status == 304:
+            return
+        if response.status != 200:
+            raise TaskSourceRequestError(url=self._url, status=response.status)
+        body = response.body
+        if response.headers.get("content-encoding") == "gzip":
+            body = gzip.decompress(body)
+        self._tasks = [
+            self._to_task(DeserializedTask(**task))
+            for task in json.loads(body)["tasks"]
+        ]
+        self._tasks_per_id = {task.id: task for task in self._walk_tasks(self._tasks)}
+        self._tasks_were_fetched = True
+        entity_tag = response.headers.get("etag")
+        # without an ETag every downloaded response may hold changed tasks
+        if entity_tag is None or entity_tag != self._entity_tag:
+            self._data_generation += 1
+        self._entity_tag = entity_tag
+        self._last_modified = response.headers.get("last-modified")
+
+    @classmethod
+    def _to_task(cls, deserialized_task: DeserializedTask) -> Task:
+        return Task(
+            id=deserialized_task.id,
+            name=deserialized_task.title,
+            description=deserialized_task.description,
+            story_points=deserialized_task.story_points,
+            assignees=deserialized_task.assignees,
+            sub_tasks=[cls._to_task(task) for task in deserialized_task.sub_tasks],
+            date_started=Date.from_string(deserialized_task.date_started),
+            date_finished=(
+                Date.from_string(deserialized_task.date_finished)
+                if deserialized_task.date_finished is not None
+                else None
+            ),
+        )
+
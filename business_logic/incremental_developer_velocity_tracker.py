@@ -0,0 +1,143 @@
+import threading
+from typing import Dict, List, Set
+
+from business_logic.developer_velocity_tracker import DeveloperVelocityTracker
+from business_logic.interfaces.task_change_listener import TaskChangeListener
+from business_logic.models.date import Date
+from business_logic.models.developer_velocity import DeveloperVelocity
+from business_logic.models.task_change_event import TaskChangeEvent
+from business_logic.models.velocity_trackable_task import VelocityTrackableTask
+from business_logic.normalized_task_store import NormalizedTask
+
+TaskID = str
+DeveloperID = str
+DayOrdinal = int
+
+
+class IncrementalDeveloperVelocityTracker(TaskChangeListener):
+    """
+    Keeps the finished tasks grouped by the day they were finished and
+    recalculates only the velocity of the days with changed tasks. Tracking the
+    velocity since a date adds up the velocities of the days finished since then,
+    instead of going over every finished task again.
+    """
+
+    _tasks_per_day_finished: Dict[DayOrdinal, Dict[TaskID, VelocityTrackableTask]]
+    _team_velocity_per_day_finished: Dict[DayOrdinal, DeveloperVelocity]
+    _developer_velocity_per_day_finished: Dict[DayOrdinal, Dict[DeveloperID, DeveloperVelocity]]
+    _developers_per_day_finished: Dict[DayOrdinal, Set[DeveloperID]]
+
+    def __init__(self) -> None:
+        self._velocity_tracker = DeveloperVelocityTracker()
+        self._tasks_per_day_finished = {}
+        # the velocities and developers of a day are calculated on demand and dropped when the day changes
+        self._team_velocity_per_day_finished = {}
+        self._developer_velocity_per_day_finished = {}
+        self._developers_per_day_finished = {}
+        self._lock = threading.Lock()
+
+    def on_task_changes(self, events: List[TaskChangeEvent]) -> None:
+        with self._lock:
+            for event in events:
+                if event.previous_task is not None:
+                    self._remove_task(event.previous_task)
+                if event.task is not None:
+                    self._add_task(event.task)
+
+    def track_team_velocity(self, start_date: Date) -> DeveloperVelocity:
+        with self._lock:
+            return self._track_team_velocity(start_date)
+
+    def track_average_developer_velocity(self, start_date: Date) -> DeveloperVelocity:
+        with self._lock:
+            contributing_developers: Set[DeveloperID] = set()
+            for day in self._get_days_finished_since(start_date):
+                contributing_developers.update(self._get_developers_of_day(day))
+            return {
+                date: story_points / len(contributing_developers)
+                for date, story_points in self._track_team_velocity(start_date).items()
+            }
+
+    def track_developer_velocity(
+            self, tracked_developer: DeveloperID, start_date: Date
+    ) -> DeveloperVelocity:
+        with self._lock:
+            developer_velocity: DeveloperVelocity = {}
+            for day in self._get_days_finished_since(start_date):
+                self._velocity_tracker.aggregate_velocity(
+                    a=developer_velocity,
+                    b=self._get_developer_velocity_of_day(day, tracked_developer),
+                )
+            return developer_velocity
+
+    def _track_team_velocity(self, start_date: Date) -> DeveloperVelocity:
+        team_velocity: DeveloperVelocity = {}
+        for day in self._get_days_finished_since(start_date):
+            self._velocity_tracker.aggregate_velocity(
+                a=team_velocity, b=self._get_team_velocity_of_day(day)
+            )
+        return team_velocity
+
+    def _get_days_finished_since(self, start_date: Date) -> List[DayOrdinal]:
+        start_day = start_date.to_ordinal()
+        return [day for day in self._tasks_per_day_finished if day >= start_day]
+
+    def _get_team_velocity_of_day(self, day: DayOrdinal) -> DeveloperVelocity:
+        team_velocity = self._team_velocity_per_day_finished.get(day)
+        if team_velocity is None:
+            team_velocity = self._velocity_tracker.track_team_velocity(
+                list(self._tasks_per_day_finished[day].values())
+            )
+            self._team_velocity_per_day_finished[day] = team_velocity
+        return team_velocity
+
+    def _get_developer_velocity_of_day(
+            self, day: DayOrdinal, developer: DeveloperID
+    ) -> DeveloperVelocity:
+        developer_velocities = self._developer_velocity_per_day_finished.setdefault(day, {})
+        developer_velocity = developer_velocities.get(developer)
+        if developer_velocity is None:
+            developer_velocity = self._velocity_tracker.track_developer_velocity(
+                list(self._tasks_per_day_finished[day].values()), developer
+            )
+            developer_velocities[developer] = developer_velocity
+        return developer_velocity
+
+    def _get_developers_of_day(self, day: DayOrdinal) -> Set[DeveloperID]:
+        developers = self._developers_per_day_finished.get(day)
+        if developers is None:
+            developers = {
+                developer
+                for task in self._tasks_per_day_finished[day].values()
+                for developer in task.assignees
+            }
+            self._developers_per_day_finished[day] = developers
+        return developers
+
+    def _add_task(self, task: NormalizedTask) -> None:
+        if task.date_finished is None:
+            return
+        day = task.date_finished.to_ordinal()
+        self._tasks_per_day_finished.setdefault(day, {})[task.id] = VelocityTrackableTask(
+            id=task.id,
+            story_points=task.story_points,
+            assignees=task.assignees,
+            date_started=task.date_started,
+            date_finished=task.date_finished,
+        )
+        self._forget_velocities_of_day(day)
+
+    def _remove_task(self, task: NormalizedTask) -> None:
+        if task.date_finished is None:
+            return
+        day = task.date_finished.to_ordinal()
+        tasks = self._tasks_per_day_finished.get(day, {})
+        tasks.pop(task.id, None)
+        if len(tasks) == 0:
+            self._tasks_per_day_finished.pop(day, None)
+        self._forget_velocities_of_day(day)
+
+    def _forget_velocities_of_day(self, day: DayOrdinal) -> None:
+        self._team_velocity_per_day_finished.pop(day, None)
+        self._developer_velocity_per_day_finished.pop(day, None)
+        self._developers_per_day_finished.pop(day, None)
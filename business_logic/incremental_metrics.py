@@ -0,0 +1,38 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from business_logic.incremental_developer_velocity_tracker import (
+    IncrementalDeveloperVelocityTracker,
+)
+from business_logic.incremental_open_task_aggregator import IncrementalOpenTaskAggregator
+from business_logic.task_projection import TaskProjector
+
+
+class IncrementalMetrics:
+    """
+    The velocity tracker and the open task aggregator of the dashboards. They
+    follow the changes between the projections of the given task projector, so
+    they are always of the same version of the tasks as the projected views.
+    They are brought up to date by refresh, which rebuilds the projection if the
+    tasks changed, on the given executor.
+    """
+
+    def __init__(
+        self, task_projector: TaskProjector, executor: Optional[ThreadPoolExecutor] = None
+    ):
+        self._task_projector = task_projector
+        self._executor = (
+            executor
+            if executor is not None
+            else ThreadPoolExecutor(max_workers=1, thread_name_prefix="task-getter")
+        )
+        self.velocity_tracker = IncrementalDeveloperVelocityTracker()
+        self.open_task_aggregator = IncrementalOpenTaskAggregator()
+        task_projector.subscribe_to_task_changes(self.velocity_tracker)
+        task_projector.subscribe_to_task_changes(self.open_task_aggregator)
+
+    async def refresh(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._task_projector.get_projection
+        )
@@ -0,0 +1,94 @@
+import threading
+from typing import Dict, List, Optional, Set
+
+from business_logic.interfaces.maker import Maker
+from business_logic.interfaces.task_change_listener import TaskChangeListener
+from business_logic.models.burn_down_forecastable_task import BurnDownForecastableTask
+from business_logic.models.date import Date
+from business_logic.models.task_change_event import TaskChangeEvent
+from business_logic.normalized_task_store import NormalizedTask
+
+TaskID = str
+StoryPoints = float
+
+
+class IncrementalOpenTaskAggregator(TaskChangeListener):
+    """
+    Keeps the story points and the earliest start date of the open top level
+    tasks up to date, so they can be aggregated into one burn down forecastable
+    task without going over every task. A change only updates the changed task
+    and its (former) sub-tasks, which may have become or stopped being top level tasks.
+    """
+
+    _open_tasks: Dict[TaskID, NormalizedTask]
+    _parent_task_ids: Dict[TaskID, Set[TaskID]]
+    _open_root_tasks: Dict[TaskID, NormalizedTask]
+    _earliest_date_started: Optional[Date]
+
+    def __init__(self) -> None:
+        self._open_tasks = {}
+        self._parent_task_ids = {}
+        self._open_root_tasks = {}
+        self._story_points: StoryPoints = 0
+        self._earliest_date_started = None
+        self._earliest_date_started_is_outdated = False
+        self._lock = threading.Lock()
+
+    def on_task_changes(self, events: List[TaskChangeEvent]) -> None:
+        with self._lock:
+            for event in events:
+                affected_task_ids = {event.task_id}
+                if event.previous_task is not None:
+                    self._open_tasks.pop(event.task_id, None)
+                    for sub_task_id in event.previous_task.sub_task_ids:
+                        self._parent_task_ids.get(sub_task_id, set()).discard(event.task_id)
+                        affected_task_ids.add(sub_task_id)
+                if event.task is not None:
+                    if event.task.date_finished is None:
+                        self._open_tasks[event.task_id] = event.task
+                    for sub_task_id in event.task.sub_task_ids:
+                        self._parent_task_ids.setdefault(sub_task_id, set()).add(event.task_id)
+                        affected_task_ids.add(sub_task_id)
+                for task_id in affected_task_ids:
+                    self._update_open_root_task(task_id)
+
+    def aggregate(self, id_maker: Maker[str]) -> BurnDownForecastableTask:
+        """
+        Returns the same task as the BurnDownForecastableTaskAggregator
+        does for the open top level tasks
+        """
+        with self._lock:
+            return BurnDownForecastableTask(
+                id=id_maker.make(),
+                story_points=self._story_points,
+                date_started=self._get_earliest_date_started(),
+            )
+
+    def _update_open_root_task(self, task_id: TaskID) -> None:
+        previous_task = self._open_root_tasks.pop(task_id, None)
+        if previous_task is not None:
+            self._story_points -= previous_task.story_points
+            if len(self._open_root_tasks) == 0:
+                # no rounding errors of the subtractions are left behind
+                self._story_points = 0
+            if previous_task.date_started == self._earliest_date_started:
+                self._earliest_date_started_is_outdated = True
+        task = self._open_tasks.get(task_id)
+        if task is None or len(self._parent_task_ids.get(task_id, set())) > 0:
+            return
+        self._open_root_tasks[task_id] = task
+        self._story_points += task.story_points
+        if self._earliest_date_started is None or task.date_started < self._earliest_date_started:
+            self._earliest_date_started = task.date_started
+
+    def _get_earliest_date_started(self) -> Date:
+        if self._earliest_date_started_is_outdated:
+            # the earliest task is gone, only then all open top level tasks are looked at again
+            self._earliest_date_started = min(
+                (task.date_started for task in self._open_root_tasks.values()),
+                default=None,
+            )
+            self._earliest_date_started_is_outdated = False
+        if self._earliest_date_started is None:
+            return Date.today()
+        return self._earliest_date_started
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Generic, List, TypeVar, Optional
+
+from business_logic.models.date import Date
+
+T = TypeVar("T")
+
+
+class AsyncTaskGetter(ABC, Generic[T]):
+    """
+    The async counterpart of the TaskGetter, for callers running on an event loop
+    """
+
+    @abstractmethod
+    async def get_task_by_id(self, task_id: str) -> Optional[T]:
+        ...
+
+    @abstractmethod
+    async def get_tasks(self) -> List[T]:
+        ...
+
+    @abstractmethod
+    async def get_tasks_finished_since(self, date: Date) -> List[T]:
+        ...
+
+    @abstractmethod
+    async def get_open_tasks(self) -> List[T]:
+        ...
+
+    @abstractmethod
+    async def get_tasks_of_assignee(self, assignee: str) -> List[T]:
+        ...
+
+    @abstractmethod
+    async def get_tasks_by_ids(self, task_ids: List[str]) -> Dict[str, T]:
+        ...
+
+    @abstractmethod
+    async def get_data_generation(self) -> Optional[int]:
+        ...
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from business_logic.models.task_change_event import TaskChangeEvent
+
+
+class TaskChangeListener(ABC):
+    @abstractmethod
+    def on_task_changes(self, events: List[TaskChangeEvent]) -> None:
+        """
+        Is called with the changes of a single refresh of the task getter
+        """
+        ...
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from business_logic.models.task_change_set import SyncCursor, TaskChangeSet
+
+
+class TaskChangeSource(ABC):
+    @abstractmethod
+    def get_changes_since(self, cursor: Optional[SyncCursor]) -> TaskChangeSet:
+        """
+        Returns every change after the given cursor, or all tasks if there is no cursor yet
+        """
+        ...
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Generic, List, TypeVar, Optional
+from typing import Dict, Generic, List, TypeVar, Optional
+
+from business_logic.interfaces.task_change_listener import TaskChangeListener
+from business_logic.models.date import Date
 
 T = TypeVar("T")
 
@@ -12,3 +15,55 @@ class TaskGetter(ABC, Generic[T]):
     @abstractmethod
     def get_tasks(self) -> List[T]:
         ...
+
+    def get_data_generation(self) -> Optional[int]:
+        """
+        Returns a number that increases whenever the data of the task getter changes,
+        so results can be cached until it does. None means the task getter cannot tell.
+        """
+        return None
+
+    def subscribe_to_task_changes(self, listener: TaskChangeListener) -> bool:
+        """
+        Tells the listener about every change of the tasks from now on, starting
+        with the current tasks. Changes are published while the task getter refreshes
+        its data, i.e. during its calls. Returns False if the task getter does not
+        publish its changes.
+        """
+        return False
+
+    # --- queries ------------------------------------------------------------------
+    # Task getters of tasks can inherit the FilteringTaskGetter, which answers
+    # the queries by filtering the result of get_tasks.
+
+    @abstractmethod
+    def get_tasks_finished_since(self, date: Date) -> List[T]:
+        """
+        Returns every task finished on or after the given date, sub-tasks included
+        """
+        ...
+
+    @abstractmethod
+    def get_open_tasks(self) -> List[T]:
+        """
+        Returns the tasks of get_tasks that are not finished yet
+        """
+        ...
+
+    @abstractmethod
+    def get_tasks_of_assignee(self, assignee: str) -> List[T]:
+        """
+        Returns every task assigned to the given developer, sub-tasks included
+        """
+        ...
+
+    def get_tasks_by_ids(self, task_ids: List[str]) -> Dict[str, T]:
+        """
+        Returns the found tasks per id in the order of the given ids, unknown ids are skipped
+        """
+        tasks: Dict[str, T] = {}
+        for task_id in task_ids:
+            task = self.get_task_by_id(task_id)
+            if task is not None:
+                tasks[task_id] = task
+        return tasks
@@ -0,0 +1,102 @@
+import base64
+import datetime
+import json
+from typing import Any, Dict, Optional
+from urllib.parse import quote, urlencode
+
+from business_logic.errors import TaskSourceRequestError
+from business_logic.http_connection_pool import HTTPConnectionPool
+from business_logic.models.date import Date
+from business_logic.normalized_task_store import NormalizedTask
+
+IssueKey = str
+JiraIssue = Dict[str, Any]
+
+_SEARCH_PATH = "/rest/api/2/search"
+_ISSUE_PATH = "/rest/api/2/issue/"
+
+
+class JiraClient:
+    """
+    Sends the requests to the Jira REST API over pooled keep-alive connections,
+    asking only for the fields needed for a task, and normalizes the issues.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            email: str,
+            api_token: str,
+            story_points_field: str = "customfield_10016",
+            max_concurrent_requests: int = 4,
+    ):
+        self._connection_pool = HTTPConnectionPool(
+            url, max_connections=max_concurrent_requests
+        )
+        credentials = base64.b64encode(f"{email}:{api_token}".encode())
+        self._headers = {
+            "Accept": "application/json",
+            "Authorization": "Basic " + credentials.decode("ascii"),
+        }
+        self._story_points_field = story_points_field
+        self._fields = (
+            "summary,description,assignee,created,updated,resolutiondate,parent,subtasks,"
+            f"{story_points_field}"
+        )
+
+    def search(self, jql: str, start_at: int, max_results: int) -> Dict[str, Any]:
+        """
+        Returns the page of the issues found by the JQL query starting at start_at
+        """
+        path = _SEARCH_PATH + "?" + urlencode(
+            {
+                "jql": jql,
+                "startAt": start_at,
+                "maxResults": max_results,
+                "fields": self._fields,
+            }
+        )
+        response = self._connection_pool.request("GET", path, headers=self._headers)
+        if response.status != 200:
+            raise TaskSourceRequestError(url=path, status=response.status)
+        page: Dict[str, Any] = json.loads(response.body)
+        return page
+
+    def get_issue(self, key: IssueKey) -> Optional[JiraIssue]:
+        """
+        Returns the issue of the given key, None if there is none
+        """
+        path = _ISSUE_PATH + quote(key, safe="") + "?" + urlencode({"fields": self._fields})
+        response = self._connection_pool.request("GET", path, headers=self._headers)
+        if response.status == 404:
+            return None
+        if response.status != 200:
+            raise TaskSourceRequestError(url=path, status=response.status)
+        issue: JiraIssue = json.loads(response.body)
+        return issue
+
+    def to_normalized_task(self, issue: JiraIssue) -> NormalizedTask:
+        """
+        The sub-task ids are the sub-tasks Jira lists for the issue
+        """
+        fields = issue["fields"]
+        assignee = fields.get("assignee")
+        return NormalizedTask(
+            id=issue["key"],
+            name=fields.get("summary") or "",
+            description=fields.get("description") or "",
+            story_points=float(fields.get(self._story_points_field) or 0),
+            assignees=[assignee["displayName"]] if assignee is not None else [],
+            sub_task_ids=[sub_task["key"] for sub_task in fields.get("subtasks") or []],
+            date_started=self._to_date(fields["created"]),
+            date_finished=(
+                self._to_date(fields["resolutiondate"])
+                if fields.get("resolutiondate") is not None
+                else None
+            ),
+        )
+
+    @staticmethod
+    def _to_date(jira_date_time: str) -> Date:
+        # jira date times look like "2024-01-05T10:20:30.000+0100"
+        return Date.from_datetime_date(datetime.date.fromisoformat(jira_date_time[:10]))
@@ -0,0 +1,103 @@
+import json
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from business_logic.interfaces.task_change_source import TaskChangeSource
+from business_logic.jira_client import JiraClient, JiraIssue
+from business_logic.models.task_change_set import SyncCursor, TaskChangeSet
+
+JQLMinute = str
+IssueVersion = str
+"""
+The key and the update time of an issue, e.g. "AK-1@2024-01-05T10:20:30.000+0100"
+"""
+
+
+class JiraTaskChangeSource(TaskChangeSource):
+    """
+    Reads the issues of the given JQL query updated since the cursor, oldest first,
+    one page per change set. JQL compares update times by the minute, so the cursor
+    is the minute of the last read issue, as Jira reports it in the time zone of the
+    user, and the versions of the issues of that minute read already. The whole
+    minute is read again and the issues read already are skipped, so an issue
+    updated again in the meantime, which moves to the end of the results, can not
+    push an unread issue out of the page. Jira does not report deleted issues,
+    so the change sets hold no tombstones.
+    The JQL query must not have an ORDER BY clause.
+    """
+
+    def __init__(self, jira_client: JiraClient, jql: str, page_size: int = 100):
+        self._jira_client = jira_client
+        self._jql = jql
+        self._page_size = page_size
+
+    def get_changes_since(self, cursor: Optional[SyncCursor]) -> TaskChangeSet:
+        minute, read_issue_versions = self._parse_cursor(cursor)
+        jql = self._make_jql(minute)
+        start_at = 0
+        while True:
+            page = self._jira_client.search(
+                jql, start_at=start_at, max_results=self._page_size
+            )
+            issues: List[JiraIssue] = page["issues"]
+            if len(issues) == 0:
+                return TaskChangeSet(changed_tasks=[], deleted_task_ids=[], cursor=cursor)
+            unread_issues = [
+                issue
+                for issue in issues
+                if self._get_issue_version(issue) not in read_issue_versions
+            ]
+            start_at += len(issues)
+            has_more = start_at < int(page.get("total", 0))
+            # more issues of the minute than fit on a page were read already
+            if len(unread_issues) > 0 or not has_more:
+                break
+        last_minute = self._get_minute_of_update(issues[-1])
+        issue_versions_of_last_minute = {
+            self._get_issue_version(issue)
+            for issue in issues
+            if self._get_minute_of_update(issue) == last_minute
+        }
+        if last_minute == minute:
+            issue_versions_of_last_minute |= read_issue_versions
+        return TaskChangeSet(
+            changed_tasks=[
+                self._jira_client.to_normalized_task(issue) for issue in unread_issues
+            ],
+            deleted_task_ids=[],
+            cursor=self._make_cursor(last_minute, issue_versions_of_last_minute),
+            has_more=has_more,
+        )
+
+    def _make_jql(self, minute: Optional[JQLMinute]) -> str:
+        conditions = [f"({self._jql})"] if self._jql.strip() != "" else []
+        if minute is not None:
+            conditions.append(f'updated >= "{minute}"')
+        return " AND ".join(conditions) + " ORDER BY updated ASC"
+
+    @staticmethod
+    def _make_cursor(minute: JQLMinute, read_issue_versions: Set[IssueVersion]) -> SyncCursor:
+        return json.dumps({"minute": minute, "read": sorted(read_issue_versions)})
+
+    @staticmethod
+    def _parse_cursor(
+            cursor: Optional[SyncCursor],
+    ) -> Tuple[Optional[JQLMinute], Set[IssueVersion]]:
+        if cursor is None:
+            return None, set()
+        try:
+            parsed_cursor: Dict[str, Any] = json.loads(cursor)
+            return parsed_cursor["minute"], set(parsed_cursor["read"])
+        except ValueError:
+            # the cursors of the first version were "minute|number of read issues",
+            # the issues of that minute are read again
+            return cursor.rsplit("|", 1)[0], set()
+
+    @staticmethod
+    def _get_issue_version(issue: JiraIssue) -> IssueVersion:
+        return f'{issue["key"]}@{issue["fields"]["updated"]}'
+
+    @staticmethod
+    def _get_minute_of_update(issue: JiraIssue) -> JQLMinute:
+        # jira date times look like "2024-01-05T10:20:30.000+0100", JQL expects "2024/01/05 10:20"
+        updated: str = issue["fields"]["updated"]
+        return updated[:10].replace("-", "/") + " " + updated[11:16]
@@ -0,0 +1,139 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from business_logic.filtering_task_getter import FilteringTaskGetter
+from business_logic.jira_client import IssueKey, JiraClient, JiraIssue
+from business_logic.models.task import Task
+
+
+class JiraTaskGetter(FilteringTaskGetter):
+    """
+    Reads the issues found by the given JQL query from the Jira REST API.
+    After the first page told the total number of issues, the remaining pages
+    are requested concurrently over pooled keep-alive connections. Sub-tasks
+    are linked to their parent issue, issues without a fetched parent are the
+    top level tasks.
+    A single task is looked up in the tasks of the last search. Tasks not found
+    there are requested by their key, together with their sub-tasks.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            email: str,
+            api_token: str,
+            jql: str,
+            story_points_field: str = "customfield_10016",
+            page_size: int = 100,
+            max_concurrent_requests: int = 4,
+    ):
+        self._jira_client = JiraClient(
+            url=url,
+            email=email,
+            api_token=api_token,
+            story_points_field=story_points_field,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_requests, thread_name_prefix="jira"
+        )
+        self._jql = jql
+        self._page_size = page_size
+        self._tasks_per_id_of_last_search: Dict[str, Task] = {}
+        self._lock = threading.Lock()
+
+    def get_task_by_id(self, task_id: str) -> Optional[Task]:
+        with self._lock:
+            task = self._tasks_per_id_of_last_search.get(task_id)
+        if task is not None:
+            return task
+        issue = self._jira_client.get_issue(task_id)
+        if issue is None:
+            return None
+        issues = [issue, *self._search_issues_below(issue["key"])]
+        for task in self._walk_tasks(self._to_tasks(issues)):
+            if task.id == issue["key"]:
+                return task
+        return None
+
+    def get_tasks(self) -> List[Task]:
+        tasks = self._to_tasks(self._search_issues(self._jql))
+        with self._lock:
+            self._tasks_per_id_of_last_search = {
+                task.id: task for task in self._walk_tasks(tasks)
+            }
+        return tasks
+
+    def _search_issues_below(self, key: IssueKey) -> List[JiraIssue]:
+        """
+        Returns the sub-tasks of the issue and their sub-tasks, level by level
+        """
+        issues: List[JiraIssue] = []
+        parent_keys = [key]
+        while len(parent_keys) > 0:
+            child_issues = self._search_issues(
+                "parent in (" + ", ".join(f'"{each}"' for each in parent_keys) + ")"
+            )
+            issues.extend(child_issues)
+            parent_keys = [issue["key"] for issue in child_issues]
+        return issues
+
+    def _search_issues(self, jql: str) -> List[JiraIssue]:
+        first_page = self._get_search_page(jql, start_at=0)
+        issues: List[JiraIssue] = first_page["issues"]
+        # jira may return fewer issues per page than asked for
+        page_size = max(int(first_page.get("maxResults", self._page_size)), 1)
+        for page in self._executor.map(
+            lambda start_at: self._get_search_page(jql, start_at=start_at),
+            range(len(issues), int(first_page.get("total", 0)), page_size),
+        ):
+            issues.extend(page["issues"])
+        return issues
+
+    def _get_search_page(self, jql: str, start_at: int) -> Dict[str, Any]:
+        return self._jira_client.search(jql, start_at=start_at, max_results=self._page_size)
+
+    def _to_tasks(self, issues: List[JiraIssue]) -> List[Task]:
+        issues_per_key = {issue["key"]: issue for issue in issues}
+        sub_task_keys: Dict[IssueKey, Dict[IssueKey, None]] = {
+            key: {} for key in issues_per_key
+        }
+        parent_keys: Dict[IssueKey, IssueKey] = {}
+        for key, issue in issues_per_key.items():
+            fields = issue["fields"]
+            for sub_task in fields.get("subtasks") or []:
+                if sub_task["key"] in issues_per_key:
+                    sub_task_keys[key][sub_task["key"]] = None
+                    parent_keys[sub_task["key"]] = key
+            parent = fields.get("parent")
+            if parent is not None and parent["key"] in issues_per_key:
+                sub_task_keys[parent["key"]][key] = None
+                parent_keys[key] = parent["key"]
+
+        tasks: Dict[IssueKey, Task] = {}
+        root_keys = [key for key in issues_per_key if key not in parent_keys]
+        # an explicit stack instead of recursion, so deep task trees can not exceed the recursion limit
+        unvisited_keys = [(key, False) for key in reversed(root_keys)]
+        while len(unvisited_keys) > 0:
+            key, sub_tasks_are_visited = unvisited_keys.pop()
+            if key in tasks:
+                continue
+            if not sub_tasks_are_visited:
+                unvisited_keys.append((key, True))
+                unvisited_keys.extend(
+                    (sub_task_key, False) for sub_task_key in reversed(sub_task_keys[key])
+                )
+                continue
+            normalized_task = self._jira_client.to_normalized_task(issues_per_key[key])
+            tasks[key] = Task(
+                id=normalized_task.id,
+                name=normalized_task.name,
+                description=normalized_task.description,
+                story_points=normalized_task.story_points,
+                assignees=normalized_task.assignees,
+                sub_tasks=[tasks[sub_task_key] for sub_task_key in sub_task_keys[key]],
+                date_started=normalized_task.date_started,
+                date_finished=normalized_task.date_finished,
+            )
+        return [tasks[key] for key in root_keys]
@@ -56,6 +56,13 @@ class Date:
         parsed_date = parser.parse(date_as_string)
         return Date.from_datetime_date(datetime_date=parsed_date)
 
+    @staticmethod
+    def from_ordinal(ordinal: int) -> "Date":
+        return Date.from_datetime_date(datetime.date.fromordinal(ordinal))
+
+    def to_ordinal(self) -> int:
+        return self.to_datetime_date().toordinal()
+
     def to_string(self) -> str:
         return f"{self._year}-{self._month}-{self._day}"
 
@@ -8,7 +8,7 @@ StoryPoints = float
 DeveloperID = str
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class Task:
     id: TaskID
     name: str
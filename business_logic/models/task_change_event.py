@@ -0,0 +1,20 @@
+import dataclasses
+from typing import Literal, Optional
+
+from business_logic.normalized_task_store import NormalizedTask
+
+TaskID = str
+TaskChangeEventType = Literal["added", "updated", "finished", "removed"]
+
+
+@dataclasses.dataclass
+class TaskChangeEvent:
+    """
+    A single change of a task. Added tasks have no previous_task,
+    removed tasks have no task.
+    """
+
+    type: TaskChangeEventType
+    task_id: TaskID
+    previous_task: Optional[NormalizedTask]
+    task: Optional[NormalizedTask]
@@ -0,0 +1,24 @@
+import dataclasses
+from typing import List, Optional
+
+from business_logic.normalized_task_store import NormalizedTask
+
+TaskID = str
+SyncCursor = str
+
+
+@dataclasses.dataclass
+class TaskChangeSet:
+    """
+    The tasks a source changed and deleted after a sync cursor. The cursor of the
+    change set is passed to the next request for changes. A change set with more
+    changes to fetch has has_more set.
+    """
+
+    changed_tasks: List[NormalizedTask]
+    deleted_task_ids: List[TaskID]
+    """
+    The tombstones of deleted tasks
+    """
+    cursor: Optional[SyncCursor]
+    has_more: bool = False
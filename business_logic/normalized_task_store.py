@@ -0,0 +1,147 @@
+import dataclasses
+from typing import Dict, List, Optional, Set
+
+from business_logic.models.date import Date
+
+TaskID = str
+FileName = str
+DeveloperID = str
+StoryPoints = float
+
+
+@dataclasses.dataclass
+class NormalizedTask:
+    """
+    The flat form of a task as read from a task source, its sub-tasks are referenced by id
+    """
+
+    id: TaskID
+    name: str
+    description: str
+    story_points: StoryPoints
+    assignees: List[DeveloperID]
+    sub_task_ids: List[TaskID]
+    date_started: Date
+    date_finished: Optional[Date] = None
+
+
+class NormalizedTaskStore:
+    """
+    Holds the normalized tasks of every read file and keeps the root task and
+    parent task indexes up to date while files are added and retracted,
+    so no lookup has to walk all tasks.
+    The generation is increased by every change of the stored tasks.
+    """
+
+    _tasks: Dict[TaskID, NormalizedTask]
+    _tasks_per_file: Dict[FileName, List[NormalizedTask]]
+    _root_task_ids: Dict[TaskID, None]
+    _parent_task_ids: Dict[TaskID, Set[TaskID]]
+    _previous_tasks_of_changed_tasks: Dict[TaskID, Optional[NormalizedTask]]
+
+    def __init__(self) -> None:
+        self._tasks = {}
+        self._tasks_per_file = {}
+        # a dict is used as an insertion ordered set
+        self._root_task_ids = {}
+        self._parent_task_ids = {}
+        self._previous_tasks_of_changed_tasks = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get_task(self, task_id: TaskID) -> Optional[NormalizedTask]:
+        return self._tasks.get(task_id)
+
+    def get_tasks(self) -> List[NormalizedTask]:
+        return list(self._tasks.values())
+
+    def get_root_tasks(self) -> List[NormalizedTask]:
+        return [self._tasks[task_id] for task_id in self._root_task_ids]
+
+    def get_tasks_per_file(self) -> Dict[FileName, List[NormalizedTask]]:
+        return self._tasks_per_file
+
+    def get_sub_task_ids(self, task_id: TaskID) -> List[TaskID]:
+        task = self._tasks.get(task_id)
+        return task.sub_task_ids if task is not None else []
+
+    def get_parent_task_ids(self, task_id: TaskID) -> Set[TaskID]:
+        return self._parent_task_ids.get(task_id, set())
+
+    def get_ancestor_task_ids(self, task_ids: Set[TaskID]) -> Set[TaskID]:
+        """
+        Returns the given task ids together with the ids of all their (grand)parents
+        """
+        ancestor_task_ids: Set[TaskID] = set()
+        unvisited_task_ids = list(task_ids)
+        while len(unvisited_task_ids) > 0:
+            task_id = unvisited_task_ids.pop()
+            if task_id not in ancestor_task_ids:
+                ancestor_task_ids.add(task_id)
+                unvisited_task_ids.extend(self.get_parent_task_ids(task_id))
+        return ancestor_task_ids
+
+    def pop_changed_task_ids(self) -> Set[TaskID]:
+        """
+        Returns the ids of all tasks added, replaced or removed since the last call
+        """
+        return set(self.pop_previous_tasks_of_changed_tasks())
+
+    def pop_previous_tasks_of_changed_tasks(self) -> Dict[TaskID, Optional[NormalizedTask]]:
+        """
+        Returns the tasks added, replaced or removed since the last call as they were
+        before their first change, None for the tasks that did not exist before
+        """
+        previous_tasks_of_changed_tasks = self._previous_tasks_of_changed_tasks
+        self._previous_tasks_of_changed_tasks = {}
+        return previous_tasks_of_changed_tasks
+
+    def add_tasks_of_file(
+            self, file_name: FileName, tasks: List[NormalizedTask]
+    ) -> None:
+        self.retract_tasks_of_file(file_name)
+        for task in tasks:
+            self._add_task(task)
+        self._tasks_per_file[file_name] = tasks
+
+    def retract_tasks_of_file(self, file_name: FileName) -> None:
+        for task in self._tasks_per_file.pop(file_name, []):
+            # the task might have been replaced by a task with the same id from another file
+            if self._tasks.get(task.id) is task:
+                self._remove_task(task)
+
+    def _add_task(self, task: NormalizedTask) -> None:
+        previous_task = self._tasks.get(task.id)
+        if previous_task is not None:
+            self._remove_task(previous_task)
+        self._tasks[task.id] = task
+        for sub_task_id in task.sub_task_ids:
+            self._parent_task_ids.setdefault(sub_task_id, set()).add(task.id)
+            self._root_task_ids.pop(sub_task_id, None)
+        if task.id not in self._parent_task_ids:
+            self._root_task_ids[task.id] = None
+        self._mark_task_as_changed(task.id, previous_task=None)
+
+    def _remove_task(self, task: NormalizedTask) -> None:
+        del self._tasks[task.id]
+        self._root_task_ids.pop(task.id, None)
+        for sub_task_id in task.sub_task_ids:
+            parent_task_ids = self._parent_task_ids.get(sub_task_id)
+            if parent_task_ids is None:
+                continue
+            parent_task_ids.discard(task.id)
+            if len(parent_task_ids) == 0:
+                del self._parent_task_ids[sub_task_id]
+                if sub_task_id in self._tasks:
+                    self._root_task_ids[sub_task_id] = None
+        self._mark_task_as_changed(task.id, previous_task=task)
+
+    def _mark_task_as_changed(
+            self, task_id: TaskID, previous_task: Optional[NormalizedTask]
+    ) -> None:
+        # only the task from before the first change since the last pop is kept
+        self._previous_tasks_of_changed_tasks.setdefault(task_id, previous_task)
+        self._generation += 1
@@ -0,0 +1,112 @@
+import json
+import re
+from typing import Any, Iterator, TextIO
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_VALUE_DELIMITERS = " \t\n\r,:]}"
+
+
+class StreamingJSONArrayReader:
+    """
+    Yields the items of the array stored under the given key of a top level
+    JSON object one at a time. Only the item currently decoded is kept in
+    memory, so the memory needed is bounded by the largest item and not by
+    the size of the file.
+    """
+
+    def __init__(self, key: str, chunk_size_in_characters: int = 64 * 1024):
+        self._key = key
+        self._chunk_size_in_characters = chunk_size_in_characters
+
+    def read_items(self, reader: TextIO) -> Iterator[Any]:
+        buffer = _Buffer(
+            reader=reader, chunk_size_in_characters=self._chunk_size_in_characters
+        )
+        buffer.expect("{")
+        if buffer.peek() == "}":
+            return
+        while True:
+            key = buffer.decode_value()
+            buffer.expect(":")
+            if key == self._key:
+                yield from self._read_array_items(buffer)
+                return
+            buffer.decode_value()
+            if buffer.expect_one_of(",}") == "}":
+                return
+
+    @staticmethod
+    def _read_array_items(buffer: "_Buffer") -> Iterator[Any]:
+        buffer.expect("[")
+        if buffer.peek() == "]":
+            return
+        while True:
+            yield buffer.decode_value()
+            if buffer.expect_one_of(",]") == "]":
+                return
+
+
+class _Buffer:
+    def __init__(self, reader: TextIO, chunk_size_in_characters: int):
+        self._reader = reader
+        self._chunk_size_in_characters = chunk_size_in_characters
+        self._decoder = json.JSONDecoder()
+        self._text = ""
+        self._position = 0
+        self._is_exhausted = False
+
+    def peek(self) -> str:
+        self._skip_whitespace()
+        while self._position >= len(self._text) and not self._is_exhausted:
+            self._read_more(self._chunk_size_in_characters)
+            self._skip_whitespace()
+        if self._position >= len(self._text):
+            raise self._make_error("Unexpected end of file")
+        return self._text[self._position]
+
+    def expect(self, character: str) -> None:
+        self.expect_one_of(character)
+
+    def expect_one_of(self, characters: str) -> str:
+        character = self.peek()
+        if character not in characters:
+            raise self._make_error(f"Expected one of {characters!r}")
+        self._position += 1
+        return character
+
+    def decode_value(self) -> Any:
+        self.peek()
+        read_size = self._chunk_size_in_characters
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._text, self._position)
+            except json.JSONDecodeError:
+                if self._is_exhausted:
+                    raise
+                self._read_more(read_size)
+                read_size *= 2
+                continue
+            # a number cut off by the end of the buffer decodes without an error,
+            # so every value has to be followed by a delimiter to be complete
+            if not self._is_exhausted and (
+                end == len(self._text) or self._text[end] not in _VALUE_DELIMITERS
+            ):
+                self._read_more(read_size)
+                continue
+            self._position = end
+            return value
+
+    def _skip_whitespace(self) -> None:
+        match = _WHITESPACE.match(self._text, self._position)
+        if match is not None:
+            self._position = match.end()
+
+    def _read_more(self, size: int) -> None:
+        chunk = self._reader.read(size)
+        if not chunk:
+            self._is_exhausted = True
+        self._text = self._text[self._position:] + chunk
+        self._position = 0
+
+    def _make_error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._text, self._position)
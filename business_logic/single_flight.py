@@ -0,0 +1,48 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar, cast
+
+R = TypeVar("R")
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key: the first caller runs the call,
+    the callers arriving while it runs wait for it and get its result or its error
+    """
+
+    _flights: Dict[Hashable, _Flight]
+
+    def __init__(self) -> None:
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, call: Callable[[], R]) -> R:
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leading = flight is None
+            if flight is None:
+                flight = _Flight()
+                self._flights[key] = flight
+        if not is_leading:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return cast(R, flight.result)
+        try:
+            flight.result = call()
+            return cast(R, flight.result)
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
@@ -0,0 +1,227 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Generic, Optional, Tuple
+
+from business_logic.caching_task_getter import Cache, K, V
+
+Seconds = float
+Version = int
+DataGeneration = int
+
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+DROP TABLE IF EXISTS cache_entries;
+DROP TABLE IF EXISTS cache_versions;
+DROP TABLE IF EXISTS cache_data_generations;
+CREATE TABLE cache_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    data_generation INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    value BLOB NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX cache_entries_by_expires_at ON cache_entries (expires_at);
+CREATE TABLE cache_versions (
+    namespace TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+CREATE TABLE cache_data_generations (
+    namespace TEXT PRIMARY KEY,
+    data_generation INTEGER NOT NULL
+);
+"""
+
+
+class SQLiteCache(Cache[K, V], Generic[K, V]):
+    """
+    Keeps pickled values for the given life time in a SQLite file, which is shared
+    by every process of the host opening the same file, e.g. the uvicorn workers.
+    A value added by one worker is served to all the others.
+    Only the values are shared, every worker still reads the tasks from the
+    task getter on a miss and keeps its own unpickled copies.
+    Values are stamped with the data generation the worker started last.
+    The newest data generation any worker started is kept with the values,
+    values of older generations are not served, and values added by a worker
+    that did not see the newest generation yet are rejected. This expects the
+    task getter to tell the same generation in every worker for the same data.
+    Every added value gets a new version. A process keeps the values it
+    unpickled last, and only reads and unpickles a value again when
+    its version changed. The file must only be writable by the server, as
+    its values are unpickled.
+    """
+
+    _local_values: Dict[str, Tuple[Version, V]]
+    _data_generation: Optional[DataGeneration]
+
+    def __init__(
+            self,
+            path_to_database: str,
+            namespace: str,
+            cache_life_time_in_seconds: Seconds,
+            clock: Callable[[], Seconds] = time.time,
+    ):
+        # expiration times are shared between processes, so they are on the wall clock
+        self._path_to_database = path_to_database
+        self._namespace = namespace
+        self._cache_life_time_in_seconds = cache_life_time_in_seconds
+        self._clock = clock
+        self._local_values = {}
+        self._data_generation = None
+        self._next_sweep = clock() + cache_life_time_in_seconds
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_process_id: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def has(self, key: K) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: K) -> Optional[V]:
+        cache_key = str(key)
+        with self._lock:
+            connection = self._get_connection()
+            row = connection.execute(
+                "SELECT version FROM cache_entries "
+                "WHERE namespace = ? AND key = ? AND expires_at > ? "
+                "AND data_generation >= ?",
+                (
+                    self._namespace,
+                    cache_key,
+                    self._clock(),
+                    self._get_newest_data_generation(connection),
+                ),
+            ).fetchone()
+            if row is None:
+                self._local_values.pop(cache_key, None)
+                return None
+            version: Version = row[0]
+            local_value = self._local_values.get(cache_key)
+            if local_value is not None and local_value[0] == version:
+                return local_value[1]
+            row = connection.execute(
+                "SELECT value FROM cache_entries "
+                "WHERE namespace = ? AND key = ? AND version = ?",
+                (self._namespace, cache_key, version),
+            ).fetchone()
+            if row is None:
+                # another process replaced the value in between
+                return None
+            value: V = pickle.loads(row[0])
+            self._local_values[cache_key] = (version, value)
+            return value
+
+    def add(self, key: K, value: V) -> None:
+        cache_key = str(key)
+        pickled_value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            connection = self._get_connection()
+            now = self._clock()
+            with connection:
+                newest_data_generation = self._get_newest_data_generation(connection)
+                data_generation = (
+                    self._data_generation
+                    if self._data_generation is not None
+                    else newest_data_generation
+                )
+                if data_generation < newest_data_generation:
+                    # the value was read before another worker saw the newer data
+                    return
+                version = self._make_version(connection)
+                connection.execute(
+                    "INSERT INTO cache_entries "
+                    "(namespace, key, version, data_generation, expires_at, value) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (namespace, key) DO UPDATE SET "
+                    "version = excluded.version, "
+                    "data_generation = excluded.data_generation, "
+                    "expires_at = excluded.expires_at, "
+                    "value = excluded.value "
+                    "WHERE excluded.data_generation >= cache_entries.data_generation",
+                    (
+                        self._namespace,
+                        cache_key,
+                        version,
+                        data_generation,
+                        now + self._cache_life_time_in_seconds,
+                        pickled_value,
+                    ),
+                )
+                if now >= self._next_sweep:
+                    connection.execute(
+                        "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?",
+                        (self._namespace, now),
+                    )
+                    self._next_sweep = now + self._cache_life_time_in_seconds
+            self._local_values[cache_key] = (version, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ?", (self._namespace,)
+                )
+            self._local_values = {}
+
+    def start_data_generation(self, data_generation: DataGeneration) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "INSERT INTO cache_data_generations (namespace, data_generation) "
+                    "VALUES (?, ?) ON CONFLICT (namespace) DO UPDATE SET "
+                    "data_generation = MAX(data_generation, excluded.data_generation)",
+                    (self._namespace, data_generation),
+                )
+                connection.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND data_generation < ?",
+                    (self._namespace, self._get_newest_data_generation(connection)),
+                )
+            self._data_generation = data_generation
+            self._local_values = {}
+
+    def _get_newest_data_generation(self, connection: sqlite3.Connection) -> DataGeneration:
+        row = connection.execute(
+            "SELECT data_generation FROM cache_data_generations WHERE namespace = ?",
+            (self._namespace,),
+        ).fetchone()
+        return row[0] if row is not None else 0
+
+    def _make_version(self, connection: sqlite3.Connection) -> Version:
+        # the versions of a namespace only increase, even when its entries are cleared
+        connection.execute(
+            "INSERT INTO cache_versions (namespace, version) VALUES (?, 1) "
+            "ON CONFLICT (namespace) DO UPDATE SET version = version + 1",
+            (self._namespace,),
+        )
+        version: Version = connection.execute(
+            "SELECT version FROM cache_versions WHERE namespace = ?", (self._namespace,)
+        ).fetchone()[0]
+        return version
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # a connection must not be used by a forked process, every process opens its own
+        if self._connection is None or self._connection_process_id != os.getpid():
+            connection = sqlite3.connect(
+                self._path_to_database, timeout=30, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            with connection:
+                # the schema is checked and created in one write transaction,
+                # so concurrently starting processes create it once
+                connection.execute("BEGIN IMMEDIATE")
+                schema_version = connection.execute("PRAGMA user_version").fetchone()[0]
+                if schema_version != _SCHEMA_VERSION:
+                    # the file only holds cached values, so an older schema is dropped
+                    for statement in _SCHEMA.split(";"):
+                        if statement.strip() != "":
+                            connection.execute(statement)
+                    connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self._connection = connection
+            self._connection_process_id = os.getpid()
+        return self._connection
@@ -0,0 +1,345 @@
+import glob
+import sqlite3
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from business_logic.dummy_data_task_getter import read_normalized_tasks_of_file
+from business_logic.interfaces.task_getter import TaskGetter
+from business_logic.models.date import Date
+from business_logic.models.task import Task
+from business_logic.models.task_change_set import SyncCursor, TaskChangeSet
+from business_logic.normalized_task_store import NormalizedTask
+
+TaskID = str
+
+_MAX_NUMBER_OF_QUERY_PARAMETERS = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    story_points REAL NOT NULL,
+    date_started INTEGER NOT NULL,
+    date_finished INTEGER
+);
+CREATE TABLE IF NOT EXISTS task_assignees (
+    task_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    developer_id TEXT NOT NULL,
+    PRIMARY KEY (task_id, position)
+);
+CREATE TABLE IF NOT EXISTS sub_tasks (
+    parent_task_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    sub_task_id TEXT NOT NULL,
+    PRIMARY KEY (parent_task_id, position)
+);
+CREATE TABLE IF NOT EXISTS sync_cursors (
+    source_name TEXT PRIMARY KEY,
+    cursor TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS data_generation (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    generation INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO data_generation (id, generation) VALUES (0, 0);
+CREATE INDEX IF NOT EXISTS tasks_by_date_finished ON tasks (date_finished);
+CREATE INDEX IF NOT EXISTS tasks_by_date_started ON tasks (date_started);
+CREATE INDEX IF NOT EXISTS task_assignees_by_developer_id ON task_assignees (developer_id);
+CREATE INDEX IF NOT EXISTS sub_tasks_by_sub_task_id ON sub_tasks (sub_task_id);
+"""
+
+_TaskRow = Tuple[str, str, str, float, int, Optional[int]]
+
+
+class SQLiteTaskGetter(TaskGetter[Task]):
+    """
+    Reads tasks from a SQLite database. Dates are stored as day ordinals and
+    indexed, so date windows are answered by the index without loading every task.
+    Tasks are imported from the dummy data files with import_dummy_data_files,
+    or synced from a task source with the TaskSyncEngine.
+    The data generation is stored with the tasks and increased by every write,
+    so every process reading the database tells the same generation.
+    """
+
+    def __init__(self, path_to_database: str):
+        # the connection is shared by the request threads of the server
+        self._connection = sqlite3.connect(path_to_database, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    def get_task_by_id(self, task_id: str) -> Optional[Task]:
+        tasks = self._load_tasks_with_sub_tasks([task_id])
+        return tasks[0] if len(tasks) > 0 else None
+
+    def get_tasks(self) -> List[Task]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, name, description, story_points, date_started, date_finished "
+                "FROM tasks ORDER BY rowid"
+            ).fetchall()
+            assignees = self._group_by_first_column(
+                self._connection.execute(
+                    "SELECT task_id, developer_id FROM task_assignees "
+                    "ORDER BY task_id, position"
+                )
+            )
+            sub_task_ids = self._group_by_first_column(
+                self._connection.execute(
+                    "SELECT parent_task_id, sub_task_id FROM sub_tasks "
+                    "ORDER BY parent_task_id, position"
+                )
+            )
+        all_sub_task_ids = {
+            task_id for task_ids in sub_task_ids.values() for task_id in task_ids
+        }
+        return self._to_tasks(
+            task_ids=[row[0] for row in rows if row[0] not in all_sub_task_ids],
+            rows={row[0]: row for row in rows},
+            assignees=assignees,
+            sub_task_ids=sub_task_ids,
+        )
+
+    def get_tasks_finished_since(self, date: Date) -> List[Task]:
+        return self._load_tasks_with_sub_tasks(
+            self._select_task_ids(
+                "SELECT id FROM tasks WHERE date_finished >= ? ORDER BY rowid",
+                (date.to_ordinal(),),
+            )
+        )
+
+    def get_open_tasks(self) -> List[Task]:
+        return self._load_tasks_with_sub_tasks(
+            self._select_task_ids(
+                "SELECT id FROM tasks WHERE date_finished IS NULL "
+                "AND id NOT IN (SELECT sub_task_id FROM sub_tasks) ORDER BY rowid",
+                (),
+            )
+        )
+
+    def get_tasks_of_assignee(self, assignee: str) -> List[Task]:
+        return self._load_tasks_with_sub_tasks(
+            self._select_task_ids(
+                "SELECT id FROM tasks WHERE id IN "
+                "(SELECT task_id FROM task_assignees WHERE developer_id = ?) "
+                "ORDER BY rowid",
+                (assignee,),
+            )
+        )
+
+    def get_tasks_by_ids(self, task_ids: List[str]) -> Dict[str, Task]:
+        return {
+            task.id: task for task in self._load_tasks_with_sub_tasks(task_ids)
+        }
+
+    def get_data_generation(self) -> int:
+        with self._lock:
+            data_generation: int = self._connection.execute(
+                "SELECT generation FROM data_generation"
+            ).fetchone()[0]
+            return data_generation
+
+    def import_dummy_data_files(self, path_to_dummy_data: str) -> None:
+        for file_name in sorted(glob.glob(path_to_dummy_data + "/*.json")):
+            self.import_normalized_tasks(read_normalized_tasks_of_file(file_name))
+
+    def import_normalized_tasks(self, tasks: List[NormalizedTask]) -> None:
+        with self._lock, self._connection:
+            self._upsert_tasks(tasks)
+            self._increase_data_generation()
+
+    def get_sync_cursor(self, source_name: str) -> Optional[SyncCursor]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT cursor FROM sync_cursors WHERE source_name = ?", (source_name,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def apply_task_changes(self, source_name: str, change_set: TaskChangeSet) -> None:
+        """
+        Stores the changed tasks, removes the deleted tasks and advances the
+        cursor of the source in a single transaction, so a failed sync never
+        moves the cursor past changes that were not stored.
+        """
+        with self._lock, self._connection:
+            self._upsert_tasks(change_set.changed_tasks)
+            self._delete_tasks(change_set.deleted_task_ids)
+            if change_set.cursor is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO sync_cursors (source_name, cursor) "
+                    "VALUES (?, ?)",
+                    (source_name, change_set.cursor),
+                )
+            self._increase_data_generation()
+
+    def _upsert_tasks(self, tasks: List[NormalizedTask]) -> None:
+        task_ids = [(task.id,) for task in tasks]
+        self._connection.executemany(
+            "DELETE FROM task_assignees WHERE task_id = ?", task_ids
+        )
+        self._connection.executemany(
+            "DELETE FROM sub_tasks WHERE parent_task_id = ?", task_ids
+        )
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO tasks "
+            "(id, name, description, story_points, date_started, date_finished) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    task.id,
+                    task.name,
+                    task.description,
+                    task.story_points,
+                    task.date_started.to_ordinal(),
+                    (
+                        task.date_finished.to_ordinal()
+                        if task.date_finished is not None
+                        else None
+                    ),
+                )
+                for task in tasks
+            ],
+        )
+        self._connection.executemany(
+            "INSERT INTO task_assignees (task_id, position, developer_id) "
+            "VALUES (?, ?, ?)",
+            [
+                (task.id, position, developer_id)
+                for task in tasks
+                for position, developer_id in enumerate(task.assignees)
+            ],
+        )
+        self._connection.executemany(
+            "INSERT INTO sub_tasks (parent_task_id, position, sub_task_id) "
+            "VALUES (?, ?, ?)",
+            [
+                (task.id, position, sub_task_id)
+                for task in tasks
+                for position, sub_task_id in enumerate(task.sub_task_ids)
+            ],
+        )
+
+    def _delete_tasks(self, task_ids: List[TaskID]) -> None:
+        parameters = [(task_id,) for task_id in task_ids]
+        self._connection.executemany("DELETE FROM tasks WHERE id = ?", parameters)
+        self._connection.executemany(
+            "DELETE FROM task_assignees WHERE task_id = ?", parameters
+        )
+        self._connection.executemany(
+            "DELETE FROM sub_tasks WHERE parent_task_id = ? OR sub_task_id = ?",
+            [(task_id, task_id) for task_id in task_ids],
+        )
+
+    def _increase_data_generation(self) -> None:
+        self._connection.execute("UPDATE data_generation SET generation = generation + 1")
+
+    def _select_task_ids(
+            self, query: str, parameters: Tuple[Union[str, int], ...]
+    ) -> List[TaskID]:
+        with self._lock:
+            return [row[0] for row in self._connection.execute(query, parameters)]
+
+    def _load_tasks_with_sub_tasks(self, task_ids: List[TaskID]) -> List[Task]:
+        rows: Dict[TaskID, _TaskRow] = {}
+        assignees: Dict[TaskID, List[str]] = {}
+        sub_task_ids: Dict[TaskID, List[TaskID]] = {}
+        unloaded_task_ids = list(dict.fromkeys(task_ids))
+        with self._lock:
+            while len(unloaded_task_ids) > 0:
+                for chunk in self._chunk(unloaded_task_ids):
+                    placeholders = ", ".join("?" * len(chunk))
+                    for row in self._connection.execute(
+                        "SELECT id, name, description, story_points, date_started, "
+                        f"date_finished FROM tasks WHERE id IN ({placeholders})",
+                        chunk,
+                    ):
+                        rows[row[0]] = row
+                    for task_id, developer_id in self._connection.execute(
+                        "SELECT task_id, developer_id FROM task_assignees "
+                        f"WHERE task_id IN ({placeholders}) ORDER BY task_id, position",
+                        chunk,
+                    ):
+                        assignees.setdefault(task_id, []).append(developer_id)
+                    for task_id, sub_task_id in self._connection.execute(
+                        "SELECT parent_task_id, sub_task_id FROM sub_tasks "
+                        f"WHERE parent_task_id IN ({placeholders}) "
+                        "ORDER BY parent_task_id, position",
+                        chunk,
+                    ):
+                        sub_task_ids.setdefault(task_id, []).append(sub_task_id)
+                unloaded_task_ids = list(
+                    {
+                        sub_task_id
+                        for task_id in unloaded_task_ids
+                        for sub_task_id in sub_task_ids.get(task_id, [])
+                        if sub_task_id not in rows
+                    }
+                )
+        return self._to_tasks(
+            task_ids=task_ids,
+            rows=rows,
+            assignees=assignees,
+            sub_task_ids=sub_task_ids,
+        )
+
+    @classmethod
+    def _to_tasks(
+            cls,
+            task_ids: List[TaskID],
+            rows: Dict[TaskID, _TaskRow],
+            assignees: Dict[TaskID, List[str]],
+            sub_task_ids: Dict[TaskID, List[TaskID]],
+    ) -> List[Task]:
+        tasks: Dict[TaskID, Task] = {}
+        # an explicit stack instead of recursion, so deep task trees can not exceed the recursion limit
+        unvisited_task_ids = [
+            (task_id, False) for task_id in reversed(task_ids) if task_id in rows
+        ]
+        while len(unvisited_task_ids) > 0:
+            task_id, sub_tasks_are_visited = unvisited_task_ids.pop()
+            if task_id in tasks:
+                continue
+            loaded_sub_task_ids = [
+                sub_task_id
+                for sub_task_id in sub_task_ids.get(task_id, [])
+                if sub_task_id in rows
+            ]
+            if not sub_tasks_are_visited:
+                unvisited_task_ids.append((task_id, True))
+                unvisited_task_ids.extend(
+                    (sub_task_id, False) for sub_task_id in reversed(loaded_sub_task_ids)
+                )
+                continue
+            _, name, description, story_points, date_started, date_finished = rows[task_id]
+            tasks[task_id] = Task(
+                id=task_id,
+                name=name,
+                description=description,
+                story_points=story_points,
+                assignees=assignees.get(task_id, []),
+                sub_tasks=[tasks[sub_task_id] for sub_task_id in loaded_sub_task_ids],
+                date_started=Date.from_ordinal(date_started),
+                date_finished=(
+                    Date.from_ordinal(date_finished)
+                    if date_finished is not None
+                    else None
+                ),
+            )
+        return [tasks[task_id] for task_id in task_ids if task_id in rows]
+
+    @staticmethod
+    def _group_by_first_column(
+            rows: Iterator[Tuple[str, str]],
+    ) -> Dict[str, List[str]]:
+        groups: Dict[str, List[str]] = {}
+        for key, value in rows:
+            groups.setdefault(key, []).append(value)
+        return groups
+
+    @staticmethod
+    def _chunk(values: List[TaskID]) -> Iterator[List[TaskID]]:
+        for start in range(0, len(values), _MAX_NUMBER_OF_QUERY_PARAMETERS):
+            yield values[start:start + _MAX_NUMBER_OF_QUERY_PARAMETERS]
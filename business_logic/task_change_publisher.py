@@ -0,0 +1,78 @@
+from typing import Callable, Dict, List, Optional
+
+from business_logic.interfaces.task_change_listener import TaskChangeListener
+from business_logic.models.task_change_event import TaskChangeEvent
+from business_logic.normalized_task_store import NormalizedTask
+
+TaskID = str
+
+
+class TaskChangePublisher:
+    """
+    Turns the changed tasks of a task getter into task change events
+    and passes them to every subscribed listener
+    """
+
+    _listeners: List[TaskChangeListener]
+
+    def __init__(self) -> None:
+        self._listeners = []
+
+    def subscribe(
+            self, listener: TaskChangeListener, current_tasks: List[NormalizedTask]
+    ) -> None:
+        """
+        The listener is told about the current tasks as added tasks first,
+        so it starts from the same state as the task getter
+        """
+        listener.on_task_changes(
+            [
+                TaskChangeEvent(type="added", task_id=task.id, previous_task=None, task=task)
+                for task in current_tasks
+            ]
+        )
+        self._listeners.append(listener)
+
+    def publish(
+            self,
+            previous_tasks_of_changed_tasks: Dict[TaskID, Optional[NormalizedTask]],
+            get_task: Callable[[TaskID], Optional[NormalizedTask]],
+    ) -> None:
+        if len(self._listeners) == 0:
+            return
+        events: List[TaskChangeEvent] = []
+        for task_id, previous_task in previous_tasks_of_changed_tasks.items():
+            event = self.make_event(task_id, previous_task, get_task(task_id))
+            if event is not None:
+                events.append(event)
+        if len(events) == 0:
+            return
+        for listener in self._listeners:
+            listener.on_task_changes(events)
+
+    @staticmethod
+    def make_event(
+            task_id: TaskID,
+            previous_task: Optional[NormalizedTask],
+            task: Optional[NormalizedTask],
+    ) -> Optional[TaskChangeEvent]:
+        """
+        Returns None if the task did not change, e.g. when its file was read again
+        """
+        if previous_task is None and task is None:
+            return None
+        if previous_task is None:
+            return TaskChangeEvent(type="added", task_id=task_id, previous_task=None, task=task)
+        if task is None:
+            return TaskChangeEvent(
+                type="removed", task_id=task_id, previous_task=previous_task, task=None
+            )
+        if previous_task == task:
+            return None
+        if previous_task.date_finished is None and task.date_finished is not None:
+            return TaskChangeEvent(
+                type="finished", task_id=task_id, previous_task=previous_task, task=task
+            )
+        return TaskChangeEvent(
+            type="updated", task_id=task_id, previous_task=previous_task, task=task
+        )
@@ -0,0 +1,272 @@
+import dataclasses
+import threading
+from typing import Callable, Dict, Generic, List, Optional
+
+from business_logic.interfaces.task_change_listener import TaskChangeListener
+from business_logic.interfaces.task_getter import TaskGetter, T
+from business_logic.models.burn_down_forecastable_task import BurnDownForecastableTask
+from business_logic.models.date import Date
+from business_logic.models.task import Task
+from business_logic.models.velocity_trackable_task import VelocityTrackableTask
+from business_logic.normalized_task_store import NormalizedTask
+from business_logic.task_change_publisher import TaskChangePublisher
+from business_logic.utils import are_the_same_objects
+from business_logic.velocity_trackable_task_getter_proxy import (
+    VelocityTrackableTaskFlattener,
+)
+
+TaskID = str
+
+
+@dataclasses.dataclass
+class ProjectedTasks(Generic[T]):
+    tasks: List[T]
+    tasks_per_id: Dict[TaskID, T]
+    """
+    Also holds the matching sub-tasks, which are not part of tasks
+    """
+    source_tasks_per_id: Dict[TaskID, Task]
+    """
+    The task each task of tasks_per_id was projected from
+    """
+    open_tasks: List[T]
+    """
+    The tasks of tasks that are not finished
+    """
+
+
+@dataclasses.dataclass
+class TaskProjection:
+    """
+    The views of the dashboards on a single version of the tasks
+    """
+
+    version: int
+    velocity_trackable_tasks: ProjectedTasks[VelocityTrackableTask]
+    """
+    Every finished task, sub-tasks before their parent
+    """
+    burn_down_forecastable_tasks: ProjectedTasks[BurnDownForecastableTask]
+    """
+    The open top level tasks
+    """
+    open_tasks: ProjectedTasks[Task]
+    """
+    The open top level tasks
+    """
+
+
+class TaskProjector:
+    """
+    Walks the tasks of the given task getter once and projects the velocity and
+    the burn down view from the same walk. The projection is only rebuilt when the
+    task getter returns other tasks, so every view of a version agrees with the others.
+    Task getters telling their data generation are not even asked for their tasks
+    while the generation stays the same. Every projection loads all tasks, so it
+    is meant for task getters answering the queries by filtering all their tasks
+    anyway. Task getters with indexes should be queried through the proxies instead.
+    The changes between two projections are published to the subscribed listeners
+    while the projection is rebuilt, so they follow the same version of the tasks
+    as the views.
+    """
+
+    _projection: Optional[TaskProjection]
+    _projected_root_tasks: List[Task]
+    _projected_data_generation: Optional[int]
+    _projected_tasks_per_id: Dict[TaskID, Task]
+
+    def __init__(self, task_getter: TaskGetter[Task]):
+        self._task_getter = task_getter
+        self._projection = None
+        self._projected_root_tasks = []
+        self._projected_data_generation = None
+        self._projected_tasks_per_id = {}
+        self._task_change_publisher = TaskChangePublisher()
+        self._lock = threading.Lock()
+
+    def get_projection(self) -> TaskProjection:
+        with self._lock:
+            data_generation = self._task_getter.get_data_generation()
+            if (
+                self._projection is not None
+                and data_generation is not None
+                and data_generation == self._projected_data_generation
+            ):
+                return self._projection
+            root_tasks = self._task_getter.get_tasks()
+            if self._projection is None or not are_the_same_objects(
+                root_tasks, self._projected_root_tasks
+            ):
+                self._projection = self._project(
+                    root_tasks,
+                    version=self._projection.version + 1 if self._projection is not None else 0,
+                )
+                self._projected_root_tasks = list(root_tasks)
+                self._publish_task_changes(self._projection)
+            # read before the tasks, a change in between only causes one more rebuild check
+            self._projected_data_generation = data_generation
+            return self._projection
+
+    def subscribe_to_task_changes(self, listener: TaskChangeListener) -> None:
+        """
+        The listener is told about the tasks of the current projection as added
+        tasks first, then about the changes of every following projection
+        """
+        with self._lock:
+            self._task_change_publisher.subscribe(
+                listener,
+                current_tasks=[
+                    self._to_normalized_task(task)
+                    for task in self._projected_tasks_per_id.values()
+                ],
+            )
+
+    def _publish_task_changes(self, projection: TaskProjection) -> None:
+        tasks_per_id = {
+            **projection.velocity_trackable_tasks.source_tasks_per_id,
+            **projection.open_tasks.source_tasks_per_id,
+        }
+        previous_tasks_per_id = self._projected_tasks_per_id
+        # unchanged tasks are the same objects, only the others are compared
+        previous_tasks_of_changed_tasks: Dict[TaskID, Optional[NormalizedTask]] = {
+            task_id: (
+                self._to_normalized_task(previous_tasks_per_id[task_id])
+                if task_id in previous_tasks_per_id
+                else None
+            )
+            for task_id, task in tasks_per_id.items()
+            if previous_tasks_per_id.get(task_id) is not task
+        }
+        for task_id in previous_tasks_per_id.keys() - tasks_per_id.keys():
+            previous_tasks_of_changed_tasks[task_id] = self._to_normalized_task(
+                previous_tasks_per_id[task_id]
+            )
+        self._projected_tasks_per_id = tasks_per_id
+        self._task_change_publisher.publish(
+            previous_tasks_of_changed_tasks,
+            get_task=lambda task_id: (
+                self._to_normalized_task(tasks_per_id[task_id])
+                if task_id in tasks_per_id
+                else None
+            ),
+        )
+
+    @staticmethod
+    def _to_normalized_task(task: Task) -> NormalizedTask:
+        return NormalizedTask(
+            id=task.id,
+            name=task.name,
+            description=task.description,
+            story_points=task.story_points,
+            assignees=task.assignees,
+            sub_task_ids=[sub_task.id for sub_task in task.sub_tasks],
+            date_started=task.date_started,
+            date_finished=task.date_finished,
+        )
+
+    @classmethod
+    def _project(cls, root_tasks: List[Task], version: int) -> TaskProjection:
+        velocity_trackable_tasks: List[VelocityTrackableTask] = []
+        burn_down_forecastable_tasks_per_id: Dict[TaskID, BurnDownForecastableTask] = {}
+        open_tasks_per_id: Dict[TaskID, Task] = {}
+        finished_tasks_per_id: Dict[TaskID, Task] = {}
+        for task in VelocityTrackableTaskFlattener.iterate_flattened_tasks(root_tasks):
+            if task.date_finished is not None:
+                finished_tasks_per_id[task.id] = task
+                velocity_trackable_tasks.append(
+                    VelocityTrackableTask(
+                        id=task.id,
+                        story_points=task.story_points,
+                        assignees=task.assignees,
+                        date_started=task.date_started,
+                        date_finished=task.date_finished,
+                    )
+                )
+            else:
+                open_tasks_per_id[task.id] = task
+                burn_down_forecastable_tasks_per_id[task.id] = BurnDownForecastableTask(
+                    id=task.id,
+                    story_points=task.story_points,
+                    date_started=task.date_started,
+                )
+        open_root_tasks = [task for task in root_tasks if task.date_finished is None]
+        open_root_burn_down_forecastable_tasks = [
+            burn_down_forecastable_tasks_per_id[task.id] for task in open_root_tasks
+        ]
+        return TaskProjection(
+            version=version,
+            velocity_trackable_tasks=ProjectedTasks(
+                tasks=velocity_trackable_tasks,
+                tasks_per_id={task.id: task for task in velocity_trackable_tasks},
+                source_tasks_per_id=finished_tasks_per_id,
+                open_tasks=[],
+            ),
+            burn_down_forecastable_tasks=ProjectedTasks(
+                tasks=open_root_burn_down_forecastable_tasks,
+                tasks_per_id=burn_down_forecastable_tasks_per_id,
+                source_tasks_per_id=open_tasks_per_id,
+                open_tasks=open_root_burn_down_forecastable_tasks,
+            ),
+            open_tasks=ProjectedTasks(
+                tasks=open_root_tasks,
+                tasks_per_id=open_tasks_per_id,
+                source_tasks_per_id=open_tasks_per_id,
+                open_tasks=open_root_tasks,
+            ),
+        )
+
+
+class ProjectedTaskGetter(TaskGetter[T]):
+    """
+    Serves one view of the TaskProjector, e.g.:
+    ProjectedTaskGetter(task_projector, lambda projection: projection.open_tasks)
+    The queries are answered from the view, filtered by the tasks it was projected from.
+    """
+
+    def __init__(
+            self,
+            task_projector: TaskProjector,
+            get_projected_tasks: Callable[[TaskProjection], ProjectedTasks[T]],
+    ):
+        self._task_projector = task_projector
+        self._get_projected_tasks = get_projected_tasks
+
+    def get_task_by_id(self, task_id: str) -> Optional[T]:
+        return self._get_view().tasks_per_id.get(task_id)
+
+    def get_tasks(self) -> List[T]:
+        return self._get_view().tasks
+
+    def get_tasks_finished_since(self, date: Date) -> List[T]:
+        view = self._get_view()
+        return [
+            task
+            for task_id, task in view.tasks_per_id.items()
+            if view.source_tasks_per_id[task_id].date_finished is not None
+            and view.source_tasks_per_id[task_id].date_finished >= date
+        ]
+
+    def get_open_tasks(self) -> List[T]:
+        return self._get_view().open_tasks
+
+    def get_tasks_of_assignee(self, assignee: str) -> List[T]:
+        view = self._get_view()
+        return [
+            task
+            for task_id, task in view.tasks_per_id.items()
+            if assignee in view.source_tasks_per_id[task_id].assignees
+        ]
+
+    def get_tasks_by_ids(self, task_ids: List[str]) -> Dict[str, T]:
+        tasks_per_id = self._get_view().tasks_per_id
+        return {
+            task_id: tasks_per_id[task_id]
+            for task_id in task_ids
+            if task_id in tasks_per_id
+        }
+
+    def get_data_generation(self) -> int:
+        return self._task_projector.get_projection().version
+
+    def _get_view(self) -> ProjectedTasks[T]:
+        return self._get_projected_tasks(self._task_projector.get_projection())
@@ -0,0 +1,132 @@
+import dataclasses
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from business_logic.models.date import Date
+from business_logic.normalized_task_store import NormalizedTask
+
+FileName = str
+
+
+@dataclasses.dataclass(frozen=True)
+class FileFingerprint:
+    """
+    A file is considered unchanged as long as its fingerprint stays the same
+    """
+
+    modification_time_in_ns: int
+    size_in_bytes: int
+    inode: int
+
+
+DirectorySnapshot = Dict[FileName, FileFingerprint]
+
+_SnapshotTask = Tuple[
+    str, str, str, float, List[str], List[str], int, Optional[int]
+]
+_SnapshotFile = Tuple[Tuple[int, int, int], List[_SnapshotTask]]
+
+
+class TaskStoreSnapshotFile:
+    """
+    Persists the normalized tasks of every read file together with the
+    fingerprint of the file, so a restarted server only has to parse the
+    files that changed since the snapshot was written.
+    The snapshot is a pickle file and must only be loaded from a trusted location.
+    """
+
+    _FORMAT_VERSION = 1
+
+    def __init__(self, path_to_snapshot: str):
+        self._path_to_snapshot = Path(path_to_snapshot)
+
+    def load(self) -> Dict[FileName, Tuple[FileFingerprint, List[NormalizedTask]]]:
+        if not self._path_to_snapshot.is_file():
+            return {}
+        try:
+            with open(self._path_to_snapshot, "rb") as reader:
+                format_version, snapshot_files = pickle.load(reader)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            return {}
+        if format_version != self._FORMAT_VERSION:
+            return {}
+        return {
+            file_name: (
+                FileFingerprint(*fingerprint),
+                [self._to_normalized_task(task) for task in tasks],
+            )
+            for file_name, (fingerprint, tasks) in snapshot_files.items()
+        }
+
+    def save(
+            self,
+            directory_snapshot: DirectorySnapshot,
+            tasks_per_file: Dict[FileName, List[NormalizedTask]],
+    ) -> None:
+        snapshot_files: Dict[FileName, _SnapshotFile] = {
+            file_name: (
+                dataclasses.astuple(fingerprint),
+                [
+                    self._to_snapshot_task(task)
+                    for task in tasks_per_file.get(file_name, [])
+                ],
+            )
+            for file_name, fingerprint in directory_snapshot.items()
+        }
+        # write to a temporary file first, so a crash never leaves a broken snapshot behind
+        temporary_path = self._path_to_snapshot.with_name(
+            self._path_to_snapshot.name + ".tmp"
+        )
+        with open(temporary_path, "wb") as writer:
+            pickle.dump(
+                (self._FORMAT_VERSION, snapshot_files),
+                writer,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temporary_path, self._path_to_snapshot)
+
+    @staticmethod
+    def _to_snapshot_task(task: NormalizedTask) -> _SnapshotTask:
+        return (
+            task.id,
+            task.name,
+            task.description,
+            task.story_points,
+            task.assignees,
+            task.sub_task_ids,
+            task.date_started.to_ordinal(),
+            (
+                task.date_finished.to_ordinal()
+                if task.date_finished is not None
+                else None
+            ),
+        )
+
+    @staticmethod
+    def _to_normalized_task(task: _SnapshotTask) -> NormalizedTask:
+        (
+            task_id,
+            name,
+            description,
+            story_points,
+            assignees,
+            sub_task_ids,
+            date_started,
+            date_finished,
+        ) = task
+        return NormalizedTask(
+            id=task_id,
+            name=name,
+            description=description,
+            story_points=story_points,
+            assignees=assignees,
+            sub_task_ids=sub_task_ids,
+            date_started=Date.from_ordinal(date_started),
+            date_finished=(
+                Date.from_ordinal(date_finished)
+                if date_finished is not None
+                else None
+            ),
+        )
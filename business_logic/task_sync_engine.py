@@ -0,0 +1,115 @@
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+from business_logic.errors import TaskSyncCursorNotAdvancedError
+from business_logic.interfaces.task_change_source import TaskChangeSource
+from business_logic.interfaces.task_getter import TaskGetter
+from business_logic.models.date import Date
+from business_logic.models.task import Task
+from business_logic.sqlite_task_getter import SQLiteTaskGetter
+
+logger = logging.getLogger(__name__)
+
+
+class TaskSyncEngine:
+    """
+    Pulls only the changes of a task source since the last sync into the local
+    task store. The cursor of the source is stored together with the changes,
+    so a sync costs as much as the number of changed tasks, not all tasks.
+    A source telling it has more changes without advancing its cursor would
+    be asked for the same changes forever, so the sync fails instead.
+    """
+
+    def __init__(
+            self,
+            source_name: str,
+            task_change_source: TaskChangeSource,
+            task_store: SQLiteTaskGetter,
+    ):
+        self._source_name = source_name
+        self._task_change_source = task_change_source
+        self._task_store = task_store
+
+    def sync(self) -> int:
+        """
+        Returns the number of changed and deleted tasks
+        """
+        number_of_changes = 0
+        cursor = self._task_store.get_sync_cursor(self._source_name)
+        while True:
+            change_set = self._task_change_source.get_changes_since(cursor)
+            self._task_store.apply_task_changes(self._source_name, change_set)
+            number_of_changes += len(change_set.changed_tasks) + len(
+                change_set.deleted_task_ids
+            )
+            if not change_set.has_more:
+                return number_of_changes
+            if change_set.cursor is None or change_set.cursor == cursor:
+                raise TaskSyncCursorNotAdvancedError(self._source_name, cursor)
+            cursor = change_set.cursor
+
+
+class SyncingTaskGetter(TaskGetter[Task]):
+    """
+    Serves the tasks from the local task store and syncs it with the task
+    source before a call, at most once every min_seconds_between_syncs.
+    Concurrent calls wait for the running sync instead of starting another one.
+    A failed sync is logged and the stored tasks are served, the sync is tried
+    again once min_seconds_between_syncs passed.
+    """
+
+    def __init__(
+            self,
+            task_sync_engine: TaskSyncEngine,
+            task_store: SQLiteTaskGetter,
+            min_seconds_between_syncs: float = 0,
+    ):
+        self._task_sync_engine = task_sync_engine
+        self._task_store = task_store
+        self._min_seconds_between_syncs = min_seconds_between_syncs
+        self._last_sync: Optional[float] = None
+        self._sync_lock = threading.Lock()
+
+    def get_task_by_id(self, task_id: str) -> Optional[Task]:
+        self._sync_if_due()
+        return self._task_store.get_task_by_id(task_id)
+
+    def get_tasks(self) -> List[Task]:
+        self._sync_if_due()
+        return self._task_store.get_tasks()
+
+    def get_tasks_finished_since(self, date: Date) -> List[Task]:
+        self._sync_if_due()
+        return self._task_store.get_tasks_finished_since(date)
+
+    def get_open_tasks(self) -> List[Task]:
+        self._sync_if_due()
+        return self._task_store.get_open_tasks()
+
+    def get_tasks_of_assignee(self, assignee: str) -> List[Task]:
+        self._sync_if_due()
+        return self._task_store.get_tasks_of_assignee(assignee)
+
+    def get_tasks_by_ids(self, task_ids: List[str]) -> Dict[str, Task]:
+        self._sync_if_due()
+        return self._task_store.get_tasks_by_ids(task_ids)
+
+    def get_data_generation(self) -> int:
+        self._sync_if_due()
+        return self._task_store.get_data_generation()
+
+    def _sync_if_due(self) -> None:
+        with self._sync_lock:
+            now = time.monotonic()
+            if (
+                self._last_sync is not None
+                and now - self._last_sync < self._min_seconds_between_syncs
+            ):
+                return
+            self._last_sync = now
+            try:
+                self._task_sync_engine.sync()
+            except Exception:
+                logger.exception("The task sync failed, the stored tasks are served")
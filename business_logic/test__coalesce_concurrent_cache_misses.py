@@ -0,0 +1,67 @@
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+import pytest
+
+from business_logic.caching_task_getter import CachingTaskGetter
+from business_logic.models.task import Task
+from business_logic.testing_utils import CountingTaskGetter, FakeClock, make_task
+from business_logic.ttl_cache import MonotonicTTLCache
+
+NUMBER_OF_CONCURRENT_REQUESTS = 8
+
+
+@dataclasses.dataclass
+class CoalesceConcurrentCacheMissesTestCase:
+    message: str
+    given_lookup: Callable[[CachingTaskGetter[Task]], object]
+    get_number_of_calls: Callable[[CountingTaskGetter], int]
+
+
+test_cases: List[CoalesceConcurrentCacheMissesTestCase] = [
+    CoalesceConcurrentCacheMissesTestCase(
+        message="Given concurrent misses of all tasks, "
+        "when the tasks are fetched then the task getter is called once per expiry",
+        given_lookup=lambda caching_task_getter: caching_task_getter.get_tasks(),
+        get_number_of_calls=lambda task_getter: task_getter.number_of_get_tasks_calls,
+    ),
+    CoalesceConcurrentCacheMissesTestCase(
+        message="Given concurrent misses of the same task, "
+        "when the task is fetched then the task getter is called once per expiry",
+        given_lookup=lambda caching_task_getter: caching_task_getter.get_task_by_id("1"),
+        get_number_of_calls=lambda task_getter: task_getter.number_of_single_lookups,
+    ),
+]
+
+
+@pytest.mark.parametrize("test_case", test_cases, ids=[each.message for each in test_cases])
+def test__concurrent_misses_call_the_task_getter_once_per_expiry(
+    test_case: CoalesceConcurrentCacheMissesTestCase,
+) -> None:
+    clock = FakeClock()
+    task_getter = CountingTaskGetter([make_task("1")])
+    caching_task_getter = CachingTaskGetter(
+        task_getter=task_getter,
+        task_cache=MonotonicTTLCache(cache_life_time_in_seconds=30, clock=clock),
+        tasks_cache=MonotonicTTLCache(cache_life_time_in_seconds=45, clock=clock),
+    )
+    with ThreadPoolExecutor(max_workers=NUMBER_OF_CONCURRENT_REQUESTS) as executor:
+        for expiry in range(2):
+            clock.now = expiry * 60
+            task_getter.is_called.clear()
+            task_getter.is_unblocked.clear()
+            leading_lookup = executor.submit(test_case.given_lookup, caching_task_getter)
+            # the other lookups start while the first one waits for the task getter,
+            # those running after it finished hit the cache
+            task_getter.is_called.wait()
+            following_lookups = [
+                executor.submit(test_case.given_lookup, caching_task_getter)
+                for _ in range(NUMBER_OF_CONCURRENT_REQUESTS - 1)
+            ]
+            task_getter.is_unblocked.set()
+            for lookup in [leading_lookup, *following_lookups]:
+                assert lookup.result() is not None, test_case.message
+            assert test_case.get_number_of_calls(task_getter) == expiry + 1, (
+                test_case.message
+            )
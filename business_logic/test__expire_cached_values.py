@@ -0,0 +1,174 @@
+import dataclasses
+from typing import Callable, List, Optional
+
+import pytest
+
+from business_logic.caching_task_getter import Cache, CacheUtils, TaskCache
+from business_logic.testing_utils import FakeClock, make_task
+from business_logic.ttl_cache import (
+    CacheStatistics,
+    LRUTTLCache,
+    MonotonicTTLCache,
+    estimate_size_in_bytes,
+)
+
+
+@dataclasses.dataclass
+class ExpireCachedValuesTestCase:
+    message: str
+    given_seconds_since_the_value_was_added: float
+    expected_value: Optional[str]
+
+
+expire_test_cases: List[ExpireCachedValuesTestCase] = [
+    ExpireCachedValuesTestCase(
+        message="Given a value that was just added, when looked up then it is returned",
+        given_seconds_since_the_value_was_added=0,
+        expected_value="Task 1",
+    ),
+    ExpireCachedValuesTestCase(
+        message="Given a value right before the end of its life time, "
+        "when looked up then it is returned",
+        given_seconds_since_the_value_was_added=29.9,
+        expected_value="Task 1",
+    ),
+    ExpireCachedValuesTestCase(
+        message="Given a value at the end of its life time, "
+        "when looked up then it is expired",
+        given_seconds_since_the_value_was_added=30,
+        expected_value=None,
+    ),
+]
+
+
+def _make_monotonic_ttl_cache(clock: FakeClock) -> Cache[str, str]:
+    return MonotonicTTLCache(cache_life_time_in_seconds=30, clock=clock)
+
+
+def _make_lru_ttl_cache(clock: FakeClock) -> Cache[str, str]:
+    return LRUTTLCache(
+        cache_life_time_in_seconds=30,
+        max_entries=10,
+        max_size_in_bytes=1000,
+        size_of=len,
+        clock=clock,
+    )
+
+
+@pytest.mark.parametrize("make_cache", [_make_monotonic_ttl_cache, _make_lru_ttl_cache])
+@pytest.mark.parametrize(
+    "test_case", expire_test_cases, ids=[each.message for each in expire_test_cases]
+)
+def test__values_are_cached_for_their_life_time(
+    test_case: ExpireCachedValuesTestCase,
+    make_cache: Callable[[FakeClock], Cache[str, str]],
+) -> None:
+    clock = FakeClock()
+    cache = make_cache(clock)
+    cache.add("1", "Task 1")
+    clock.now = test_case.given_seconds_since_the_value_was_added
+    assert cache.has("1") == (test_case.expected_value is not None), test_case.message
+    assert cache.get("1") == test_case.expected_value, test_case.message
+
+
+def test__expired_values_are_swept_out_while_values_are_added() -> None:
+    clock = FakeClock()
+    cache: MonotonicTTLCache[str, str] = MonotonicTTLCache(
+        cache_life_time_in_seconds=30, clock=clock
+    )
+    for key in ("1", "2", "3"):
+        cache.add(key, f"Task {key}")
+    clock.now = 31
+    cache.add("4", "Task 4")
+    assert len(cache) == 1, "Only the value added after the expiration is kept"
+
+
+def test__fresh_values_of_the_task_cache_are_not_expired() -> None:
+    cache: TaskCache[str] = TaskCache(cache_utils=CacheUtils(), cache_life_time_in_seconds=30)
+    cache.add("1", "Task 1")
+    assert cache.get("1") == "Task 1", "A value is not expired right after it was added"
+
+
+@dataclasses.dataclass
+class EvictCachedValuesTestCase:
+    message: str
+    given_max_entries: int
+    given_max_size_in_bytes: int
+    given_added_keys_and_looked_up_keys: List[str]
+    """
+    Keys starting with "get:" are looked up, the others are added
+    """
+    expected_keys: List[str]
+    expected_statistics: CacheStatistics
+
+
+evict_test_cases: List[EvictCachedValuesTestCase] = [
+    EvictCachedValuesTestCase(
+        message="Given more values than max entries, "
+        "when added then the least recently used values are evicted",
+        given_max_entries=2,
+        given_max_size_in_bytes=1000,
+        given_added_keys_and_looked_up_keys=["1", "2", "get:1", "3", "get:2"],
+        expected_keys=["1", "3"],
+        expected_statistics=CacheStatistics(hits=1, misses=1, evictions=1),
+    ),
+    EvictCachedValuesTestCase(
+        message="Given more bytes than the byte budget, "
+        "when added then the oldest values are evicted",
+        given_max_entries=100,
+        given_max_size_in_bytes=12,
+        given_added_keys_and_looked_up_keys=["1", "2", "3"],
+        expected_keys=["2", "3"],
+        expected_statistics=CacheStatistics(hits=0, misses=0, evictions=1),
+    ),
+    EvictCachedValuesTestCase(
+        message="Given a single value above the byte budget, "
+        "when added then it is kept",
+        given_max_entries=100,
+        given_max_size_in_bytes=5,
+        given_added_keys_and_looked_up_keys=["1", "get:1"],
+        expected_keys=["1"],
+        expected_statistics=CacheStatistics(hits=1, misses=0, evictions=0),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "test_case", evict_test_cases, ids=[each.message for each in evict_test_cases]
+)
+def test__values_are_evicted_to_stay_within_the_limits(
+    test_case: EvictCachedValuesTestCase,
+) -> None:
+    # every value is 6 bytes long
+    cache: LRUTTLCache[str, str] = LRUTTLCache(
+        cache_life_time_in_seconds=30,
+        max_entries=test_case.given_max_entries,
+        max_size_in_bytes=test_case.given_max_size_in_bytes,
+        size_of=len,
+    )
+    for key in test_case.given_added_keys_and_looked_up_keys:
+        if key.startswith("get:"):
+            cache.get(key[len("get:"):])
+        else:
+            cache.add(key, f"Task {key}")
+    keys = [
+        key
+        for key in test_case.given_added_keys_and_looked_up_keys
+        if not key.startswith("get:") and cache.has(key)
+    ]
+    assert keys == test_case.expected_keys, test_case.message
+    assert cache.size_in_bytes == 6 * len(keys), test_case.message
+    assert cache.statistics == test_case.expected_statistics, test_case.message
+
+
+def test__the_size_of_nested_values_is_estimated() -> None:
+    task = make_task("1")
+    task_with_sub_task = make_task("1", sub_tasks=[make_task("2", sub_tasks=[make_task("3")])])
+    assert estimate_size_in_bytes(task_with_sub_task) > estimate_size_in_bytes(task), (
+        "The sub-tasks of sub-tasks are counted"
+    )
+    assert estimate_size_in_bytes([task, task]) == estimate_size_in_bytes(
+        [task]
+    ) + estimate_size_in_bytes([None, None]) - estimate_size_in_bytes([None]), (
+        "An object held twice is counted once"
+    )
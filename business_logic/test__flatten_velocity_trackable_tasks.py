@@ -0,0 +1,47 @@
+from typing import List
+
+from business_logic.models.date import Date
+from business_logic.models.task import Task
+from business_logic.testing_utils import CountingTaskGetter, make_task
+from business_logic.velocity_trackable_task_getter_proxy import (
+    VelocityTrackableTaskGetterProxy,
+)
+
+
+def _make_finished_task(task_id: str, sub_tasks: List[Task]) -> Task:
+    return make_task(task_id, sub_tasks, date_finished=Date(2020, 5, 20))
+
+
+def test__sub_tasks_are_flattened_before_their_parent() -> None:
+    task_getter = CountingTaskGetter(
+        [
+            _make_finished_task(
+                "1",
+                [
+                    _make_finished_task("1.1", [_make_finished_task("1.1.1", [])]),
+                    _make_finished_task("1.2", []),
+                ],
+            ),
+            _make_finished_task("2", []),
+        ]
+    )
+    tasks = VelocityTrackableTaskGetterProxy(task_getter).get_tasks()
+    assert [task.id for task in tasks] == ["1.1.1", "1.1", "1.2", "1", "2"]
+
+
+def test__deep_task_trees_are_flattened() -> None:
+    task = _make_finished_task("0", [])
+    for depth in range(1, 10_000):
+        task = _make_finished_task(str(depth), [task])
+    tasks = VelocityTrackableTaskGetterProxy(CountingTaskGetter([task])).get_tasks()
+    assert len(tasks) == 10_000
+
+
+def test__unchanged_tasks_are_not_flattened_again() -> None:
+    task_getter = CountingTaskGetter([_make_finished_task("1", [])])
+    proxy = VelocityTrackableTaskGetterProxy(task_getter)
+    tasks = proxy.get_tasks()
+    assert proxy.get_tasks() is tasks
+
+    task_getter.tasks = [_make_finished_task("1", [])]
+    assert proxy.get_tasks() is not tasks
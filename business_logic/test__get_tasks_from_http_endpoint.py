@@ -0,0 +1,156 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List
+
+import pytest
+
+from business_logic.http_task_getter import HTTPTaskGetter
+from business_logic.testing_utils import FakeClock
+
+ENTITY_TAG = '"tasks-v1"'
+LAST_MODIFIED = "Sun, 17 May 2020 10:00:00 GMT"
+TASKS = {
+    "tasks": [
+        {
+            "id": "1",
+            "title": "Task 1",
+            "description": "",
+            "story_points": 3,
+            "assignees": ["Dave"],
+            "sub_tasks": [
+                {
+                    "id": "1.1",
+                    "title": "Task 1.1",
+                    "description": "",
+                    "story_points": 2,
+                    "assignees": ["Dave"],
+                    "sub_tasks": [],
+                    "date_started": "2020-05-17",
+                    "date_finished": "2020-05-20",
+                }
+            ],
+            "date_started": "2020-05-17",
+            "date_finished": None,
+        }
+    ]
+}
+
+
+class _EndpointStubServer(ThreadingHTTPServer):
+    is_failing: bool
+    response_statuses: List[int]
+    requested_paths: List[str]
+
+
+class _EndpointStubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _EndpointStubServer
+
+    def do_GET(self) -> None:
+        self.server.requested_paths.append(self.path)
+        if self.server.is_failing:
+            self.server.response_statuses.append(500)
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == ENTITY_TAG:
+            self.server.response_statuses.append(304)
+            self.send_response(304)
+            self.send_header("ETag", ENTITY_TAG)
+            self.end_headers()
+            return
+        body = gzip.compress(json.dumps(TASKS).encode("utf-8"))
+        self.server.response_statuses.append(200)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", ENTITY_TAG)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def endpoint_stub_server() -> Iterator[_EndpointStubServer]:
+    server = _EndpointStubServer(("127.0.0.1", 0), _EndpointStubRequestHandler)
+    server.is_failing = False
+    server.response_statuses = []
+    server.requested_paths = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test__unchanged_tasks_are_not_downloaded_again(
+    endpoint_stub_server: _EndpointStubServer,
+) -> None:
+    task_getter = HTTPTaskGetter(
+        f"http://127.0.0.1:{endpoint_stub_server.server_port}/tasks?team=a"
+    )
+    tasks = task_getter.get_tasks()
+    assert [task.id for task in tasks] == ["1"]
+    assert [task.id for task in tasks[0].sub_tasks] == ["1.1"]
+
+    assert task_getter.get_tasks() is tasks
+    sub_task = task_getter.get_task_by_id("1.1")
+    assert sub_task is not None and sub_task.story_points == 2
+    assert endpoint_stub_server.response_statuses == [200, 304, 304]
+    assert endpoint_stub_server.requested_paths[0] == "/tasks?team=a"
+
+
+def test__the_endpoint_is_revalidated_at_most_once_per_interval(
+    endpoint_stub_server: _EndpointStubServer,
+) -> None:
+    clock = FakeClock()
+    task_getter = HTTPTaskGetter(
+        f"http://127.0.0.1:{endpoint_stub_server.server_port}/tasks",
+        min_seconds_between_revalidations=30,
+        clock=clock,
+    )
+    data_generation = task_getter.get_data_generation()
+    for seconds in (0, 10, 29.9):
+        clock.now = seconds
+        assert task_getter.get_data_generation() == data_generation
+        assert task_getter.get_task_by_id("1.1") is not None
+        assert list(task_getter.get_tasks_by_ids(["1", "2"]).keys()) == ["1"]
+    assert endpoint_stub_server.response_statuses == [200]
+
+    clock.now = 30
+    assert task_getter.get_data_generation() == data_generation, (
+        "An unchanged ETag keeps the data generation"
+    )
+    assert endpoint_stub_server.response_statuses == [200, 304]
+
+
+def test__the_last_fetched_tasks_are_served_until_the_endpoint_recovers(
+    endpoint_stub_server: _EndpointStubServer,
+) -> None:
+    clock = FakeClock()
+    task_getter = HTTPTaskGetter(
+        f"http://127.0.0.1:{endpoint_stub_server.server_port}/tasks",
+        min_seconds_between_revalidations=30,
+        clock=clock,
+    )
+    tasks = task_getter.get_tasks()
+
+    endpoint_stub_server.is_failing = True
+    for seconds in (30, 40, 59.9):
+        clock.now = seconds
+        assert task_getter.get_tasks() is tasks
+    assert endpoint_stub_server.response_statuses == [200, 500], (
+        "A failed revalidation is not retried before the next interval"
+    )
+
+    endpoint_stub_server.is_failing = False
+    clock.now = 60
+    assert task_getter.get_tasks() is tasks
+    assert endpoint_stub_server.response_statuses == [200, 500, 304]
@@ -0,0 +1,195 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Set
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import pytest
+
+from business_logic.jira_task_getter import JiraTaskGetter
+from business_logic.models.date import Date
+
+MAX_RESULTS_PER_PAGE = 50
+
+
+def _make_issue(key: str, parent_key: str = "") -> Dict[str, Any]:
+    return {
+        "key": key,
+        "fields": {
+            "summary": f"Issue {key}",
+            "description": None,
+            "assignee": {"displayName": "Dave"},
+            "created": "2020-05-17T10:20:30.000+0100",
+            "resolutiondate": "2020-05-20T08:00:00.000+0100" if parent_key else None,
+            "parent": {"key": parent_key} if parent_key else None,
+            "subtasks": [],
+            "customfield_10016": 3,
+        },
+    }
+
+
+ISSUES = [
+    *[_make_issue(f"AK-{index}") for index in range(120)],
+    *[_make_issue(f"AK-{index}.1", parent_key=f"AK-{index}") for index in range(10)],
+]
+
+
+ISSUES_PER_KEY = {issue["key"]: issue for issue in ISSUES}
+
+
+class _JiraStubServer(ThreadingHTTPServer):
+    requested_fields: Set[str]
+    requested_paths: List[str]
+    client_ports: Set[int]
+
+
+class _JiraStubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _JiraStubServer
+
+    def do_GET(self) -> None:
+        split_path = urlsplit(self.path)
+        query = parse_qs(split_path.query)
+        self.server.requested_fields.update(query["fields"][0].split(","))
+        self.server.requested_paths.append(split_path.path)
+        self.server.client_ports.add(self.client_address[1])
+        if split_path.path.startswith("/rest/api/2/issue/"):
+            issue = ISSUES_PER_KEY.get(unquote(split_path.path.rsplit("/", 1)[1]))
+            if issue is None:
+                self._send_json(404, {"errorMessages": ["Issue does not exist"]})
+            else:
+                self._send_json(200, issue)
+            return
+        # the stub only knows the queries "project = AK" and "parent in (...)"
+        parent_keys = re.findall(r'"([^"]+)"', query["jql"][0])
+        issues = [
+            issue
+            for issue in ISSUES
+            if len(parent_keys) == 0
+            or (
+                issue["fields"]["parent"] is not None
+                and issue["fields"]["parent"]["key"] in parent_keys
+            )
+        ]
+        start_at = int(query["startAt"][0])
+        max_results = min(int(query["maxResults"][0]), MAX_RESULTS_PER_PAGE)
+        self._send_json(
+            200,
+            {
+                "startAt": start_at,
+                "maxResults": max_results,
+                "total": len(issues),
+                "issues": issues[start_at:start_at + max_results],
+            },
+        )
+
+    def _send_json(self, status: int, value: object) -> None:
+        body = json.dumps(value).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def jira_stub_server() -> Iterator[_JiraStubServer]:
+    server = _JiraStubServer(("127.0.0.1", 0), _JiraStubRequestHandler)
+    server.requested_fields = set()
+    server.requested_paths = []
+    server.client_ports = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _make_task_getter(jira_stub_server: _JiraStubServer) -> JiraTaskGetter:
+    return JiraTaskGetter(
+        url=f"http://127.0.0.1:{jira_stub_server.server_port}",
+        email="dave@example.com",
+        api_token="token",
+        jql="project = AK",
+    )
+
+
+def _get_task_ids(task_getter: JiraTaskGetter) -> List[str]:
+    return [task.id for task in task_getter.get_tasks()]
+
+
+def test__all_pages_are_read_over_pooled_connections(
+    jira_stub_server: _JiraStubServer,
+) -> None:
+    task_getter = JiraTaskGetter(
+        url=f"http://127.0.0.1:{jira_stub_server.server_port}",
+        email="dave@example.com",
+        api_token="token",
+        jql="project = AK",
+        max_concurrent_requests=2,
+    )
+    assert _get_task_ids(task_getter) == [f"AK-{index}" for index in range(120)]
+    assert _get_task_ids(task_getter) == [f"AK-{index}" for index in range(120)]
+    # 6 pages were requested over at most 2 connections
+    assert len(jira_stub_server.client_ports) <= 2
+    assert "customfield_10016" in jira_stub_server.requested_fields
+    assert "comment" not in jira_stub_server.requested_fields
+
+
+def test__sub_tasks_are_linked_to_their_parent(
+    jira_stub_server: _JiraStubServer,
+) -> None:
+    task_getter = _make_task_getter(jira_stub_server)
+    task = task_getter.get_task_by_id("AK-3")
+    assert task is not None
+    assert [sub_task.id for sub_task in task.sub_tasks] == ["AK-3.1"]
+    assert task.sub_tasks[0].date_finished == Date(2020, 5, 20)
+    assert task.description == ""
+    assert task.story_points == 3
+
+
+def test__a_task_is_requested_by_its_key_without_a_search_of_all_issues(
+    jira_stub_server: _JiraStubServer,
+) -> None:
+    task_getter = _make_task_getter(jira_stub_server)
+    task = task_getter.get_task_by_id("AK-3")
+    assert task is not None
+    assert jira_stub_server.requested_paths == [
+        "/rest/api/2/issue/AK-3",
+        "/rest/api/2/search",
+        "/rest/api/2/search",
+    ], "The issue, its sub-tasks and theirs are requested"
+    assert task_getter.get_task_by_id("AK-unknown") is None
+
+
+def test__a_task_of_the_last_search_is_not_requested_again(
+    jira_stub_server: _JiraStubServer,
+) -> None:
+    task_getter = _make_task_getter(jira_stub_server)
+    task_getter.get_tasks()
+    number_of_requests = len(jira_stub_server.requested_paths)
+    task = task_getter.get_task_by_id("AK-3.1")
+    assert task is not None and task.date_finished == Date(2020, 5, 20)
+    assert len(jira_stub_server.requested_paths) == number_of_requests
+
+
+def test__deep_issue_trees_are_linked_without_recursion() -> None:
+    depth = 5000
+    task_getter = JiraTaskGetter(
+        url="http://127.0.0.1", email="dave@example.com", api_token="token", jql=""
+    )
+    tasks = task_getter._to_tasks(
+        [
+            _make_issue(f"AK-{level}", parent_key=f"AK-{level - 1}" if level > 0 else "")
+            for level in range(depth)
+        ]
+    )
+    assert [task.id for task in tasks] == ["AK-0"]
+    task = tasks[0]
+    for _ in range(depth - 1):
+        task = task.sub_tasks[0]
+    assert task.id == f"AK-{depth - 1}" and task.sub_tasks == []
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+from typing import List, Optional
+
+from business_logic.caching_task_getter import (
+    CacheUtils,
+    CachingTaskGetter,
+    TaskCache,
+    TasksCache,
+)
+from business_logic.filtering_task_getter import FilteringTaskGetter
+from business_logic.models.date import Date
+from business_logic.models.task import Task
+from business_logic.thread_pool_task_getter_adapter import ThreadPoolTaskGetterAdapter
+from business_logic.velocity_trackable_task_getter_proxy import (
+    VelocityTrackableTaskGetterProxy,
+)
+
+TASKS = [
+    Task(
+        id="1",
+        name="Task",
+        description="",
+        story_points=3,
+        assignees=["Dave"],
+        sub_tasks=[],
+        date_started=Date(2020, 5, 17),
+        date_finished=Date(2020, 5, 20),
+    )
+]
+
+
+class _BlockingTaskGetter(FilteringTaskGetter):
+    def __init__(self) -> None:
+        self.unblock = threading.Event()
+        self.was_unblocked = False
+
+    def get_task_by_id(self, task_id: str) -> Optional[Task]:
+        self.was_unblocked = self.unblock.wait(timeout=1)
+        return next((task for task in TASKS if task.id == task_id), None)
+
+    def get_tasks(self) -> List[Task]:
+        self.was_unblocked = self.unblock.wait(timeout=1)
+        return TASKS
+
+
+def test__the_event_loop_keeps_running_while_tasks_are_read() -> None:
+    task_getter = _BlockingTaskGetter()
+    async_task_getter = ThreadPoolTaskGetterAdapter(
+        task_getter=VelocityTrackableTaskGetterProxy(
+            task_getter=CachingTaskGetter(
+                task_getter=task_getter,
+                task_cache=TaskCache(cache_utils=CacheUtils(), cache_life_time_in_seconds=30),
+                tasks_cache=TasksCache(
+                    cache_utils=CacheUtils(), cache_life_time_in_seconds=30
+                ),
+            )
+        )
+    )
+
+    async def unblock_task_getter_from_the_event_loop() -> None:
+        await asyncio.sleep(0.01)
+        task_getter.unblock.set()
+
+    async def run() -> List[str]:
+        tasks, _ = await asyncio.gather(
+            async_task_getter.get_tasks_finished_since(Date(2020, 5, 18)),
+            unblock_task_getter_from_the_event_loop(),
+        )
+        return [task.id for task in tasks]
+
+    assert asyncio.run(run()) == ["1"]
+    # a blocked event loop could not have unblocked the task getter in time
+    assert task_getter.was_unblocked
@@ -0,0 +1,42 @@
+from typing import List
+
+from business_logic.normalized_task_store import NormalizedTaskStore
+from business_logic.testing_utils import make_normalized_task
+
+
+def _get_root_task_ids(store: NormalizedTaskStore) -> List[str]:
+    return [task.id for task in store.get_root_tasks()]
+
+
+def test__sub_tasks_are_no_root_tasks() -> None:
+    store = NormalizedTaskStore()
+    store.add_tasks_of_file(
+        "a.json",
+        [
+            make_normalized_task("2", sub_task_ids=[]),
+            make_normalized_task("1", sub_task_ids=["2"]),
+        ],
+    )
+    assert _get_root_task_ids(store) == ["1"]
+    assert store.get_sub_task_ids("1") == ["2"]
+    assert store.get_parent_task_ids("2") == {"1"}
+
+
+def test__sub_tasks_become_root_tasks_when_their_parent_is_retracted() -> None:
+    store = NormalizedTaskStore()
+    store.add_tasks_of_file("a.json", [make_normalized_task("2", sub_task_ids=[])])
+    store.add_tasks_of_file("b.json", [make_normalized_task("1", sub_task_ids=["2"])])
+    assert _get_root_task_ids(store) == ["1"]
+
+    store.retract_tasks_of_file("b.json")
+    assert _get_root_task_ids(store) == ["2"]
+    assert store.get_parent_task_ids("2") == set()
+
+
+def test__retracting_a_file_keeps_tasks_replaced_by_another_file() -> None:
+    store = NormalizedTaskStore()
+    store.add_tasks_of_file("a.json", [make_normalized_task("1", sub_task_ids=[])])
+    store.add_tasks_of_file("b.json", [make_normalized_task("1", sub_task_ids=[])])
+
+    store.retract_tasks_of_file("a.json")
+    assert _get_root_task_ids(store) == ["1"]
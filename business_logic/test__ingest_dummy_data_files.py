@@ -0,0 +1,218 @@
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from business_logic.dummy_data_task_getter import DummyDataFileTaskGetter
+from business_logic.models.task import Task
+from business_logic.normalized_task_store import NormalizedTask
+from business_logic.testing_utils import make_task_as_dict, write_dummy_data_file
+
+
+def _get_task_ids(tasks: List[Task]) -> List[str]:
+    return sorted(task.id for task in tasks)
+
+
+def test__new_files_are_ingested_on_next_call(tmp_path: Path) -> None:
+    write_dummy_data_file(tmp_path / "a.json", [make_task_as_dict("1")])
+    task_getter = DummyDataFileTaskGetter(path_to_dummy_data=str(tmp_path))
+    assert _get_task_ids(task_getter.get_tasks()) == ["1"]
+
+    write_dummy_data_file(tmp_path / "b.json", [make_task_as_dict("2")])
+    assert _get_task_ids(task_getter.get_tasks()) == ["1", "2"]
+
+
+def test__modified_files_are_parsed_again(tmp_path: Path) -> None:
+    file = tmp_path / "a.json"
+    write_dummy_data_file(file, [make_task_as_dict("1")])
+    task_getter = DummyDataFileTaskGetter(path_to_dummy_data=str(tmp_path))
+    assert _get_task_ids(task_getter.get_tasks()) == ["1"]
+
+    write_dummy_data_file(
+        file, [make_task_as_dict("2", sub_tasks=[make_task_as_dict("3")])]
+    )
+    assert _get_task_ids(task_getter.get_tasks()) == ["2"]
+    assert task_getter.get_task_by_id("1") is None
+    assert task_getter.get_task_by_id("3") is not None
+
+
+def test__deleted_files_are_retracted(tmp_path: Path) -> None:
+    write_dummy_data_file(tmp_path / "a.json", [make_task_as_dict("1")])
+    write_dummy_data_file(tmp_path / "b.json", [make_task_as_dict("2")])
+    task_getter = DummyDataFileTaskGetter(path_to_dummy_data=str(tmp_path))
+    assert _get_task_ids(task_getter.get_tasks()) == ["1", "2"]
+
+    os.remove(tmp_path / "a.json")
+    assert _get_task_ids(task_getter.get_tasks()) == ["2"]
+    assert task_getter.get_task_by_id("1") is None
+
+
+def test__files_failing_to_be_read_leave_the_tasks_unchanged(tmp_path: Path) -> None:
+    write_dummy_data_file(tmp_path / "a.json", [make_task_as_dict("1")])
+    write_dummy_data_file(tmp_path / "b.json", [make_task_as_dict("2")])
+    task_getter = DummyDataFileTaskGetter(path_to_dummy_data=str(tmp_path))
+    generation = task_getter._normalized_task_store.generation
+
+    os.remove(tmp_path / "a.json")
+    (tmp_path / "b.json").write_text('{"tasks": [{"id": "3"')
+    with pytest.raises(ValueError):
+        task_getter.get_tasks()
+    store = task_getter._normalized_task_store
+    assert sorted(Path(file).name for file in store.get_tasks_per_file()) == [
+        "a.json",
+        "b.json",
+    ]
+    assert sorted(task.id for task in store.get_root_tasks()) == ["1", "2"]
+    assert store.generation == generation
+
+    write_dummy_data_file(tmp_path / "b.json", [make_task_as_dict("3")])
+    assert _get_task_ids(task_getter.get_tasks()) == ["3"]
+
+
+def test__directory_is_not_scanned_again_within_the_scan_interval(
+    tmp_path: Path,
+) -> None:
+    write_dummy_data_file(tmp_path / "a.json", [make_task_as_dict("1")])
+    task_getter = DummyDataFileTaskGetter(
+        path_to_dummy_data=str(tmp_path),
+        min_seconds_between_directory_scans=60,
+    )
+    write_dummy_data_file(tmp_path / "b.json", [make_task_as_dict("2")])
+    assert _get_task_ids(task_getter.get_tasks()) == ["1"]
+
+
+def test__files_ingested_in_parallel_are_merged(tmp_path: Path) -> None:
+    for index in range(4):
+        write_dummy_data_file(
+            tmp_path / f"{index}.json",
+            [make_task_as_dict(f"{index}", sub_tasks=[make_task_as_dict(f"{index}.1")])],
+        )
+    task_getter = DummyDataFileTaskGetter(
+        path_to_dummy_data=str(tmp_path),
+        number_of_ingestion_workers=2,
+    )
+    assert _get_task_ids(task_getter.get_tasks()) == ["0", "1", "2", "3"]
+    assert task_getter.get_task_by_id("2.1") is not None
+    ingestion_workers = task_getter._ingestion_workers
+    assert ingestion_workers is not None
+
+    for index in range(2):
+        write_dummy_data_file(
+            tmp_path / f"{index}.json",
+            [make_task_as_dict(f"{index}", sub_tasks=[make_task_as_dict(f"{index}.2")])],
+        )
+    assert task_getter.get_task_by_id("1.1") is None
+    assert task_getter.get_task_by_id("1.2") is not None
+    assert task_getter._ingestion_workers is ingestion_workers, (
+        "The ingestion workers are not reused by later refreshes"
+    )
+
+
+def test__sub_tasks_are_materialized(tmp_path: Path) -> None:
+    write_dummy_data_file(
+        tmp_path / "a.json",
+        [make_task_as_dict("1", sub_tasks=[make_task_as_dict("2")])],
+    )
+    task_getter = DummyDataFileTaskGetter(path_to_dummy_data=str(tmp_path))
+    [task] = task_getter.get_tasks()
+    assert _get_task_ids(task.sub_tasks) == ["2"]
+
+
+def test__materialized_tasks_are_shared_until_their_sub_tree_changes(
+    tmp_path: Path,
+) -> None:
+    write_dummy_data_file(
+        tmp_path / "a.json",
+        [make_task_as_dict("1", sub_tasks=[make_task_as_dict("2")])],
+    )
+    write_dummy_data_file(tmp_path / "b.json", [make_task_as_dict("3")])
+    task_getter = DummyDataFileTaskGetter(path_to_dummy_data=str(tmp_path))
+    tasks = {task.id: task for task in task_getter.get_tasks()}
+    assert task_getter.get_task_by_id("1") is tasks["1"]
+
+    write_dummy_data_file(
+        tmp_path / "a.json",
+        [make_task_as_dict("1", sub_tasks=[make_task_as_dict("4")])],
+    )
+    new_tasks = {task.id: task for task in task_getter.get_tasks()}
+    assert new_tasks["1"] is not tasks["1"]
+    assert _get_task_ids(new_tasks["1"].sub_tasks) == ["4"]
+    assert new_tasks["3"] is tasks["3"]
+
+
+def test__unchanged_files_are_loaded_from_the_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path_to_dummy_data = tmp_path / "data"
+    path_to_dummy_data.mkdir()
+    path_to_snapshot = str(tmp_path / "snapshot.pickle")
+    write_dummy_data_file(
+        path_to_dummy_data / "a.json",
+        [make_task_as_dict("1", sub_tasks=[make_task_as_dict("2")])],
+    )
+    DummyDataFileTaskGetter(
+        path_to_dummy_data=str(path_to_dummy_data), path_to_snapshot=path_to_snapshot
+    ).wait_until_snapshot_is_saved()
+    write_dummy_data_file(path_to_dummy_data / "b.json", [make_task_as_dict("3")])
+
+    files_read: List[str] = []
+    read_normalized_tasks = DummyDataFileTaskGetter._read_normalized_tasks
+
+    def _read_normalized_tasks(
+        file: Path, file_is_trusted: bool = False
+    ) -> List[NormalizedTask]:
+        files_read.append(file.name)
+        return read_normalized_tasks(file, file_is_trusted)
+
+    monkeypatch.setattr(
+        DummyDataFileTaskGetter, "_read_normalized_tasks", _read_normalized_tasks
+    )
+    task_getter = DummyDataFileTaskGetter(
+        path_to_dummy_data=str(path_to_dummy_data), path_to_snapshot=path_to_snapshot
+    )
+    assert files_read == ["b.json"]
+    assert _get_task_ids(task_getter.get_tasks()) == ["1", "3"]
+    assert task_getter.get_task_by_id("2") is not None
+
+
+def test__trusted_files_are_normalized_like_validated_files(tmp_path: Path) -> None:
+    file = tmp_path / "a.json"
+    write_dummy_data_file(
+        file,
+        [make_task_as_dict("1", sub_tasks=[make_task_as_dict("2")])],
+    )
+    assert DummyDataFileTaskGetter._read_normalized_tasks(
+        file, file_is_trusted=True
+    ) == DummyDataFileTaskGetter._read_normalized_tasks(file, file_is_trusted=False)
+
+
+def test__fingerprinted_files_are_trusted_after_passing_validation(
+    tmp_path: Path,
+) -> None:
+    path_to_dummy_data = tmp_path / "data"
+    path_to_dummy_data.mkdir()
+    path_to_trusted_fingerprints = tmp_path / "trusted-fingerprints.txt"
+    fingerprint = "0cc175b9c0f1b6a831c399e269772661"
+    write_dummy_data_file(path_to_dummy_data / f"{fingerprint}.json", [make_task_as_dict("1")])
+    write_dummy_data_file(path_to_dummy_data / "export.json", [make_task_as_dict("2")])
+    DummyDataFileTaskGetter(
+        path_to_dummy_data=str(path_to_dummy_data),
+        path_to_trusted_fingerprints=str(path_to_trusted_fingerprints),
+    )
+    assert path_to_trusted_fingerprints.read_text() == fingerprint + "\n"
+
+
+@pytest.mark.parametrize("intern_identifiers", [True, False])
+def test__identifiers_are_shared_between_files_only_when_interned(
+    tmp_path: Path, intern_identifiers: bool
+) -> None:
+    write_dummy_data_file(tmp_path / "a.json", [make_task_as_dict("1")])
+    write_dummy_data_file(tmp_path / "b.json", [make_task_as_dict("2")])
+    task_getter = DummyDataFileTaskGetter(
+        path_to_dummy_data=str(tmp_path), intern_identifiers=intern_identifiers
+    )
+    first_task = task_getter.get_task_by_id("1")
+    second_task = task_getter.get_task_by_id("2")
+    assert first_task is not None and second_task is not None
+    assert (first_task.assignees[0] is second_task.assignees[0]) == intern_identifiers
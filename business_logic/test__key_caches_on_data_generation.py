@@ -0,0 +1,239 @@
+import dataclasses
+from pathlib import Path
+from typing import Dict, Generic, List, Optional, Sequence, Union
+
+import pytest
+
+from business_logic.caching_task_getter import Cache, CachingTaskGetter, K, V
+from business_logic.dummy_data_task_getter import DummyDataFileTaskGetter
+from business_logic.filtering_task_getter import FilteringTaskGetter
+from business_logic.models.burn_down_forecastable_task import BurnDownForecastableTask
+from business_logic.models.date import Date
+from business_logic.models.task import Task
+from business_logic.sqlite_task_getter import SQLiteTaskGetter
+from business_logic.task_projection import ProjectedTaskGetter, TaskProjector
+from business_logic.testing_utils import (
+    FakeClock,
+    ManualExecutor,
+    make_normalized_task,
+    make_task,
+    make_task_as_dict,
+    write_dummy_data_file,
+)
+
+
+class _NeverExpiringCache(Cache[K, V], Generic[K, V]):
+    def __init__(self) -> None:
+        self._values: Dict[K, V] = {}
+
+    def has(self, key: K) -> bool:
+        return key in self._values
+
+    def get(self, key: K) -> Optional[V]:
+        return self._values.get(key)
+
+    def add(self, key: K, value: V) -> None:
+        self._values[key] = value
+
+    def clear(self) -> None:
+        self._values = {}
+
+
+class _GenerationalTaskGetter(FilteringTaskGetter):
+    def __init__(self, tasks: List[Task]):
+        self.tasks = tasks
+        self.data_generation = 0
+        self.number_of_get_tasks_calls = 0
+        self.number_of_data_generation_checks = 0
+
+    def get_task_by_id(self, task_id: str) -> Optional[Task]:
+        return None
+
+    def get_tasks(self) -> List[Task]:
+        self.number_of_get_tasks_calls += 1
+        return self.tasks
+
+    def get_data_generation(self) -> Optional[int]:
+        self.number_of_data_generation_checks += 1
+        return self.data_generation
+
+
+def _get_task_ids(tasks: Sequence[Union[Task, BurnDownForecastableTask]]) -> List[str]:
+    return [task.id for task in tasks]
+
+
+def test__the_cache_is_cleared_when_the_data_generation_changes() -> None:
+    task_getter = _GenerationalTaskGetter([make_task("1")])
+    caching_task_getter = CachingTaskGetter(
+        task_getter=task_getter,
+        task_cache=_NeverExpiringCache(),
+        tasks_cache=_NeverExpiringCache(),
+    )
+    assert [task.id for task in caching_task_getter.get_tasks()] == ["1"]
+    assert [task.id for task in caching_task_getter.get_tasks()] == ["1"]
+    assert task_getter.number_of_get_tasks_calls == 1
+
+    task_getter.tasks = [make_task("2")]
+    task_getter.data_generation = 1
+    assert [task.id for task in caching_task_getter.get_tasks()] == ["2"]
+    assert task_getter.number_of_get_tasks_calls == 2
+
+
+
+def test__query_results_are_cached_until_the_data_generation_changes() -> None:
+    task_getter = _GenerationalTaskGetter(
+        [make_task("1"), make_task("2", date_finished=Date(2020, 5, 20))]
+    )
+    caching_task_getter = CachingTaskGetter(
+        task_getter=task_getter,
+        task_cache=_NeverExpiringCache(),
+        tasks_cache=_NeverExpiringCache(),
+        query_cache=_NeverExpiringCache(),
+    )
+    for _ in range(2):
+        assert _get_task_ids(caching_task_getter.get_open_tasks()) == ["1"]
+        assert _get_task_ids(
+            caching_task_getter.get_tasks_finished_since(Date(2020, 5, 20))
+        ) == ["2"]
+    assert task_getter.number_of_get_tasks_calls == 2, "Every query is answered once"
+
+    task_getter.tasks = [make_task("3")]
+    task_getter.data_generation = 1
+    assert _get_task_ids(caching_task_getter.get_open_tasks()) == ["3"]
+    assert task_getter.number_of_get_tasks_calls == 3
+
+@dataclasses.dataclass
+class CheckDataGenerationTestCase:
+    message: str
+    given_min_seconds_between_data_generation_checks: float
+    given_seconds_of_the_lookups: List[float]
+    expected_number_of_data_generation_checks: int
+
+
+check_data_generation_test_cases: List[CheckDataGenerationTestCase] = [
+    CheckDataGenerationTestCase(
+        message="Given no min seconds between checks, "
+        "when the tasks are looked up then every lookup checks the data generation",
+        given_min_seconds_between_data_generation_checks=0,
+        given_seconds_of_the_lookups=[0, 1, 2],
+        expected_number_of_data_generation_checks=6,
+    ),
+    CheckDataGenerationTestCase(
+        message="Given lookups within the min seconds between checks, "
+        "when the tasks are looked up then the data generation is checked once",
+        given_min_seconds_between_data_generation_checks=10,
+        given_seconds_of_the_lookups=[0, 1, 9.9],
+        expected_number_of_data_generation_checks=1,
+    ),
+    CheckDataGenerationTestCase(
+        message="Given lookups over two check intervals, "
+        "when the tasks are looked up then the data generation is checked twice",
+        given_min_seconds_between_data_generation_checks=10,
+        given_seconds_of_the_lookups=[0, 5, 10, 15],
+        expected_number_of_data_generation_checks=2,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    check_data_generation_test_cases,
+    ids=[each.message for each in check_data_generation_test_cases],
+)
+def test__cache_hits_check_the_data_generation_at_most_once_per_interval(
+    test_case: CheckDataGenerationTestCase,
+) -> None:
+    clock = FakeClock()
+    task_getter = _GenerationalTaskGetter([make_task("1")])
+    caching_task_getter = CachingTaskGetter(
+        task_getter=task_getter,
+        task_cache=_NeverExpiringCache(),
+        tasks_cache=_NeverExpiringCache(),
+        min_seconds_between_data_generation_checks=(
+            test_case.given_min_seconds_between_data_generation_checks
+        ),
+        clock=clock,
+    )
+    # every lookup is a get_tasks and a get_data_generation call
+    for seconds in test_case.given_seconds_of_the_lookups:
+        clock.now = seconds
+        caching_task_getter.get_tasks()
+        caching_task_getter.get_data_generation()
+    assert (
+        task_getter.number_of_data_generation_checks
+        == test_case.expected_number_of_data_generation_checks
+    ), test_case.message
+    assert task_getter.number_of_get_tasks_calls == 1, test_case.message
+
+
+def test__stale_tasks_are_projected_until_the_changed_tasks_were_fetched() -> None:
+    revalidation_executor = ManualExecutor()
+    task_getter = _GenerationalTaskGetter([make_task("1")])
+    caching_task_getter = CachingTaskGetter(
+        task_getter=task_getter,
+        task_cache=_NeverExpiringCache(),
+        tasks_cache=_NeverExpiringCache(),
+        stale_while_revalidate_in_seconds=30,
+        revalidation_executor=revalidation_executor,
+    )
+    burn_down_forecastable_task_getter = ProjectedTaskGetter(
+        TaskProjector(caching_task_getter),
+        lambda projection: projection.burn_down_forecastable_tasks,
+    )
+    assert _get_task_ids(burn_down_forecastable_task_getter.get_tasks()) == ["1"]
+
+    task_getter.tasks = [make_task("2")]
+    task_getter.data_generation = 1
+    assert _get_task_ids(burn_down_forecastable_task_getter.get_tasks()) == ["1"], (
+        "The stale tasks are served while the changed tasks are fetched"
+    )
+    assert caching_task_getter.get_data_generation() == 0
+
+    revalidation_executor.run_pending_calls()
+    assert caching_task_getter.get_data_generation() == 1
+    assert _get_task_ids(burn_down_forecastable_task_getter.get_tasks()) == ["2"]
+    assert task_getter.number_of_get_tasks_calls == 2
+
+
+def test__dummy_data_generation_only_changes_with_the_files(tmp_path: Path) -> None:
+    write_dummy_data_file(tmp_path / "a.json", [make_task_as_dict("1")])
+    task_getter = DummyDataFileTaskGetter(path_to_dummy_data=str(tmp_path))
+    data_generation = task_getter.get_data_generation()
+    assert task_getter.get_data_generation() == data_generation
+
+    write_dummy_data_file(tmp_path / "b.json", [make_task_as_dict("2")])
+    assert task_getter.get_data_generation() > data_generation
+
+
+def test__dummy_data_generation_does_not_depend_on_how_the_task_getter_started(
+    tmp_path: Path,
+) -> None:
+    path_to_dummy_data = tmp_path / "data"
+    path_to_dummy_data.mkdir()
+    path_to_snapshot = str(tmp_path / "snapshot.pickle")
+    write_dummy_data_file(path_to_dummy_data / "a.json", [make_task_as_dict("1")])
+    write_dummy_data_file(path_to_dummy_data / "b.json", [make_task_as_dict("2")])
+    DummyDataFileTaskGetter(
+        path_to_dummy_data=str(path_to_dummy_data), path_to_snapshot=path_to_snapshot
+    ).wait_until_snapshot_is_saved()
+    # deleting a file leaves the modification time of the directory the newest
+    (path_to_dummy_data / "b.json").unlink()
+
+    cold_task_getter = DummyDataFileTaskGetter(path_to_dummy_data=str(path_to_dummy_data))
+    warm_task_getter = DummyDataFileTaskGetter(
+        path_to_dummy_data=str(path_to_dummy_data), path_to_snapshot=path_to_snapshot
+    )
+    assert cold_task_getter.get_data_generation() == warm_task_getter.get_data_generation()
+
+
+def test__sqlite_generation_changes_with_writes_of_any_connection(tmp_path: Path) -> None:
+    path_to_database = str(tmp_path / "tasks.sqlite")
+    task_getter = SQLiteTaskGetter(path_to_database)
+    data_generation = task_getter.get_data_generation()
+    assert task_getter.get_data_generation() == data_generation
+
+    SQLiteTaskGetter(path_to_database).import_normalized_tasks(
+        [make_normalized_task("1")]
+    )
+    assert task_getter.get_data_generation() > data_generation
+    assert task_getter.get_task_by_id("1") is not None
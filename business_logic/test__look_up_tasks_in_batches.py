@@ -0,0 +1,29 @@
+from business_logic.burn_down_forecastable_task_getter_proxy import (
+    BurnDownForecastableTaskGetterProxy,
+)
+from business_logic.caching_task_getter import (
+    CacheUtils,
+    CachingTaskGetter,
+    TaskCache,
+    TasksCache,
+)
+from business_logic.models.date import Date
+from business_logic.testing_utils import CountingTaskGetter, make_task
+
+
+def test__tasks_are_looked_up_in_one_batch_through_the_stack() -> None:
+    task_getter = CountingTaskGetter(
+        [make_task("1"), make_task("2", date_finished=Date(2020, 5, 20)), make_task("3")]
+    )
+    caching_task_getter = CachingTaskGetter(
+        task_getter=BurnDownForecastableTaskGetterProxy(task_getter=task_getter),
+        task_cache=TaskCache(cache_utils=CacheUtils(), cache_life_time_in_seconds=30),
+        tasks_cache=TasksCache(cache_utils=CacheUtils(), cache_life_time_in_seconds=30),
+    )
+
+    tasks = caching_task_getter.get_tasks_by_ids(["3", "2", "4", "1"])
+
+    # finished and unknown tasks are skipped, the order of the given ids is kept
+    assert list(tasks.keys()) == ["3", "1"]
+    assert task_getter.looked_up_batches == [["3", "2", "4", "1"]]
+    assert task_getter.number_of_single_lookups == 0
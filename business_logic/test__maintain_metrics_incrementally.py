@@ -0,0 +1,206 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from business_logic.burn_down_forecastable_task_aggregator import (
+    BurnDownForecastableTaskAggregator,
+)
+from business_logic.developer_velocity_tracker import DeveloperVelocityTracker
+from business_logic.dummy_data_task_getter import DummyDataFileTaskGetter
+from business_logic.incremental_developer_velocity_tracker import (
+    IncrementalDeveloperVelocityTracker,
+)
+from business_logic.incremental_metrics import IncrementalMetrics
+from business_logic.incremental_open_task_aggregator import IncrementalOpenTaskAggregator
+from business_logic.interfaces.maker import Maker
+from business_logic.interfaces.task_change_listener import TaskChangeListener
+from business_logic.models.burn_down_forecastable_task import BurnDownForecastableTask
+from business_logic.models.date import Date
+from business_logic.models.task import Task
+from business_logic.models.task_change_event import TaskChangeEvent, TaskChangeEventType
+from business_logic.models.velocity_trackable_task import VelocityTrackableTask
+from business_logic.task_projection import TaskProjection, TaskProjector
+from business_logic.testing_utils import (
+    CountingTaskGetter,
+    make_task,
+    make_task_as_dict,
+    write_dummy_data_file,
+)
+
+START_DATE = Date(2020, 5, 18)
+
+
+class _RecordingTaskChangeListener(TaskChangeListener):
+    def __init__(self) -> None:
+        self.events: List[TaskChangeEvent] = []
+
+    def on_task_changes(self, events: List[TaskChangeEvent]) -> None:
+        self.events.extend(events)
+
+    def pop_event_types(self) -> Dict[str, TaskChangeEventType]:
+        event_types = {event.task_id: event.type for event in self.events}
+        self.events = []
+        return event_types
+
+
+class _FixedIDMaker(Maker[str]):
+    def make(self) -> str:
+        return "aggregated"
+
+
+def _get_finished_tasks(tasks: List[Task]) -> List[VelocityTrackableTask]:
+    finished_tasks: List[VelocityTrackableTask] = []
+    for task in tasks:
+        finished_tasks.extend(_get_finished_tasks(task.sub_tasks))
+        if task.date_finished is not None and task.date_finished >= START_DATE:
+            finished_tasks.append(
+                VelocityTrackableTask(
+                    id=task.id,
+                    story_points=task.story_points,
+                    assignees=task.assignees,
+                    date_started=task.date_started,
+                    date_finished=task.date_finished,
+                )
+            )
+    return finished_tasks
+
+
+def test__task_changes_are_published_once_per_change(tmp_path: Path) -> None:
+    file = tmp_path / "a.json"
+    write_dummy_data_file(
+        file, [make_task_as_dict("1", ["Dave"]), make_task_as_dict("2", ["Dave"])]
+    )
+    task_getter = DummyDataFileTaskGetter(path_to_dummy_data=str(tmp_path))
+    listener = _RecordingTaskChangeListener()
+    assert task_getter.subscribe_to_task_changes(listener)
+    assert listener.pop_event_types() == {"1": "added", "2": "added"}
+
+    write_dummy_data_file(
+        file,
+        [
+            make_task_as_dict("1", ["Dave"], date_finished="2020-05-20"),
+            make_task_as_dict("3", ["Dave"]),
+        ],
+    )
+    task_getter.get_tasks()
+    assert listener.pop_event_types() == {"1": "finished", "2": "removed", "3": "added"}
+
+    # the same tasks read again are no change
+    modification_time_in_ns = os.stat(file).st_mtime_ns + 1_000_000_000
+    os.utime(file, ns=(modification_time_in_ns, modification_time_in_ns))
+    task_getter.get_tasks()
+    assert listener.pop_event_types() == {}
+
+    os.remove(file)
+    task_getter.get_tasks()
+    assert listener.pop_event_types() == {"1": "removed", "3": "removed"}
+
+
+def test__incremental_metrics_equal_the_metrics_of_all_tasks(tmp_path: Path) -> None:
+    file = tmp_path / "a.json"
+    write_dummy_data_file(
+        file,
+        [
+            make_task_as_dict(
+                "1",
+                ["Dave"],
+                sub_tasks=[
+                    make_task_as_dict("1.1", ["Dave", "Steve"], date_finished="2020-05-20"),
+                    make_task_as_dict("1.2", ["Steve"]),
+                ],
+            ),
+            make_task_as_dict("2", ["Anna"], date_finished="2020-05-19"),
+        ],
+    )
+    task_getter = DummyDataFileTaskGetter(path_to_dummy_data=str(tmp_path))
+    velocity_tracker = IncrementalDeveloperVelocityTracker()
+    open_task_aggregator = IncrementalOpenTaskAggregator()
+    task_getter.subscribe_to_task_changes(velocity_tracker)
+    task_getter.subscribe_to_task_changes(open_task_aggregator)
+
+    # the sub-task 1.2 loses its parent and becomes an open top level task
+    write_dummy_data_file(
+        file,
+        [
+            make_task_as_dict(
+                "1",
+                ["Dave"],
+                date_finished="2020-05-22",
+                sub_tasks=[
+                    make_task_as_dict("1.1", ["Dave", "Steve"], date_finished="2020-05-21"),
+                ],
+            ),
+            make_task_as_dict("1.2", ["Steve"]),
+            make_task_as_dict("2", ["Anna"], date_finished="2020-05-19"),
+            make_task_as_dict("3", ["Anna"]),
+        ],
+    )
+    tasks = task_getter.get_tasks()
+
+    finished_tasks = _get_finished_tasks(tasks)
+    expected_velocity_tracker = DeveloperVelocityTracker()
+    assert velocity_tracker.track_team_velocity(START_DATE) == pytest.approx(
+        expected_velocity_tracker.track_team_velocity(finished_tasks)
+    )
+    assert velocity_tracker.track_average_developer_velocity(START_DATE) == pytest.approx(
+        expected_velocity_tracker.track_average_developer_velocity(finished_tasks)
+    )
+    assert velocity_tracker.track_developer_velocity("Steve", START_DATE) == pytest.approx(
+        expected_velocity_tracker.track_developer_velocity(finished_tasks, "Steve")
+    )
+
+    open_tasks = [
+        BurnDownForecastableTask(
+            id=task.id, story_points=task.story_points, date_started=task.date_started
+        )
+        for task in tasks
+        if task.date_finished is None
+    ]
+    assert open_task_aggregator.aggregate(_FixedIDMaker()) == BurnDownForecastableTaskAggregator(
+        id_maker=_FixedIDMaker()
+    ).aggregate(open_tasks)
+
+
+def _assert_metrics_are_of_projection(
+    incremental_metrics: IncrementalMetrics, projection: TaskProjection
+) -> None:
+    finished_tasks = projection.velocity_trackable_tasks.tasks
+    assert incremental_metrics.velocity_tracker.track_team_velocity(
+        START_DATE
+    ) == pytest.approx(DeveloperVelocityTracker().track_team_velocity(finished_tasks))
+    assert incremental_metrics.open_task_aggregator.aggregate(
+        _FixedIDMaker()
+    ) == BurnDownForecastableTaskAggregator(id_maker=_FixedIDMaker()).aggregate(
+        projection.burn_down_forecastable_tasks.tasks
+    )
+
+
+def test__incremental_metrics_follow_the_version_of_the_projection() -> None:
+    task_getter = CountingTaskGetter(
+        [
+            make_task(
+                "1",
+                [make_task("1.1", date_finished=Date(2020, 5, 20))],
+                date_finished=Date(2020, 5, 21),
+            ),
+            make_task("2", assignees=["Steve"]),
+        ]
+    )
+    task_projector = TaskProjector(task_getter)
+    incremental_metrics = IncrementalMetrics(task_projector)
+    asyncio.run(incremental_metrics.refresh())
+    projection = task_projector.get_projection()
+    _assert_metrics_are_of_projection(incremental_metrics, projection)
+
+    task_getter.tasks = [
+        make_task("2", assignees=["Steve"], date_finished=Date(2020, 5, 22)),
+        make_task("3"),
+    ]
+    _assert_metrics_are_of_projection(incremental_metrics, projection)
+
+    asyncio.run(incremental_metrics.refresh())
+    assert task_projector.get_projection().version == projection.version + 1
+    _assert_metrics_are_of_projection(incremental_metrics, task_projector.get_projection())
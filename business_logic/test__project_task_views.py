@@ -0,0 +1,135 @@
+import dataclasses
+from typing import Any, Callable, List, Tuple
+
+import pytest
+
+from business_logic.burn_down_forecastable_task_getter_proxy import (
+    BurnDownForecastableTaskGetterProxy,
+)
+from business_logic.interfaces.task_getter import TaskGetter
+from business_logic.models.date import Date
+from business_logic.task_projection import ProjectedTaskGetter, TaskProjector
+from business_logic.testing_utils import CountingTaskGetter, make_task
+from business_logic.velocity_trackable_task_getter_proxy import (
+    VelocityTrackableTaskGetterProxy,
+)
+
+
+def test__both_views_are_projected_from_the_same_tasks() -> None:
+    task_getter = CountingTaskGetter(
+        [
+            make_task("1", [make_task("1.1", [], date_finished=Date(2020, 5, 20))]),
+            make_task("2", [], date_finished=Date(2020, 5, 19)),
+        ]
+    )
+    task_projector = TaskProjector(task_getter)
+    velocity_trackable_task_getter = ProjectedTaskGetter(
+        task_projector, lambda projection: projection.velocity_trackable_tasks
+    )
+    burn_down_forecastable_task_getter = ProjectedTaskGetter(
+        task_projector, lambda projection: projection.burn_down_forecastable_tasks
+    )
+
+    assert [task.id for task in velocity_trackable_task_getter.get_tasks()] == ["1.1", "2"]
+    assert [task.id for task in burn_down_forecastable_task_getter.get_tasks()] == ["1"]
+    assert velocity_trackable_task_getter.get_task_by_id("1.1") is not None
+    assert burn_down_forecastable_task_getter.get_task_by_id("2") is None
+    assert task_projector.get_projection().version == 0
+    assert task_getter.number_of_get_tasks_calls == 5
+
+    task_getter.tasks = [make_task("1", [], date_finished=Date(2020, 5, 21))]
+    assert burn_down_forecastable_task_getter.get_tasks() == []
+    assert [task.id for task in velocity_trackable_task_getter.get_tasks()] == ["1"]
+    assert task_projector.get_projection().version == 1
+
+
+@dataclasses.dataclass
+class QueryProjectedTasksTestCase:
+    message: str
+    given_query: Callable[[TaskGetter[Any]], List[Any]]
+
+
+query_test_cases: List[QueryProjectedTasksTestCase] = [
+    QueryProjectedTasksTestCase(
+        message="Given the tasks finished since a date, when queried "
+        "then every view returns the tasks the proxy of the task getter returns",
+        given_query=lambda task_getter: task_getter.get_tasks_finished_since(
+            Date(2020, 5, 20)
+        ),
+    ),
+    QueryProjectedTasksTestCase(
+        message="Given the open tasks, when queried "
+        "then every view returns the tasks the proxy of the task getter returns",
+        given_query=lambda task_getter: task_getter.get_open_tasks(),
+    ),
+    QueryProjectedTasksTestCase(
+        message="Given the tasks of an assignee, when queried "
+        "then every view returns the tasks the proxy of the task getter returns",
+        given_query=lambda task_getter: task_getter.get_tasks_of_assignee("Steve"),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "test_case", query_test_cases, ids=[each.message for each in query_test_cases]
+)
+def test__queries_are_answered_from_the_views(
+    test_case: QueryProjectedTasksTestCase,
+) -> None:
+    task_getter = CountingTaskGetter(
+        [
+            make_task(
+                "1",
+                [
+                    make_task("1.1", date_finished=Date(2020, 5, 20), assignees=["Steve"]),
+                    make_task("1.2", assignees=["Steve"]),
+                ],
+            ),
+            make_task("2", date_finished=Date(2020, 5, 19), assignees=["Steve"]),
+            make_task("3", date_finished=Date(2020, 5, 21)),
+        ]
+    )
+    task_projector = TaskProjector(task_getter)
+    open_task_ids = {
+        task.id
+        for task in task_getter._walk_tasks(task_getter.tasks)
+        if task.date_finished is None
+    }
+    views_and_expected_task_ids: List[Tuple[TaskGetter[Any], List[str]]] = [
+        (
+            ProjectedTaskGetter(
+                task_projector, lambda projection: projection.velocity_trackable_tasks
+            ),
+            [
+                task.id
+                for task in test_case.given_query(VelocityTrackableTaskGetterProxy(task_getter))
+            ],
+        ),
+        (
+            ProjectedTaskGetter(
+                task_projector, lambda projection: projection.burn_down_forecastable_tasks
+            ),
+            [
+                task.id
+                for task in test_case.given_query(BurnDownForecastableTaskGetterProxy(task_getter))
+            ],
+        ),
+        (
+            ProjectedTaskGetter(task_projector, lambda projection: projection.open_tasks),
+            [
+                task.id
+                for task in test_case.given_query(task_getter)
+                if task.id in open_task_ids
+            ],
+        ),
+    ]
+    for view, expected_task_ids in views_and_expected_task_ids:
+        number_of_get_tasks_calls = task_getter.number_of_get_tasks_calls
+        # the projection reads the tasks once, the query itself reads none
+        projected_tasks = test_case.given_query(view)
+        assert task_getter.number_of_get_tasks_calls <= number_of_get_tasks_calls + 1, (
+            test_case.message
+        )
+        assert sorted(task.id for task in projected_tasks) == sorted(expected_task_ids), (
+            test_case.message
+        )
@@ -0,0 +1,139 @@
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from business_logic.filtering_task_getter import FilteringTaskGetter
+from business_logic.models.date import Date
+from business_logic.models.task import Task
+from business_logic.sqlite_task_getter import SQLiteTaskGetter
+from business_logic.testing_utils import (
+    make_normalized_task,
+    make_task_as_dict,
+    write_dummy_data_file,
+)
+from business_logic.velocity_trackable_task_getter_proxy import (
+    VelocityTrackableTaskGetterProxy,
+)
+
+
+def _write_tasks_file(path: Path, sub_task_assignees: List[str]) -> None:
+    tasks = [
+        make_task_as_dict(
+            "1",
+            assignees=["Dave"],
+            date_started="2020-05-10",
+            sub_tasks=[
+                make_task_as_dict(
+                    "1.1",
+                    assignees=sub_task_assignees,
+                    date_finished="2020-05-20",
+                    date_started="2020-05-10",
+                )
+            ],
+        ),
+        make_task_as_dict(
+            "2", assignees=["Anna"], date_finished="2020-05-12", date_started="2020-05-10"
+        ),
+    ]
+    write_dummy_data_file(path, tasks)
+
+
+@pytest.fixture
+def task_getter(tmp_path: Path) -> SQLiteTaskGetter:
+    _write_tasks_file(tmp_path / "tasks.json", ["Dave", "Steve"])
+    task_getter = SQLiteTaskGetter(str(tmp_path / "tasks.sqlite"))
+    task_getter.import_dummy_data_files(str(tmp_path))
+    return task_getter
+
+
+def test__imported_tasks_are_read_as_trees(task_getter: SQLiteTaskGetter) -> None:
+    tasks = task_getter.get_tasks()
+    assert [task.id for task in tasks] == ["1", "2"]
+    assert tasks[0].sub_tasks[0].assignees == ["Dave", "Steve"]
+    assert tasks[0].sub_tasks[0].date_finished == Date(2020, 5, 20)
+    assert task_getter.get_task_by_id("1") == tasks[0]
+    assert task_getter.get_task_by_id("3") is None
+
+
+def test__finished_tasks_are_queried_by_date(task_getter: SQLiteTaskGetter) -> None:
+    assert [
+        task.id for task in task_getter.get_tasks_finished_since(Date(2020, 5, 12))
+    ] == ["1.1", "2"]
+    assert [
+        task.id for task in task_getter.get_tasks_finished_since(Date(2020, 5, 13))
+    ] == ["1.1"]
+
+
+def test__reimported_tasks_replace_the_stored_tasks(
+    task_getter: SQLiteTaskGetter, tmp_path: Path
+) -> None:
+    _write_tasks_file(tmp_path / "tasks.json", ["Steve"])
+    task_getter.import_dummy_data_files(str(tmp_path))
+    sub_task = task_getter.get_task_by_id("1.1")
+    assert sub_task is not None and sub_task.assignees == ["Steve"]
+    assert len(task_getter.get_tasks()) == 2
+
+
+class _ListTaskGetter(FilteringTaskGetter):
+    def __init__(self, tasks: List[Task]):
+        self._tasks = tasks
+
+    def get_task_by_id(self, task_id: str) -> Optional[Task]:
+        return next(
+            (task for task in self._walk_tasks(self._tasks) if task.id == task_id), None
+        )
+
+    def get_tasks(self) -> List[Task]:
+        return self._tasks
+
+
+def test__pushed_down_queries_equal_the_generic_queries(
+    task_getter: SQLiteTaskGetter,
+) -> None:
+    generic_task_getter = _ListTaskGetter(task_getter.get_tasks())
+    assert task_getter.get_open_tasks() == generic_task_getter.get_open_tasks()
+    for assignee in ["Dave", "Steve", "Anna", "Nobody"]:
+        assert sorted(
+            task.id for task in task_getter.get_tasks_of_assignee(assignee)
+        ) == sorted(
+            task.id for task in generic_task_getter.get_tasks_of_assignee(assignee)
+        )
+    assert list(task_getter.get_tasks_by_ids(["2", "3", "1.1"]).items()) == list(
+        generic_task_getter.get_tasks_by_ids(["2", "3", "1.1"]).items()
+    )
+    assert sorted(
+        task.id for task in task_getter.get_tasks_finished_since(Date(2020, 5, 1))
+    ) == sorted(
+        task.id
+        for task in generic_task_getter.get_tasks_finished_since(Date(2020, 5, 1))
+    )
+
+
+def test__velocity_trackable_tasks_are_queried_through_the_proxy(
+    task_getter: SQLiteTaskGetter,
+) -> None:
+    proxy = VelocityTrackableTaskGetterProxy(task_getter=task_getter)
+    assert sorted(
+        task.id for task in proxy.get_tasks_finished_since(Date(2020, 5, 1))
+    ) == sorted(task.id for task in proxy.get_tasks())
+    assert proxy.get_open_tasks() == []
+
+
+def test__deep_task_trees_are_read_without_recursion(tmp_path: Path) -> None:
+    depth = 5000
+    task_getter = SQLiteTaskGetter(str(tmp_path / "tasks.sqlite"))
+    task_getter.import_normalized_tasks(
+        [
+            make_normalized_task(
+                str(level), sub_task_ids=[str(level + 1)] if level + 1 < depth else []
+            )
+            for level in range(depth)
+        ]
+    )
+    tasks = task_getter.get_tasks()
+    assert [task.id for task in tasks] == ["0"]
+    task = tasks[0]
+    for _ in range(depth - 1):
+        task = task.sub_tasks[0]
+    assert task.id == str(depth - 1) and task.sub_tasks == []
@@ -0,0 +1,69 @@
+import http.client
+import socketserver
+import threading
+from typing import Iterator
+
+import pytest
+
+from business_logic.http_connection_pool import HTTPConnectionPool
+
+
+class _DroppingStubServer(socketserver.ThreadingTCPServer):
+    """
+    Closes every connection after its first request, without a response
+    if is_answering is False
+    """
+
+    daemon_threads = True
+    is_answering: bool
+    opened_connections: int
+
+
+class _DroppingStubRequestHandler(socketserver.StreamRequestHandler):
+    server: _DroppingStubServer
+
+    def handle(self) -> None:
+        self.server.opened_connections += 1
+        while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+            pass
+        if self.server.is_answering:
+            # a keep-alive response, the connection is closed right after it anyway
+            self.wfile.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+
+
+@pytest.fixture
+def dropping_stub_server() -> Iterator[_DroppingStubServer]:
+    server = _DroppingStubServer(("127.0.0.1", 0), _DroppingStubRequestHandler)
+    server.is_answering = True
+    server.opened_connections = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test__a_request_on_an_idle_connection_closed_by_the_server_is_retried(
+    dropping_stub_server: _DroppingStubServer,
+) -> None:
+    connection_pool = HTTPConnectionPool(
+        f"http://127.0.0.1:{dropping_stub_server.server_address[1]}"
+    )
+    assert connection_pool.request("GET", "/").body == b"ok"
+    assert connection_pool.request("GET", "/").body == b"ok"
+    assert dropping_stub_server.opened_connections == 2
+    connection_pool.close()
+
+
+def test__a_request_on_a_new_connection_is_not_retried(
+    dropping_stub_server: _DroppingStubServer,
+) -> None:
+    dropping_stub_server.is_answering = False
+    connection_pool = HTTPConnectionPool(
+        f"http://127.0.0.1:{dropping_stub_server.server_address[1]}"
+    )
+    with pytest.raises((http.client.HTTPException, ConnectionError)):
+        connection_pool.request("GET", "/")
+    assert dropping_stub_server.opened_connections == 1, (
+        "The request was retried on another new connection"
+    )
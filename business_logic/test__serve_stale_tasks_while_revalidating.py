@@ -0,0 +1,105 @@
+import dataclasses
+from typing import List
+
+import pytest
+
+from business_logic.caching_task_getter import CachingTaskGetter
+from business_logic.models.task import Task
+from business_logic.testing_utils import (
+    CountingTaskGetter,
+    FakeClock,
+    ManualExecutor,
+    make_task,
+)
+from business_logic.ttl_cache import MonotonicTTLCache
+
+TASKS_CACHE_LIFE_TIME_IN_SECONDS = 45
+
+
+@dataclasses.dataclass
+class ServeStaleTasksTestCase:
+    message: str
+    given_stale_while_revalidate_in_seconds: float
+    given_seconds_after_expiry: List[float]
+    """
+    The tasks are fetched at each of these times, the background revalidation does not run
+    """
+    expected_task_ids: List[List[str]]
+    expected_age_of_tasks_in_seconds: float
+
+
+test_cases: List[ServeStaleTasksTestCase] = [
+    ServeStaleTasksTestCase(
+        message="Given expired tasks within the grace period, "
+        "when fetched then the stale tasks are served",
+        given_stale_while_revalidate_in_seconds=10,
+        given_seconds_after_expiry=[5, 9],
+        expected_task_ids=[["1"], ["1"]],
+        expected_age_of_tasks_in_seconds=TASKS_CACHE_LIFE_TIME_IN_SECONDS + 9,
+    ),
+    ServeStaleTasksTestCase(
+        message="Given no grace period, "
+        "when fetched then the caller waits for the fresh tasks",
+        given_stale_while_revalidate_in_seconds=0,
+        given_seconds_after_expiry=[5],
+        expected_task_ids=[["2"]],
+        expected_age_of_tasks_in_seconds=0,
+    ),
+    ServeStaleTasksTestCase(
+        message="Given stale tasks served for longer than the grace period, "
+        "when fetched then the caller waits for the fresh tasks",
+        given_stale_while_revalidate_in_seconds=10,
+        given_seconds_after_expiry=[5, 16],
+        expected_task_ids=[["1"], ["2"]],
+        expected_age_of_tasks_in_seconds=0,
+    ),
+    ServeStaleTasksTestCase(
+        message="Given tasks nobody asked for until the grace period after their expiry "
+        "was over, when fetched then the caller waits for the fresh tasks",
+        given_stale_while_revalidate_in_seconds=10,
+        given_seconds_after_expiry=[3600],
+        expected_task_ids=[["2"]],
+        expected_age_of_tasks_in_seconds=0,
+    ),
+]
+
+
+def _get_task_ids(tasks: List[Task]) -> List[str]:
+    return [task.id for task in tasks]
+
+
+@pytest.mark.parametrize("test_case", test_cases, ids=[each.message for each in test_cases])
+def test__expired_tasks_are_served_while_they_are_fetched_in_the_background(
+    test_case: ServeStaleTasksTestCase,
+) -> None:
+    clock = FakeClock()
+    revalidation_executor = ManualExecutor()
+    task_getter = CountingTaskGetter([make_task("1")])
+    caching_task_getter = CachingTaskGetter(
+        task_getter=task_getter,
+        task_cache=MonotonicTTLCache(cache_life_time_in_seconds=30, clock=clock),
+        tasks_cache=MonotonicTTLCache(
+            cache_life_time_in_seconds=TASKS_CACHE_LIFE_TIME_IN_SECONDS, clock=clock
+        ),
+        stale_while_revalidate_in_seconds=test_case.given_stale_while_revalidate_in_seconds,
+        tasks_cache_life_time_in_seconds=TASKS_CACHE_LIFE_TIME_IN_SECONDS,
+        clock=clock,
+        revalidation_executor=revalidation_executor,
+    )
+    assert caching_task_getter.get_age_of_tasks_in_seconds() is None, test_case.message
+    assert _get_task_ids(caching_task_getter.get_tasks()) == ["1"], test_case.message
+
+    task_getter.tasks = [make_task("2")]
+    task_ids = []
+    for seconds_after_expiry in test_case.given_seconds_after_expiry:
+        clock.now = TASKS_CACHE_LIFE_TIME_IN_SECONDS + seconds_after_expiry
+        task_ids.append(_get_task_ids(caching_task_getter.get_tasks()))
+    assert task_ids == test_case.expected_task_ids, test_case.message
+    assert (
+        caching_task_getter.get_age_of_tasks_in_seconds()
+        == test_case.expected_age_of_tasks_in_seconds
+    ), test_case.message
+
+    revalidation_executor.run_pending_calls()
+    assert _get_task_ids(caching_task_getter.get_tasks()) == ["2"], test_case.message
+    assert task_getter.number_of_get_tasks_calls == 2, test_case.message
@@ -0,0 +1,114 @@
+import dataclasses
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from business_logic.sqlite_cache import SQLiteCache
+from business_logic.testing_utils import FakeClock
+
+
+def _make_cache(path: Path, clock: FakeClock) -> SQLiteCache[str, List[str]]:
+    return SQLiteCache(
+        path_to_database=str(path / "cache.sqlite"),
+        namespace="tasks",
+        cache_life_time_in_seconds=30,
+        clock=clock,
+    )
+
+
+def test__values_added_by_one_worker_are_served_to_the_others(tmp_path: Path) -> None:
+    clock = FakeClock()
+    worker_cache = _make_cache(tmp_path, clock)
+    other_worker_cache = _make_cache(tmp_path, clock)
+    worker_cache.add("GET_TASKS", ["1", "2"])
+    assert other_worker_cache.get("GET_TASKS") == ["1", "2"]
+
+    # a new version replaces the value the other worker read before
+    worker_cache.add("GET_TASKS", ["3"])
+    assert other_worker_cache.get("GET_TASKS") == ["3"]
+
+    other_worker_cache.clear()
+    assert worker_cache.get("GET_TASKS") is None
+
+
+def test__values_expire_for_every_worker(tmp_path: Path) -> None:
+    clock = FakeClock()
+    worker_cache = _make_cache(tmp_path, clock)
+    other_worker_cache = _make_cache(tmp_path, clock)
+    worker_cache.add("GET_TASKS", ["1"])
+    clock.now += 30
+    assert worker_cache.get("GET_TASKS") is None
+    assert not other_worker_cache.has("GET_TASKS")
+
+
+@dataclasses.dataclass
+class StampValuesWithDataGenerationTestCase:
+    message: str
+    given_data_generation_of_worker: int
+    given_data_generation_of_other_worker: int
+    given_other_worker_starts_after_the_value_was_added: bool
+    expected_value: Optional[List[str]]
+
+
+data_generation_test_cases: List[StampValuesWithDataGenerationTestCase] = [
+    StampValuesWithDataGenerationTestCase(
+        message="Given workers of the same data generation, "
+        "when one adds a value then the other serves it",
+        given_data_generation_of_worker=1,
+        given_data_generation_of_other_worker=1,
+        given_other_worker_starts_after_the_value_was_added=False,
+        expected_value=["1"],
+    ),
+    StampValuesWithDataGenerationTestCase(
+        message="Given a worker behind the newest data generation, "
+        "when it adds a value then the value is rejected",
+        given_data_generation_of_worker=1,
+        given_data_generation_of_other_worker=2,
+        given_other_worker_starts_after_the_value_was_added=False,
+        expected_value=None,
+    ),
+    StampValuesWithDataGenerationTestCase(
+        message="Given a worker of the newest data generation, "
+        "when it adds a value then a worker behind it serves the value",
+        given_data_generation_of_worker=2,
+        given_data_generation_of_other_worker=1,
+        given_other_worker_starts_after_the_value_was_added=False,
+        expected_value=["1"],
+    ),
+    StampValuesWithDataGenerationTestCase(
+        message="Given a value of an older data generation, "
+        "when another worker starts a newer one then the value is not served anymore",
+        given_data_generation_of_worker=1,
+        given_data_generation_of_other_worker=2,
+        given_other_worker_starts_after_the_value_was_added=True,
+        expected_value=None,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    data_generation_test_cases,
+    ids=[each.message for each in data_generation_test_cases],
+)
+def test__values_are_only_served_for_the_newest_data_generation(
+    tmp_path: Path, test_case: StampValuesWithDataGenerationTestCase
+) -> None:
+    clock = FakeClock()
+    worker_cache = _make_cache(tmp_path, clock)
+    other_worker_cache = _make_cache(tmp_path, clock)
+    worker_cache.start_data_generation(test_case.given_data_generation_of_worker)
+    if not test_case.given_other_worker_starts_after_the_value_was_added:
+        other_worker_cache.start_data_generation(
+            test_case.given_data_generation_of_other_worker
+        )
+    worker_cache.add("GET_TASKS", ["1"])
+    if test_case.given_other_worker_starts_after_the_value_was_added:
+        other_worker_cache.start_data_generation(
+            test_case.given_data_generation_of_other_worker
+        )
+    assert other_worker_cache.get("GET_TASKS") == test_case.expected_value, (
+        test_case.message
+    )
+    assert worker_cache.get("GET_TASKS") == test_case.expected_value, test_case.message
@@ -0,0 +1,73 @@
+import dataclasses
+import io
+import json
+from typing import Any, List
+
+import pytest
+
+from business_logic.serializer.streaming_json_reader import StreamingJSONArrayReader
+
+
+@dataclasses.dataclass
+class StreamJSONArrayItemsTestCase:
+    message: str
+    given_file_content: str
+    expected_items: List[Any]
+
+
+test_cases: List[StreamJSONArrayItemsTestCase] = [
+    StreamJSONArrayItemsTestCase(
+        message="Given an empty object, when called then no items are returned",
+        given_file_content="{}",
+        expected_items=[],
+    ),
+    StreamJSONArrayItemsTestCase(
+        message="Given an empty array, when called then no items are returned",
+        given_file_content='{"tasks": []}',
+        expected_items=[],
+    ),
+    StreamJSONArrayItemsTestCase(
+        message="Given an array of nested objects, "
+        "when called then every item is returned in order",
+        given_file_content=json.dumps(
+            {"tasks": [{"id": "1", "sub_tasks": [{"id": "2"}]}, {"id": "3"}]},
+            indent=4,
+        ),
+        expected_items=[{"id": "1", "sub_tasks": [{"id": "2"}]}, {"id": "3"}],
+    ),
+    StreamJSONArrayItemsTestCase(
+        message="Given other keys before the array, "
+        "when called then only the items of the array are returned",
+        given_file_content=json.dumps(
+            {"a": [1, {"tasks": [0]}], "b": 12345, "tasks": [1.5, 20000]}
+        ),
+        expected_items=[1.5, 20000],
+    ),
+    StreamJSONArrayItemsTestCase(
+        message="Given strings containing brackets and escaped quotes, "
+        "when called then the strings are returned unchanged",
+        given_file_content=json.dumps({"tasks": ['a"]}b', "[{,}]"]}),
+        expected_items=['a"]}b', "[{,}]"],
+    ),
+]
+
+
+@pytest.mark.parametrize("chunk_size_in_characters", [1, 3, 64 * 1024])
+@pytest.mark.parametrize(
+    "test_case", test_cases, ids=[each.message for each in test_cases]
+)
+def test__stream_json_array_items(
+    test_case: StreamJSONArrayItemsTestCase, chunk_size_in_characters: int
+) -> None:
+    reader = StreamingJSONArrayReader(
+        key="tasks", chunk_size_in_characters=chunk_size_in_characters
+    )
+    items = list(reader.read_items(io.StringIO(test_case.given_file_content)))
+    assert items == test_case.expected_items
+
+
+@pytest.mark.parametrize("given_file_content", ['{"tasks": [1, 2', '{"tasks": [1 2]}'])
+def test__malformed_json_raises(given_file_content: str) -> None:
+    reader = StreamingJSONArrayReader(key="tasks", chunk_size_in_characters=2)
+    with pytest.raises(json.JSONDecodeError):
+        list(reader.read_items(io.StringIO(given_file_content)))
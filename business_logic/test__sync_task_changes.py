@@ -0,0 +1,264 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from business_logic.errors import TaskSyncCursorNotAdvancedError
+from business_logic.interfaces.task_change_source import TaskChangeSource
+from business_logic.jira_client import JiraClient, JiraIssue
+from business_logic.jira_task_change_source import JiraTaskChangeSource
+from business_logic.models.task_change_set import SyncCursor, TaskChangeSet
+from business_logic.sqlite_task_getter import SQLiteTaskGetter
+from business_logic.task_sync_engine import SyncingTaskGetter, TaskSyncEngine
+from business_logic.testing_utils import make_normalized_task
+
+
+class _FakeTaskChangeSource(TaskChangeSource):
+    """
+    Emits the given change sets one after another, the cursor is the index of the change set
+    """
+
+    def __init__(self, change_sets: List[TaskChangeSet]):
+        self._change_sets = change_sets
+        self.requested_cursors: List[Optional[SyncCursor]] = []
+
+    def get_changes_since(self, cursor: Optional[SyncCursor]) -> TaskChangeSet:
+        self.requested_cursors.append(cursor)
+        index = int(cursor) + 1 if cursor is not None else 0
+        if index < len(self._change_sets):
+            return self._change_sets[index]
+        return TaskChangeSet(changed_tasks=[], deleted_task_ids=[], cursor=cursor)
+
+
+def test__only_changes_since_the_stored_cursor_are_synced(tmp_path: Path) -> None:
+    task_store = SQLiteTaskGetter(str(tmp_path / "tasks.sqlite"))
+    source = _FakeTaskChangeSource(
+        [
+            TaskChangeSet(
+                changed_tasks=[make_normalized_task("1", sub_task_ids=["2"]), make_normalized_task("2")],
+                deleted_task_ids=[],
+                cursor="0",
+                has_more=True,
+            ),
+            TaskChangeSet(
+                changed_tasks=[make_normalized_task("3")], deleted_task_ids=[], cursor="1"
+            ),
+            TaskChangeSet(
+                changed_tasks=[make_normalized_task("4")], deleted_task_ids=["2"], cursor="2"
+            ),
+        ]
+    )
+    engine = TaskSyncEngine("fake", source, task_store)
+    assert engine.sync() == 3
+    assert source.requested_cursors == [None, "0"]
+    assert sorted(task.id for task in task_store.get_tasks()) == ["1", "3"]
+
+    # a new engine continues from the persisted cursor
+    task_getter = SyncingTaskGetter(
+        task_sync_engine=TaskSyncEngine("fake", source, task_store),
+        task_store=task_store,
+    )
+    assert sorted(task.id for task in task_getter.get_tasks()) == ["1", "3", "4"]
+    assert source.requested_cursors[2] == "1"
+    task = task_getter.get_task_by_id("1")
+    assert task is not None and task.sub_tasks == []
+
+
+class _StuckTaskChangeSource(TaskChangeSource):
+    def get_changes_since(self, cursor: Optional[SyncCursor]) -> TaskChangeSet:
+        return TaskChangeSet(
+            changed_tasks=[make_normalized_task("1")],
+            deleted_task_ids=[],
+            cursor="0",
+            has_more=True,
+        )
+
+
+def test__a_source_not_advancing_its_cursor_fails_the_sync(tmp_path: Path) -> None:
+    task_store = SQLiteTaskGetter(str(tmp_path / "tasks.sqlite"))
+    engine = TaskSyncEngine("stuck", _StuckTaskChangeSource(), task_store)
+    with pytest.raises(TaskSyncCursorNotAdvancedError):
+        engine.sync()
+
+
+class _BlockingTaskChangeSource(_FakeTaskChangeSource):
+    def __init__(self, change_sets: List[TaskChangeSet]):
+        super().__init__(change_sets)
+        self.is_called = threading.Event()
+        self.is_unblocked = threading.Event()
+
+    def get_changes_since(self, cursor: Optional[SyncCursor]) -> TaskChangeSet:
+        self.is_called.set()
+        self.is_unblocked.wait()
+        return super().get_changes_since(cursor)
+
+
+def test__concurrent_calls_wait_for_the_running_sync(tmp_path: Path) -> None:
+    task_store = SQLiteTaskGetter(str(tmp_path / "tasks.sqlite"))
+    source = _BlockingTaskChangeSource(
+        [
+            TaskChangeSet(
+                changed_tasks=[make_normalized_task("1")], deleted_task_ids=[], cursor="0"
+            )
+        ]
+    )
+    task_getter = SyncingTaskGetter(
+        task_sync_engine=TaskSyncEngine("fake", source, task_store),
+        task_store=task_store,
+        min_seconds_between_syncs=60,
+    )
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leading_call = executor.submit(task_getter.get_tasks)
+        source.is_called.wait()
+        following_calls = [executor.submit(task_getter.get_tasks) for _ in range(3)]
+        source.is_unblocked.set()
+        for call in [leading_call, *following_calls]:
+            assert [task.id for task in call.result()] == ["1"]
+    assert source.requested_cursors == [None], "The source is synced once"
+
+
+class _FailingTaskChangeSource(_FakeTaskChangeSource):
+    def __init__(self, change_sets: List[TaskChangeSet]):
+        super().__init__(change_sets)
+        self.is_failing = False
+
+    def get_changes_since(self, cursor: Optional[SyncCursor]) -> TaskChangeSet:
+        if self.is_failing:
+            raise ConnectionError("The task source is not reachable")
+        return super().get_changes_since(cursor)
+
+
+def test__a_failed_sync_serves_the_stored_tasks_until_the_next_sync(
+    tmp_path: Path,
+) -> None:
+    task_store = SQLiteTaskGetter(str(tmp_path / "tasks.sqlite"))
+    source = _FailingTaskChangeSource(
+        [
+            TaskChangeSet(
+                changed_tasks=[make_normalized_task("1")], deleted_task_ids=[], cursor="0"
+            ),
+            TaskChangeSet(
+                changed_tasks=[make_normalized_task("2")], deleted_task_ids=[], cursor="1"
+            ),
+        ]
+    )
+    task_getter = SyncingTaskGetter(
+        task_sync_engine=TaskSyncEngine("fake", source, task_store),
+        task_store=task_store,
+    )
+    assert [task.id for task in task_getter.get_tasks()] == ["1"]
+
+    source.is_failing = True
+    assert [task.id for task in task_getter.get_tasks()] == ["1"]
+
+    source.is_failing = False
+    assert sorted(task.id for task in task_getter.get_tasks()) == ["1", "2"]
+    assert source.requested_cursors == [None, "0"]
+
+
+def _make_jira_issue(key: str, updated: str) -> JiraIssue:
+    return {
+        "key": key,
+        "fields": {
+            "summary": f"Issue {key}",
+            "description": None,
+            "assignee": {"displayName": "Dave"},
+            "created": "2020-05-17T10:20:30.000+0100",
+            "updated": updated,
+            "resolutiondate": None,
+            "parent": None,
+            "subtasks": [],
+            "customfield_10016": 3,
+        },
+    }
+
+
+class _FakeJiraClient(JiraClient):
+    """
+    Answers the searches from the given issues like Jira,
+    comparing the update times by the minute
+    """
+
+    def __init__(self, issues: List[JiraIssue]):
+        super().__init__(url="http://127.0.0.1", email="dave@example.com", api_token="token")
+        self.issues = issues
+        self.searched_jql: List[str] = []
+
+    def search(self, jql: str, start_at: int, max_results: int) -> Dict[str, Any]:
+        self.searched_jql.append(jql)
+        match = re.search(r'updated >= "([^"]+)"', jql)
+        issues = sorted(
+            (
+                issue
+                for issue in self.issues
+                if match is None
+                or JiraTaskChangeSource._get_minute_of_update(issue) >= match.group(1)
+            ),
+            key=lambda issue: str(issue["fields"]["updated"]),
+        )
+        return {
+            "startAt": start_at,
+            "maxResults": max_results,
+            "total": len(issues),
+            "issues": issues[start_at:start_at + max_results],
+        }
+
+
+def test__jira_issues_are_synced_page_by_page_since_their_last_update(
+    tmp_path: Path,
+) -> None:
+    jira_client = _FakeJiraClient(
+        [
+            _make_jira_issue("AK-1", updated="2024-01-05T10:20:30.000+0100"),
+            _make_jira_issue("AK-2", updated="2024-01-05T10:21:10.000+0100"),
+            _make_jira_issue("AK-3", updated="2024-01-05T10:21:20.000+0100"),
+            _make_jira_issue("AK-4", updated="2024-01-05T10:21:30.000+0100"),
+            _make_jira_issue("AK-5", updated="2024-01-05T10:22:00.000+0100"),
+        ]
+    )
+    task_store = SQLiteTaskGetter(str(tmp_path / "tasks.sqlite"))
+    engine = TaskSyncEngine(
+        "jira",
+        JiraTaskChangeSource(jira_client, jql="project = AK", page_size=2),
+        task_store,
+    )
+    assert engine.sync() == 5
+    assert sorted(task.id for task in task_store.get_tasks()) == [
+        "AK-1",
+        "AK-2",
+        "AK-3",
+        "AK-4",
+        "AK-5",
+    ]
+    assert jira_client.searched_jql[0] == "(project = AK) ORDER BY updated ASC"
+
+    jira_client.issues[1] = _make_jira_issue("AK-2", updated="2024-01-05T10:23:00.000+0100")
+    jira_client.issues[1]["fields"]["summary"] = "Renamed"
+    assert engine.sync() == 1, "The issues read before are skipped"
+    task = task_store.get_task_by_id("AK-2")
+    assert task is not None and task.name == "Renamed"
+    assert jira_client.searched_jql[-1] == (
+        '(project = AK) AND updated >= "2024/01/05 10:22" ORDER BY updated ASC'
+    )
+
+
+def test__jira_issues_updated_again_during_a_sync_do_not_push_out_unread_issues() -> None:
+    jira_client = _FakeJiraClient(
+        [
+            _make_jira_issue("AK-1", updated="2024-01-05T10:21:10.000+0100"),
+            _make_jira_issue("AK-2", updated="2024-01-05T10:21:20.000+0100"),
+            _make_jira_issue("AK-3", updated="2024-01-05T10:21:30.000+0100"),
+        ]
+    )
+    change_source = JiraTaskChangeSource(jira_client, jql="project = AK", page_size=2)
+    change_set = change_source.get_changes_since(None)
+    read_issue_keys = [task.id for task in change_set.changed_tasks]
+    # AK-1 moves behind the unread AK-3
+    jira_client.issues[0] = _make_jira_issue("AK-1", updated="2024-01-05T10:21:50.000+0100")
+    while change_set.has_more:
+        change_set = change_source.get_changes_since(change_set.cursor)
+        read_issue_keys.extend(task.id for task in change_set.changed_tasks)
+    assert read_issue_keys == ["AK-1", "AK-2", "AK-3", "AK-1"]
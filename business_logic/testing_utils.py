@@ -0,0 +1,162 @@
+"""
+The task factories and fakes shared by the tests
+"""
+import json
+import threading
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from business_logic.filtering_task_getter import FilteringTaskGetter
+from business_logic.models.date import Date
+from business_logic.models.task import Task
+from business_logic.normalized_task_store import NormalizedTask
+
+R = TypeVar("R")
+
+
+def make_task(
+    task_id: str,
+    sub_tasks: Optional[List[Task]] = None,
+    date_finished: Optional[Date] = None,
+    assignees: Optional[List[str]] = None,
+) -> Task:
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        description="",
+        story_points=3,
+        assignees=assignees if assignees is not None else ["Dave"],
+        sub_tasks=sub_tasks if sub_tasks is not None else [],
+        date_started=Date(2020, 5, 17),
+        date_finished=date_finished,
+    )
+
+
+def make_normalized_task(
+    task_id: str, sub_task_ids: Optional[List[str]] = None
+) -> NormalizedTask:
+    return NormalizedTask(
+        id=task_id,
+        name=f"Task {task_id}",
+        description="",
+        story_points=3,
+        assignees=["Dave"],
+        sub_task_ids=sub_task_ids if sub_task_ids is not None else [],
+        date_started=Date(2020, 5, 17),
+    )
+
+
+def make_task_as_dict(
+    task_id: str,
+    assignees: Optional[List[str]] = None,
+    date_finished: Optional[str] = None,
+    sub_tasks: Optional[List[object]] = None,
+    date_started: str = "2020-05-17",
+) -> object:
+    """
+    Returns the task as it is written to the dummy data files
+    """
+    return {
+        "id": task_id,
+        "title": f"Task {task_id}",
+        "description": "",
+        "story_points": 3,
+        "assignees": assignees if assignees is not None else ["Dave"],
+        "sub_tasks": sub_tasks if sub_tasks is not None else [],
+        "date_started": date_started,
+        "date_finished": date_finished,
+    }
+
+
+def write_dummy_data_file(path: Path, tasks: List[object]) -> None:
+    with open(path, "w") as writer:
+        writer.write(json.dumps({"tasks": tasks}))
+
+
+class FakeClock:
+    """
+    A clock that only moves when now is set
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ManualExecutor(Executor):
+    """
+    Runs the submitted calls only when run_pending_calls is called
+    """
+
+    _pending_calls: List[Tuple["Future[Any]", Callable[[], Any]]]
+
+    def __init__(self) -> None:
+        self._pending_calls = []
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., R], *args: Any, **kwargs: Any
+    ) -> "Future[R]":
+        future: "Future[R]" = Future()
+        self._pending_calls.append((future, lambda: fn(*args, **kwargs)))
+        return future
+
+    def run_pending_calls(self) -> None:
+        pending_calls, self._pending_calls = self._pending_calls, []
+        for future, call in pending_calls:
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(call())
+            except BaseException as error:
+                future.set_exception(error)
+
+
+class CountingTaskGetter(FilteringTaskGetter):
+    """
+    Returns the given tasks and counts the calls. Every call waits while
+    is_unblocked is cleared, is_called is set as soon as the first one arrived.
+    """
+
+    looked_up_batches: List[List[str]]
+
+    def __init__(self, tasks: List[Task]):
+        self.tasks = tasks
+        self.number_of_get_tasks_calls = 0
+        self.number_of_single_lookups = 0
+        self.looked_up_batches = []
+        self.is_called = threading.Event()
+        self.is_unblocked = threading.Event()
+        self.is_unblocked.set()
+        self._lock = threading.Lock()
+
+    def get_task_by_id(self, task_id: str) -> Optional[Task]:
+        with self._lock:
+            self.number_of_single_lookups += 1
+        self._wait_until_unblocked()
+        return self._get_tasks_per_id().get(task_id)
+
+    def get_tasks(self) -> List[Task]:
+        with self._lock:
+            self.number_of_get_tasks_calls += 1
+        self._wait_until_unblocked()
+        return self.tasks
+
+    def get_tasks_by_ids(self, task_ids: List[str]) -> Dict[str, Task]:
+        with self._lock:
+            self.looked_up_batches.append(task_ids)
+        self._wait_until_unblocked()
+        tasks_per_id = self._get_tasks_per_id()
+        return {
+            task_id: tasks_per_id[task_id]
+            for task_id in task_ids
+            if task_id in tasks_per_id
+        }
+
+    def _wait_until_unblocked(self) -> None:
+        self.is_called.set()
+        self.is_unblocked.wait()
+
+    def _get_tasks_per_id(self) -> Dict[str, Task]:
+        return {task.id: task for task in self._walk_tasks(self.tasks)}
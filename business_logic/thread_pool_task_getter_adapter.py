@@ -0,0 +1,52 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, TypeVar
+
+from business_logic.interfaces.async_task_getter import AsyncTaskGetter
+from business_logic.interfaces.task_getter import TaskGetter, T
+from business_logic.models.date import Date
+
+R = TypeVar("R")
+
+
+class ThreadPoolTaskGetterAdapter(AsyncTaskGetter[T]):
+    """
+    Runs the calls of a synchronous task getter in a bounded thread pool,
+    so its file I/O and parsing never block the event loop. The pool may be
+    shared by several adapters, by default every adapter gets a pool with one
+    worker. With more than one worker the given task getter has to be thread safe.
+    """
+
+    def __init__(
+        self, task_getter: TaskGetter[T], executor: Optional[ThreadPoolExecutor] = None
+    ):
+        self._task_getter = task_getter
+        self._executor = (
+            executor
+            if executor is not None
+            else ThreadPoolExecutor(max_workers=1, thread_name_prefix="task-getter")
+        )
+
+    async def get_task_by_id(self, task_id: str) -> Optional[T]:
+        return await self._run(lambda: self._task_getter.get_task_by_id(task_id))
+
+    async def get_tasks(self) -> List[T]:
+        return await self._run(self._task_getter.get_tasks)
+
+    async def get_tasks_finished_since(self, date: Date) -> List[T]:
+        return await self._run(lambda: self._task_getter.get_tasks_finished_since(date))
+
+    async def get_open_tasks(self) -> List[T]:
+        return await self._run(self._task_getter.get_open_tasks)
+
+    async def get_tasks_of_assignee(self, assignee: str) -> List[T]:
+        return await self._run(lambda: self._task_getter.get_tasks_of_assignee(assignee))
+
+    async def get_tasks_by_ids(self, task_ids: List[str]) -> Dict[str, T]:
+        return await self._run(lambda: self._task_getter.get_tasks_by_ids(task_ids))
+
+    async def get_data_generation(self) -> Optional[int]:
+        return await self._run(self._task_getter.get_data_generation)
+
+    async def _run(self, call: Callable[[], R]) -> R:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call)
@@ -0,0 +1,45 @@
+import re
+from pathlib import Path
+from typing import Optional, Set
+
+FileName = str
+Fingerprint = str
+
+_MD5_HEX_DIGEST = re.compile(r"[0-9a-f]{32}")
+
+
+class TrustedFingerprints:
+    """
+    Remembers the data files that passed validation once. Only files named by
+    the md5 of their content (see dummy_data/make_random_tasks.py) can be
+    trusted, since their content can not change without changing their name.
+    """
+
+    _fingerprints: Set[Fingerprint]
+
+    def __init__(self, path_to_trusted_fingerprints: str):
+        self._path_to_trusted_fingerprints = Path(path_to_trusted_fingerprints)
+        self._fingerprints = self._read_fingerprints()
+
+    def is_trusted(self, file_name: FileName) -> bool:
+        fingerprint = self.get_fingerprint(file_name)
+        return fingerprint is not None and fingerprint in self._fingerprints
+
+    def trust(self, file_name: FileName) -> None:
+        fingerprint = self.get_fingerprint(file_name)
+        if fingerprint is None or fingerprint in self._fingerprints:
+            return
+        self._fingerprints.add(fingerprint)
+        with open(self._path_to_trusted_fingerprints, "a") as writer:
+            writer.write(fingerprint + "\n")
+
+    @staticmethod
+    def get_fingerprint(file_name: FileName) -> Optional[Fingerprint]:
+        stem = Path(file_name).stem
+        return stem if _MD5_HEX_DIGEST.fullmatch(stem) is not None else None
+
+    def _read_fingerprints(self) -> Set[Fingerprint]:
+        if not self._path_to_trusted_fingerprints.is_file():
+            return set()
+        with open(self._path_to_trusted_fingerprints, "r") as reader:
+            return {line.strip() for line in reader if line.strip()}
@@ -0,0 +1,193 @@
+import collections
+import dataclasses
+import sys
+import threading
+import time
+from typing import Callable, Dict, Generic, List, Optional, Set, Tuple
+
+from business_logic.caching_task_getter import Cache, K, V
+
+Seconds = float
+Bytes = int
+
+
+@dataclasses.dataclass
+class CacheStatistics:
+    hits: int = 0
+    misses: int = 0
+    """
+    Expired values count as misses
+    """
+    evictions: int = 0
+    """
+    Values dropped to stay within the limits of the cache, expired values do not count
+    """
+
+
+class MonotonicTTLCache(Cache[K, V], Generic[K, V]):
+    """
+    Keeps every value for the given life time. The expiration of an entry is a
+    deadline on the monotonic clock, so a lookup costs a dict lookup and a float
+    comparison, and is not affected by changes of the system time.
+    Expired entries are dropped when they are looked up, and all of them are
+    swept out at most once per life time while values are added.
+    """
+
+    _entries: Dict[K, Tuple[Seconds, V]]
+
+    def __init__(
+            self,
+            cache_life_time_in_seconds: Seconds,
+            clock: Callable[[], Seconds] = time.monotonic,
+    ):
+        self._entries = {}
+        self._cache_life_time_in_seconds = cache_life_time_in_seconds
+        self._clock = clock
+        self._next_sweep = clock() + cache_life_time_in_seconds
+
+    def has(self, key: K) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        deadline, value = entry
+        if deadline <= self._clock():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def add(self, key: K, value: V) -> None:
+        now = self._clock()
+        self._entries[key] = (now + self._cache_life_time_in_seconds, value)
+        if now >= self._next_sweep:
+            self._sweep_expired_entries(now)
+
+    def clear(self) -> None:
+        self._entries = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _sweep_expired_entries(self, now: Seconds) -> None:
+        self._entries = {
+            key: entry for key, entry in self._entries.items() if entry[0] > now
+        }
+        self._next_sweep = now + self._cache_life_time_in_seconds
+
+
+def estimate_size_in_bytes(value: object) -> Bytes:
+    """
+    The size of the value and of every object it holds, following lists, tuples,
+    sets, dicts and the attributes of objects. Every object is counted once,
+    objects shared with other values are counted for each of them.
+    """
+    size_in_bytes = 0
+    seen_object_ids: Set[int] = set()
+    objects_to_visit: List[object] = [value]
+    while len(objects_to_visit) > 0:
+        current_object = objects_to_visit.pop()
+        if id(current_object) in seen_object_ids:
+            continue
+        seen_object_ids.add(id(current_object))
+        size_in_bytes += sys.getsizeof(current_object)
+        if isinstance(current_object, (str, bytes, int, float, bool, type(None))):
+            continue
+        if isinstance(current_object, dict):
+            objects_to_visit.extend(current_object.keys())
+            objects_to_visit.extend(current_object.values())
+        elif isinstance(current_object, (list, tuple, set, frozenset)):
+            objects_to_visit.extend(current_object)
+        attributes = getattr(current_object, "__dict__", None)
+        if isinstance(attributes, dict):
+            objects_to_visit.append(attributes)
+    return size_in_bytes
+
+
+class LRUTTLCache(Cache[K, V], Generic[K, V]):
+    """
+    Keeps values for the given life time like the MonotonicTTLCache, but holds at
+    most max_entries values of about max_size_in_bytes in total. When a limit is
+    exceeded, the least recently used values are evicted first, so the values
+    looked up often stay in the cache. The sizes are estimated with the given size_of.
+    """
+
+    _entries: "collections.OrderedDict[K, Tuple[Seconds, Bytes, V]]"
+
+    def __init__(
+            self,
+            cache_life_time_in_seconds: Seconds,
+            max_entries: int,
+            max_size_in_bytes: Bytes,
+            size_of: Callable[[V], Bytes] = estimate_size_in_bytes,
+            clock: Callable[[], Seconds] = time.monotonic,
+    ):
+        self._entries = collections.OrderedDict()
+        self._cache_life_time_in_seconds = cache_life_time_in_seconds
+        self._max_entries = max_entries
+        self._max_size_in_bytes = max_size_in_bytes
+        self._size_of = size_of
+        self._clock = clock
+        self._size_in_bytes: Bytes = 0
+        self._statistics = CacheStatistics()
+        # lookups reorder the entries, so they are serialized as well
+        self._lock = threading.Lock()
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        with self._lock:
+            return dataclasses.replace(self._statistics)
+
+    @property
+    def size_in_bytes(self) -> Bytes:
+        return self._size_in_bytes
+
+    def has(self, key: K) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] > self._clock()
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._statistics.misses += 1
+                return None
+            deadline, _, value = entry
+            if deadline <= self._clock():
+                self._remove(key)
+                self._statistics.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._statistics.hits += 1
+            return value
+
+    def add(self, key: K, value: V) -> None:
+        size_in_bytes = self._size_of(value)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (
+                self._clock() + self._cache_life_time_in_seconds,
+                size_in_bytes,
+                value,
+            )
+            self._size_in_bytes += size_in_bytes
+            while len(self._entries) > self._max_entries or (
+                self._size_in_bytes > self._max_size_in_bytes and len(self._entries) > 1
+            ):
+                self._remove(next(iter(self._entries)))
+                self._statistics.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_in_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: K) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_in_bytes -= entry[1]
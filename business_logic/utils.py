@@ -1,4 +1,5 @@
 import hashlib
+from typing import Sequence
 
 
 def print_api_title() -> None:
@@ -23,3 +24,9 @@ def print_api_title() -> None:
 
 def hash_string_value(value: str) -> str:
     return str(hashlib.md5(value.encode("utf-8")).hexdigest())
+
+
+def are_the_same_objects(values: Sequence[object], other_values: Sequence[object]) -> bool:
+    return len(values) == len(other_values) and all(
+        value is other_value for value, other_value in zip(values, other_values)
+    )
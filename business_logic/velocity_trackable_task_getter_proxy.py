@@ -1,14 +1,64 @@
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from business_logic.interfaces.task_getter import TaskGetter
 from business_logic.models.date import Date
 from business_logic.models.task import Task
 from business_logic.models.velocity_trackable_task import VelocityTrackableTask
+from business_logic.utils import are_the_same_objects
+
+
+class VelocityTrackableTaskFlattener:
+    """
+    Flattens task trees into velocity trackable tasks, sub-tasks before their
+    parent. Task getters return the same task objects as long as their data did
+    not change, so the last result is kept and returned again for the same root
+    tasks. The returned tasks are shared and must not be mutated.
+    """
+
+    _last_flattened_tasks: Tuple[List[Task], List[VelocityTrackableTask]]
+
+    def __init__(self) -> None:
+        self._last_flattened_tasks = ([], [])
+
+    def flatten(self, tasks: List[Task]) -> List[VelocityTrackableTask]:
+        last_root_tasks, last_velocity_trackable_tasks = self._last_flattened_tasks
+        if are_the_same_objects(tasks, last_root_tasks):
+            return last_velocity_trackable_tasks
+        velocity_trackable_tasks = list(
+            self.iterate_velocity_trackable_tasks(tasks)
+        )
+        self._last_flattened_tasks = (list(tasks), velocity_trackable_tasks)
+        return velocity_trackable_tasks
+
+    @classmethod
+    def iterate_velocity_trackable_tasks(
+            cls, tasks: List[Task]
+    ) -> Iterator[VelocityTrackableTask]:
+        for task in cls.iterate_flattened_tasks(tasks):
+            if task.date_finished is not None:
+                yield VelocityTrackableTaskGetterProxy._to_velocity_trackable_task(
+                    task, task.date_finished
+                )
+
+    @staticmethod
+    def iterate_flattened_tasks(tasks: List[Task]) -> Iterator[Task]:
+        # an explicit stack instead of recursion, so deep task trees can not exceed the recursion limit
+        unvisited_tasks = [(task, False) for task in reversed(tasks)]
+        while len(unvisited_tasks) > 0:
+            task, sub_tasks_are_visited = unvisited_tasks.pop()
+            if sub_tasks_are_visited:
+                yield task
+            else:
+                unvisited_tasks.append((task, True))
+                unvisited_tasks.extend(
+                    (sub_task, False) for sub_task in reversed(task.sub_tasks)
+                )
 
 
 class VelocityTrackableTaskGetterProxy(TaskGetter[VelocityTrackableTask]):
     def __init__(self, task_getter: TaskGetter[Task]):
         self._task_getter = task_getter
+        self._task_flattener = VelocityTrackableTaskFlattener()
 
     def get_task_by_id(self, task_id: str) -> Optional[VelocityTrackableTask]:
         task = self._task_getter.get_task_by_id(task_id)
@@ -17,21 +67,51 @@ class VelocityTrackableTaskGetterProxy(TaskGetter[VelocityTrackableTask]):
         return None
 
     def get_tasks(self) -> List[VelocityTrackableTask]:
+        return self._task_flattener.flatten(self._task_getter.get_tasks())
+
+    def get_tasks_finished_since(self, date: Date) -> List[VelocityTrackableTask]:
+        return self._to_velocity_trackable_tasks(
+            self._task_getter.get_tasks_finished_since(date)
+        )
+
+    def get_open_tasks(self) -> List[VelocityTrackableTask]:
+        # only finished tasks are velocity trackable
+        return []
+
+    def get_tasks_of_assignee(self, assignee: str) -> List[VelocityTrackableTask]:
+        return self._to_velocity_trackable_tasks(
+            self._task_getter.get_tasks_of_assignee(assignee)
+        )
+
+    def get_tasks_by_ids(
+        self, task_ids: List[str]
+    ) -> Dict[str, VelocityTrackableTask]:
+        return self._to_velocity_trackable_tasks_per_id(
+            self._task_getter.get_tasks_by_ids(task_ids)
+        )
+
+    def get_data_generation(self) -> Optional[int]:
+        return self._task_getter.get_data_generation()
+
+    @classmethod
+    def _to_velocity_trackable_tasks(
+        cls, tasks: List[Task]
+    ) -> List[VelocityTrackableTask]:
         return [
-            self._to_velocity_trackable_task(task, task.date_finished)
-            for task in self._flattened_tasks(self._task_getter.get_tasks())
+            cls._to_velocity_trackable_task(task, task.date_finished)
+            for task in tasks
             if task.date_finished is not None
         ]
 
-    def _flattened_tasks(self, tasks: List[Task]) -> List[Task]:
-        flattened_tasks: List[Task] = []
-        for task in tasks:
-            flattened_tasks = [
-                *flattened_tasks,
-                *self._flattened_tasks(task.sub_tasks),
-                task,
-            ]
-        return flattened_tasks
+    @classmethod
+    def _to_velocity_trackable_tasks_per_id(
+        cls, tasks: Dict[str, Task]
+    ) -> Dict[str, VelocityTrackableTask]:
+        return {
+            task_id: cls._to_velocity_trackable_task(task, task.date_finished)
+            for task_id, task in tasks.items()
+            if task.date_finished is not None
+        }
 
     @staticmethod
     def _to_velocity_trackable_task(
@@ -44,3 +124,4 @@ class VelocityTrackableTaskGetterProxy(TaskGetter[VelocityTrackableTask]):
             date_started=task.date_started,
             date_finished=date_finished,
         )
+
@@ -0,0 +1,10 @@
+from pathlib import Path
+
+from business_logic.sqlite_task_getter import SQLiteTaskGetter
+
+PATH_TO_DUMMY_DATA = Path(__file__).parent
+PATH_TO_TASK_DATABASE = PATH_TO_DUMMY_DATA / "tasks.sqlite"
+
+if __name__ == "__main__":
+    task_getter = SQLiteTaskGetter(str(PATH_TO_TASK_DATABASE))
+    task_getter.import_dummy_data_files(str(PATH_TO_DUMMY_DATA))
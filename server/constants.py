@@ -23,3 +23,5 @@ AUTHENTICATION_TOKEN_COOKIE_LIFE_TIME_IN_SECONDS = Time.hours(3)
 PATH_TO_STATIC_FILES = Path(__file__).parent.parent / envorinment.STATIC_FOLDER_NAME
 PATH_TO_HTML_FILES = PATH_TO_STATIC_FILES
 PATH_TO_ACCOUNTS_YML_FILE = Path(__file__).parent.parent / "accounts.yml"
+TASK_CACHE_LIFE_TIME_IN_SECONDS = Time.seconds(30)
+TASKS_CACHE_LIFE_TIME_IN_SECONDS = Time.seconds(45)
@@ -3,3 +3,32 @@ from pathlib import Path
 
 STATIC_FOLDER_NAME = os.environ["STATIC_FOLDER_NAME"]
 PATH_TO_TASK_DUMMY_DATA = Path(os.environ["PATH_TO_TASK_DUMMY_DATA"])
+MIN_SECONDS_BETWEEN_TASK_DUMMY_DATA_SCANS = float(
+    os.environ.get("MIN_SECONDS_BETWEEN_TASK_DUMMY_DATA_SCANS", "1")
+)
+NUMBER_OF_TASK_DUMMY_DATA_INGESTION_WORKERS = int(
+    os.environ.get("NUMBER_OF_TASK_DUMMY_DATA_INGESTION_WORKERS", "1")
+)
+PATH_TO_TASK_DUMMY_DATA_SNAPSHOT = os.environ.get("PATH_TO_TASK_DUMMY_DATA_SNAPSHOT")
+PATH_TO_TRUSTED_TASK_DUMMY_DATA_FINGERPRINTS = os.environ.get(
+    "PATH_TO_TRUSTED_TASK_DUMMY_DATA_FINGERPRINTS"
+)
+PATH_TO_TASK_DATABASE = os.environ.get("PATH_TO_TASK_DATABASE")
+NUMBER_OF_TASK_GETTER_THREADS = int(os.environ.get("NUMBER_OF_TASK_GETTER_THREADS", "4"))
+JIRA_URL = os.environ.get("JIRA_URL")
+JIRA_EMAIL = os.environ.get("JIRA_EMAIL", "")
+JIRA_API_TOKEN = os.environ.get("JIRA_API_TOKEN", "")
+JIRA_JQL = os.environ.get("JIRA_JQL", "")
+JIRA_STORY_POINTS_FIELD = os.environ.get("JIRA_STORY_POINTS_FIELD", "customfield_10016")
+NUMBER_OF_CONCURRENT_JIRA_REQUESTS = int(
+    os.environ.get("NUMBER_OF_CONCURRENT_JIRA_REQUESTS", "4")
+)
+TASK_DATA_URL = os.environ.get("TASK_DATA_URL")
+STALE_TASKS_GRACE_PERIOD_IN_SECONDS = float(
+    os.environ.get("STALE_TASKS_GRACE_PERIOD_IN_SECONDS", "30")
+)
+PATH_TO_SHARED_TASK_CACHE = os.environ.get("PATH_TO_SHARED_TASK_CACHE")
+MAX_NUMBER_OF_CACHED_TASKS = int(os.environ.get("MAX_NUMBER_OF_CACHED_TASKS", "100000"))
+MAX_SIZE_OF_CACHED_TASKS_IN_BYTES = int(
+    os.environ.get("MAX_SIZE_OF_CACHED_TASKS_IN_BYTES", str(64 * 1024 * 1024))
+)
@@ -1,7 +1,8 @@
 import dataclasses
 import statistics
+from concurrent.futures import ThreadPoolExecutor
 from http.client import HTTPException
-from typing import Optional, List, Callable, Awaitable
+from typing import Optional, List, Callable, Awaitable, Literal
 
 from fastapi import FastAPI
 from starlette.requests import Request
@@ -13,17 +14,33 @@ from business_logic.burn_down_forecast_decimator import BurnDownForecastDecimato
 from business_logic.burn_down_forecastable_task_getter_proxy import (
     BurnDownForecastableTaskGetterProxy,
 )
-from business_logic.caching_task_getter import CachingTaskGetter, TaskCache, CacheUtils, TasksCache
+from business_logic.caching_task_getter import Cache, CachingTaskGetter
 from server.chart_data_formatter import ChartDataFormatter
 from business_logic.developer_velocity_business_logic import (
     DeveloperVelocityBusinessLogic,
 )
 from business_logic.developer_velocity_decimator import DeveloperVelocityDecimator
 from business_logic.dummy_data_task_getter import DummyDataFileTaskGetter
+from business_logic.filtering_task_getter import FilteringTaskGetter
+from business_logic.http_task_getter import HTTPTaskGetter
+from business_logic.incremental_metrics import IncrementalMetrics
+from business_logic.interfaces.task_getter import TaskGetter
+from business_logic.jira_client import JiraClient
+from business_logic.jira_task_change_source import JiraTaskChangeSource
+from business_logic.jira_task_getter import JiraTaskGetter
 from business_logic.models.burn_down_forecast import BurnDownForecast
+from business_logic.models.burn_down_forecastable_task import BurnDownForecastableTask
 from business_logic.models.date import Date
 from business_logic.models.developer_velocity import DeveloperVelocity
+from business_logic.models.task import Task
+from business_logic.models.velocity_trackable_task import VelocityTrackableTask
 from business_logic.serializer.misc import Account
+from business_logic.sqlite_cache import SQLiteCache
+from business_logic.sqlite_task_getter import SQLiteTaskGetter
+from business_logic.task_projection import ProjectedTaskGetter, TaskProjector
+from business_logic.task_sync_engine import SyncingTaskGetter, TaskSyncEngine
+from business_logic.thread_pool_task_getter_adapter import ThreadPoolTaskGetterAdapter
+from business_logic.ttl_cache import LRUTTLCache, MonotonicTTLCache
 from business_logic.velocity_trackable_task_getter_proxy import (
     VelocityTrackableTaskGetterProxy,
 )
@@ -71,46 +88,156 @@ async def server_error_exception_handler(_: Request, exc: HTTPException) -> Resp
         )
 
 
-dummy_data_file_task_getter = DummyDataFileTaskGetter(
-    path_to_dummy_data=str(envorinment.PATH_TO_TASK_DUMMY_DATA)
+task_getter: TaskGetter[Task]
+if envorinment.PATH_TO_TASK_DATABASE is not None and envorinment.JIRA_URL is not None:
+    # the database is synced with the jira issues updated since the last sync
+    task_store = SQLiteTaskGetter(path_to_database=envorinment.PATH_TO_TASK_DATABASE)
+    task_getter = SyncingTaskGetter(
+        task_sync_engine=TaskSyncEngine(
+            source_name="jira",
+            task_change_source=JiraTaskChangeSource(
+                jira_client=JiraClient(
+                    url=envorinment.JIRA_URL,
+                    email=envorinment.JIRA_EMAIL,
+                    api_token=envorinment.JIRA_API_TOKEN,
+                    story_points_field=envorinment.JIRA_STORY_POINTS_FIELD,
+                    max_concurrent_requests=envorinment.NUMBER_OF_CONCURRENT_JIRA_REQUESTS,
+                ),
+                jql=envorinment.JIRA_JQL,
+            ),
+            task_store=task_store,
+        ),
+        task_store=task_store,
+        min_seconds_between_syncs=constants.TASK_CACHE_LIFE_TIME_IN_SECONDS,
+    )
+elif envorinment.PATH_TO_TASK_DATABASE is not None:
+    # the database is filled by "make task-database"
+    task_getter = SQLiteTaskGetter(
+        path_to_database=envorinment.PATH_TO_TASK_DATABASE
+    )
+elif envorinment.TASK_DATA_URL is not None:
+    task_getter = HTTPTaskGetter(
+        url=envorinment.TASK_DATA_URL,
+        min_seconds_between_revalidations=constants.TASK_CACHE_LIFE_TIME_IN_SECONDS,
+    )
+elif envorinment.JIRA_URL is not None:
+    task_getter = JiraTaskGetter(
+        url=envorinment.JIRA_URL,
+        email=envorinment.JIRA_EMAIL,
+        api_token=envorinment.JIRA_API_TOKEN,
+        jql=envorinment.JIRA_JQL,
+        story_points_field=envorinment.JIRA_STORY_POINTS_FIELD,
+        max_concurrent_requests=envorinment.NUMBER_OF_CONCURRENT_JIRA_REQUESTS,
+    )
+else:
+    task_getter = DummyDataFileTaskGetter(
+        path_to_dummy_data=str(envorinment.PATH_TO_TASK_DUMMY_DATA),
+        min_seconds_between_directory_scans=envorinment.MIN_SECONDS_BETWEEN_TASK_DUMMY_DATA_SCANS,
+        number_of_ingestion_workers=envorinment.NUMBER_OF_TASK_DUMMY_DATA_INGESTION_WORKERS,
+        path_to_snapshot=envorinment.PATH_TO_TASK_DUMMY_DATA_SNAPSHOT,
+        path_to_trusted_fingerprints=envorinment.PATH_TO_TRUSTED_TASK_DUMMY_DATA_FINGERPRINTS,
+    )
+task_cache: Cache[str, Task]
+tasks_cache: Cache[Literal["GET_TASKS"], List[Task]]
+query_cache: Cache[str, List[Task]]
+if envorinment.PATH_TO_SHARED_TASK_CACHE is not None:
+    # the uvicorn workers of the host share one cache, a task is only fetched by one of them
+    task_cache = SQLiteCache(
+        path_to_database=envorinment.PATH_TO_SHARED_TASK_CACHE,
+        namespace="tasks_by_id",
+        cache_life_time_in_seconds=constants.TASK_CACHE_LIFE_TIME_IN_SECONDS,
+    )
+    tasks_cache = SQLiteCache(
+        path_to_database=envorinment.PATH_TO_SHARED_TASK_CACHE,
+        namespace="tasks",
+        cache_life_time_in_seconds=constants.TASKS_CACHE_LIFE_TIME_IN_SECONDS,
+    )
+    query_cache = SQLiteCache(
+        path_to_database=envorinment.PATH_TO_SHARED_TASK_CACHE,
+        namespace="queries",
+        cache_life_time_in_seconds=constants.TASKS_CACHE_LIFE_TIME_IN_SECONDS,
+    )
+else:
+    task_cache = LRUTTLCache(
+        cache_life_time_in_seconds=constants.TASK_CACHE_LIFE_TIME_IN_SECONDS,
+        max_entries=envorinment.MAX_NUMBER_OF_CACHED_TASKS,
+        max_size_in_bytes=envorinment.MAX_SIZE_OF_CACHED_TASKS_IN_BYTES,
+    )
+    tasks_cache = MonotonicTTLCache(
+        cache_life_time_in_seconds=constants.TASKS_CACHE_LIFE_TIME_IN_SECONDS
+    )
+    query_cache = MonotonicTTLCache(
+        cache_life_time_in_seconds=constants.TASKS_CACHE_LIFE_TIME_IN_SECONDS
+    )
+caching_task_getter = CachingTaskGetter(
+    task_getter=task_getter,
+    task_cache=task_cache,
+    tasks_cache=tasks_cache,
+    query_cache=query_cache,
+    # expired tasks are served while they are fetched again, so no request waits for the refresh
+    stale_while_revalidate_in_seconds=envorinment.STALE_TASKS_GRACE_PERIOD_IN_SECONDS,
+    tasks_cache_life_time_in_seconds=constants.TASKS_CACHE_LIFE_TIME_IN_SECONDS,
+    # the task getters throttle their own checks for changes, e.g. the dummy data directory
+    # scan and the HTTP revalidation, so changes show up as soon as they notice them
+    min_seconds_between_data_generation_checks=0,
 )
-velocity_trackable_task_getter = VelocityTrackableTaskGetterProxy(
-    task_getter=dummy_data_file_task_getter
+# the task getters do file I/O and parsing, which must not block the event loop,
+# so all of them share one bounded thread pool
+task_getter_executor = ThreadPoolExecutor(
+    max_workers=envorinment.NUMBER_OF_TASK_GETTER_THREADS,
+    thread_name_prefix="task-getter",
 )
-caching_velocity_trackable_task_getter = CachingTaskGetter(
-    task_getter=velocity_trackable_task_getter,
-    task_cache=TaskCache(
-        cache_utils=CacheUtils(),
-        cache_life_time_in_seconds=30,
-    ),
-    tasks_cache=TasksCache(
-        cache_utils=CacheUtils(),
-        cache_life_time_in_seconds=45,
+velocity_trackable_task_getter: TaskGetter[VelocityTrackableTask]
+open_task_getter: TaskGetter[Task]
+burn_down_forecastable_task_getter: TaskGetter[BurnDownForecastableTask]
+incremental_metrics: Optional[IncrementalMetrics]
+if isinstance(task_getter, FilteringTaskGetter):
+    # the task getter loads every task for a query anyway, so both dashboards read their
+    # views from the same projection of the tasks, which asks the caching task getter
+    # for the data generation, not the source
+    task_projector = TaskProjector(task_getter=caching_task_getter)
+    velocity_trackable_task_getter = ProjectedTaskGetter(
+        task_projector,
+        lambda projection: projection.velocity_trackable_tasks,
     )
-)
+    open_task_getter = ProjectedTaskGetter(
+        task_projector,
+        lambda projection: projection.open_tasks,
+    )
+    burn_down_forecastable_task_getter = ProjectedTaskGetter(
+        task_projector,
+        lambda projection: projection.burn_down_forecastable_tasks,
+    )
+    # the velocity and the open tasks follow the changes between the projections,
+    # so they are of the same version of the tasks as the views
+    incremental_metrics = IncrementalMetrics(task_projector, executor=task_getter_executor)
+else:
+    # the task getter answers the queries from its indexes, e.g. the finished tasks of
+    # the tracked weeks, so they are pushed down instead of loading every task
+    velocity_trackable_task_getter = VelocityTrackableTaskGetterProxy(caching_task_getter)
+    open_task_getter = caching_task_getter
+    burn_down_forecastable_task_getter = BurnDownForecastableTaskGetterProxy(
+        caching_task_getter
+    )
+    incremental_metrics = None
 developer_velocity_business_logic = DeveloperVelocityBusinessLogic(
-    task_getter=caching_velocity_trackable_task_getter
-)
-
-burn_down_forecastable_task_getter = BurnDownForecastableTaskGetterProxy(
-    task_getter=dummy_data_file_task_getter
-)
-caching_burn_down_forecastable_task_getter = CachingTaskGetter(
-    task_getter=burn_down_forecastable_task_getter,
-    task_cache=TaskCache(
-        cache_utils=CacheUtils(),
-        cache_life_time_in_seconds=30,
+    task_getter=ThreadPoolTaskGetterAdapter(
+        task_getter=velocity_trackable_task_getter,
+        executor=task_getter_executor,
     ),
-    tasks_cache=TasksCache(
-        cache_utils=CacheUtils(),
-        cache_life_time_in_seconds=45,
-    )
+    incremental_metrics=incremental_metrics,
 )
-
 burn_down_business_logic = BurnDownBusinessLogic(
-    dummy_data_file_task_getter=dummy_data_file_task_getter,
+    open_task_getter=ThreadPoolTaskGetterAdapter(
+        task_getter=open_task_getter,
+        executor=task_getter_executor,
+    ),
     developer_velocity_business_logic=developer_velocity_business_logic,
-    burn_down_forecastable_task_getter=caching_burn_down_forecastable_task_getter,
+    burn_down_forecastable_task_getter=ThreadPoolTaskGetterAdapter(
+        task_getter=burn_down_forecastable_task_getter,
+        executor=task_getter_executor,
+    ),
+    incremental_metrics=incremental_metrics,
 )
 
 detail_page_chart_data_formatter = ChartDataFormatter(
@@ -169,25 +296,25 @@ async def get_dashboard_overview_page(request: Request) -> HTMLResponse:
     return HTMLResponse(
         content=make_dashboard_overview_page(
             user_name=account.name,
-            velocity_overview_chart_data_file_name=_get_velocity_overview_chart_data_file_name(
+            velocity_overview_chart_data_file_name=await _get_velocity_overview_chart_data_file_name(
                 account=account,
             ),
-            burn_down_overview_chart_data_file_name=_get_total_task_burn_down_data_file_name(
+            burn_down_overview_chart_data_file_name=await _get_total_task_burn_down_data_file_name(
                 account_id=account.id,
             ),
         )
     )
 
 
-def _get_velocity_overview_chart_data_file_name(account: Account) -> str:
+async def _get_velocity_overview_chart_data_file_name(account: Account) -> str:
     two_weeks_of_developer_velocity = (
-        developer_velocity_business_logic.get_developer_velocity(
+        await developer_velocity_business_logic.get_developer_velocity(
             account=account,
             time_in_weeks=2,
         )
     )
     two_weeks_of_average_developer_velocity = (
-        developer_velocity_business_logic.get_average_developer_velocity(
+        await developer_velocity_business_logic.get_average_developer_velocity(
             time_in_weeks=2,
         )
     )
@@ -212,35 +339,35 @@ def _get_velocity_overview_chart_data_file_name(account: Account) -> str:
 async def get_dashboard_velocity_page(request: Request) -> HTMLResponse:
     account = _unsafe_get_account_from_authentication_token_cookie(request)
     two_weeks_of_developer_velocity = (
-        developer_velocity_business_logic.get_developer_velocity(
+        await developer_velocity_business_logic.get_developer_velocity(
             account=account,
             time_in_weeks=2,
         )
     )
     two_weeks_of_average_developer_velocity = (
-        developer_velocity_business_logic.get_average_developer_velocity(
+        await developer_velocity_business_logic.get_average_developer_velocity(
             time_in_weeks=2,
         )
     )
     four_weeks_of_developer_velocity = (
-        developer_velocity_business_logic.get_developer_velocity(
+        await developer_velocity_business_logic.get_developer_velocity(
             account=account,
             time_in_weeks=4,
         )
     )
     four_weeks_of_average_developer_velocity = (
-        developer_velocity_business_logic.get_average_developer_velocity(
+        await developer_velocity_business_logic.get_average_developer_velocity(
             time_in_weeks=4,
         )
     )
     eight_weeks_of_developer_velocity = (
-        developer_velocity_business_logic.get_developer_velocity(
+        await developer_velocity_business_logic.get_developer_velocity(
             account=account,
             time_in_weeks=8,
         )
     )
     eight_weeks_of_average_developer_velocity = (
-        developer_velocity_business_logic.get_average_developer_velocity(
+        await developer_velocity_business_logic.get_average_developer_velocity(
             time_in_weeks=8,
         )
     )
@@ -300,25 +427,28 @@ def _get_file_name_for_developer_velocity(
 @private_app.get("/dashboard/burn-down")
 async def get_dashboard_burn_down_page(request: Request) -> HTMLResponse:
     account = _unsafe_get_account_from_authentication_token_cookie(request)
-    file_name = _get_total_task_burn_down_data_file_name(
+    file_name = await _get_total_task_burn_down_data_file_name(
         account_id=account.id,
     )
     burn_down_tasks: List[BurnDownPageTask] = []
     all_burn_down_forcastable_tasks = (
-        burn_down_business_logic.get_all_burn_down_forecastable_tasks()
+        await burn_down_business_logic.get_all_burn_down_forecastable_tasks()
     )
     median_developer_velocity_of_the_average_developer_for_the_last_eight_weeks: float = statistics.median(
-        developer_velocity_business_logic.get_average_developer_velocity(
-            time_in_weeks=8
+        (
+            await developer_velocity_business_logic.get_average_developer_velocity(
+                time_in_weeks=8
+            )
         ).values()
     )
+    burn_down_forecasts = await burn_down_business_logic.get_tasks_burn_down_data(
+        task_ids=[task.id for task in all_burn_down_forcastable_tasks],
+        developer_velocity_as_story_points_per_day=(
+            median_developer_velocity_of_the_average_developer_for_the_last_eight_weeks
+        ),
+    )
     for task in all_burn_down_forcastable_tasks:
-        burn_down_forecast = burn_down_business_logic.get_task_burn_down_data(
-            task_id=task.id,
-            developer_velocity_as_story_points_per_day=(
-                median_developer_velocity_of_the_average_developer_for_the_last_eight_weeks
-            ),
-        )
+        burn_down_forecast = burn_down_forecasts.get(task.id)
         if burn_down_forecast is None:
             raise TaskNotFound(task_id=task.id)
         chart_data_for_task = detail_page_chart_data_formatter.to_burn_down_chart_data(
@@ -356,8 +486,8 @@ async def get_dashboard_burn_down_page(request: Request) -> HTMLResponse:
     )
 
 
-def _get_total_task_burn_down_data_file_name(account_id: str) -> str:
-    burn_down_forcast = burn_down_business_logic.get_total_task_burn_down_data()
+async def _get_total_task_burn_down_data_file_name(account_id: str) -> str:
+    burn_down_forcast = await burn_down_business_logic.get_total_task_burn_down_data()
     chart_data = detail_page_chart_data_formatter.to_burn_down_chart_data(
         burn_down_forcast
     )